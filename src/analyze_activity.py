@@ -0,0 +1,117 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from helper.directory_manager import DirectoryManager
+from helper.argument_helper import add_path_arguments, add_filter_arguments, create_dataset_filter, get_system_dir, \
+    create_file_index
+
+
+# columns parsed from the run name: the activity summary can be joined
+# with the backend_end_to_end dataset on these columns.
+RUN_NAME_KEYS = ['RunName', 'Workload', 'System', 'Topology', 'CommScale', 'UnitsCount', 'Passes',
+                 'NPUsCount', 'PhysicalTopology']
+
+
+def analyze_file(file_path: str):
+    """
+    Load and analyze a single activity trace.
+
+    :param file_path: path to the activity trace
+    :return: dictionary with parsed run name and utilization metrics
+    """
+    from data.activity_reader import ActivityReader
+    from data.activity_analyzer import ActivityAnalyzer
+
+    config = ActivityReader.parse_run_name(os.path.basename(file_path).strip())
+    trace = ActivityReader.read_activity(file_path)
+    config.update(ActivityAnalyzer().analyze(trace))
+
+    return config
+
+
+def analyze_activity(csv_dir: str, system_dir: str, workers: int = None, dataset_filter=None, file_index=None):
+    """
+    Analyze every activity trace inside csv_dir, in parallel across files.
+
+    :param csv_dir: directory that contains activity csv files
+    :param system_dir: path to directory that contains system .txt files
+    :param workers: number of worker processes (None: number of cpus)
+    :param dataset_filter: if set (DatasetFilter), only analyze the traces that pass this filter
+    :param file_index: FileIndex of csv_dir to find traces with (default: a new, not persisted one)
+    :return: summary table (pd.DataFrame), one row per trace
+    """
+    import pandas as pd
+    from data.activity_reader import ActivityReader
+    from data.system_config_parser import SystemConfigParser
+
+    file_paths = ActivityReader(dir=csv_dir, file_index=file_index).find_activity_files(dataset_filter=dataset_filter)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summary = list(executor.map(analyze_file, file_paths, chunksize=16))
+
+    summary = pd.DataFrame(summary, columns=None if len(summary) > 0 else RUN_NAME_KEYS)
+
+    # get scheduling policy (once per system)
+    system_config_parser = SystemConfigParser(dir=system_dir)
+    summary['IntraScheduling'] = None
+    summary['InterScheduling'] = None
+    for system in summary['System'].unique():
+        system_config_parser.load_system(name=system)
+        summary.loc[summary['System'] == system, 'IntraScheduling'] = system_config_parser.get_intra_scheduling()
+        summary.loc[summary['System'] == system, 'InterScheduling'] = system_config_parser.get_inter_scheduling()
+
+    # sort rows by key, and place the key columns first
+    summary.sort_values(by=RUN_NAME_KEYS, inplace=True, kind='mergesort')
+    summary.reset_index(drop=True, inplace=True)
+    key_cols = RUN_NAME_KEYS + ['IntraScheduling', 'InterScheduling']
+    summary = summary[key_cols + [col for col in summary.columns if col not in key_cols]]
+
+    return summary
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """
+    Add analyze_activity.py arguments to parser.
+
+    :param parser: parser to add arguments to
+    """
+    add_path_arguments(parser)
+    add_filter_arguments(parser)
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of worker processes (default: number of cpus)')
+
+
+def analyze(args: argparse.Namespace):
+    """
+    Analyze every activity trace and save the summary table.
+
+    :param args: parsed arguments (check add_arguments)
+    """
+    # create directory
+    top_dir = args.output_dir
+    directory_manager = DirectoryManager(top_directory=top_dir)
+    directory_manager.create_top_directory(reset_if_exist=False)
+
+    # analyze and save summary
+    summary = analyze_activity(csv_dir=args.result_dir, system_dir=get_system_dir(args), workers=args.workers,
+                               dataset_filter=create_dataset_filter(args), file_index=create_file_index(args))
+    summary_path = os.path.join(top_dir, 'activity_summary.csv')
+    summary.to_csv(summary_path, index=False)
+    print(f"Analyzed {len(summary)} activity traces into {summary_path}.")
+
+
+def main():
+    # parse arguments
+    parser = argparse.ArgumentParser(description='Summarize per-dimension utilization of activity traces.')
+    add_arguments(parser)
+
+    analyze(args=parser.parse_args())
+
+
+if __name__ == '__main__':
+    main()
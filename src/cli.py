@@ -0,0 +1,212 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import time
+start_time = time.perf_counter()  # taken before any other import, to report startup time
+
+import os
+import argparse
+import draw
+import draw_activity_plot
+import analyze_activity
+import compare_activity
+import watch
+import merge_manifests
+import compare
+import export_kpis
+from data.dataset_type import DatasetType
+from helper.argument_helper import add_path_arguments, add_filter_arguments, get_system_dir, get_topology_dir, \
+    create_file_index
+
+
+def preflight(args: argparse.Namespace, file_index=None):
+    """
+    Check that every result file can be ingested (run names, referenced system and topology files),
+    without loading any measurement. Exit if a problem is found.
+
+    :param args: parsed arguments
+    :param file_index: FileIndex of the result directory (default: create one from args)
+    :return: IngestReport (empty)
+    """
+    from data.preflight import Preflight
+
+    report = Preflight(csv_dir=args.result_dir,
+                       system_dir=get_system_dir(args),
+                       topology_dir=get_topology_dir(args),
+                       file_index=file_index if file_index is not None else create_file_index(args)).run()
+    if args.report is not None:
+        report.write(path=args.report)
+
+    if not report.is_empty():
+        report.print_summary()
+        exit(-1)
+
+    print("Pre-flight check passed.")
+    return report
+
+
+def ingest(args: argparse.Namespace):
+    """
+    Load every dataset from the result csv files and refresh the dataset cache.
+    A pre-flight check runs first: if it finds problems, exit before loading anything,
+    or (args.quarantine) skip the bad files, and also skip every file that fails to load.
+
+    :param args: parsed arguments
+    """
+    import pandas as pd
+    from data.preflight import Preflight
+    from data.dataset_loader import DatasetLoader
+    from data.dataset_cache import DatasetCache
+
+    file_index = create_file_index(args)
+    report_path = args.report if args.report is not None else os.path.join(args.cache_dir, 'ingest_report.json')
+
+    # pre-flight check
+    report = Preflight(csv_dir=args.result_dir,
+                       system_dir=get_system_dir(args),
+                       topology_dir=get_topology_dir(args),
+                       file_index=file_index).run()
+    if not report.is_empty() and not args.quarantine:
+        report.print_summary()
+        report.write(path=report_path)
+        print(f"Pre-flight check failed (report: {report_path}). Fix the files, or add --quarantine to skip them.")
+        exit(-1)
+
+    # load datasets
+    dataset_loader = DatasetLoader(csv_dir=args.result_dir,
+                                   system_dir=get_system_dir(args),
+                                   topology_dir=get_topology_dir(args),
+                                   file_index=file_index,
+                                   exit_on_error=not args.quarantine)
+    dataset_cache = DatasetCache(dir=args.cache_dir)
+
+    bad_paths = report.bad_paths()
+    for dataset_type in DatasetType:
+        file_paths = [file_path for file_path in dataset_loader.csv_reader.find_files(dataset_type)
+                      if file_path not in bad_paths]
+
+        if not args.quarantine:
+            dataset = dataset_loader.load_dataset(dataset_type=dataset_type, file_paths=file_paths)
+        else:
+            # load file by file: quarantine the files that fail
+            datasets = list()
+            for file_path in file_paths:
+                try:
+                    datasets.append(dataset_loader.load_dataset(dataset_type=dataset_type, file_paths=[file_path]))
+                except Exception as error:
+                    report.add(path=file_path, stage='ingest', reason=f"{type(error).__name__}: {error}")
+            dataset = pd.concat(datasets, ignore_index=True) if len(datasets) > 0 else pd.DataFrame()
+
+        loaded_count = len(file_paths) - len(report.bad_paths().intersection(file_paths))
+        report.set_loaded(dataset_type_name=dataset_type.name, files_count=loaded_count, rows_count=len(dataset))
+        dataset_cache.save(dataset_type=dataset_type, dataset=dataset,
+                           manifest=DatasetCache.create_manifest(dataset_type=dataset_type,
+                                                                 dataset_loader=dataset_loader))
+        print(f"Cached {dataset_type.name} ({len(dataset)} rows) into {dataset_cache.path(dataset_type)}.")
+
+    report.write(path=report_path)
+    if not report.is_empty():
+        report.print_summary()
+        print(f"Quarantined {len(report.bad_paths())} files (report: {report_path}).")
+
+
+def list_combinations(args: argparse.Namespace):
+    """
+    List the available (Workload, RunName, Passes, CommScale, PhysicalTopology) combinations.
+
+    :param args: parsed arguments
+    """
+    dataset = draw.load_dataset(dataset_type=DatasetType.BackendEndToEnd, args=args)
+
+    combinations = dataset.groupby(['Workload', 'RunName', 'Passes', 'CommScale', 'PhysicalTopology'], sort=True) \
+        .size() \
+        .rename('Rows') \
+        .reset_index()
+    print(combinations.to_string(index=False))
+
+
+def main():
+    # parse arguments
+    parser = argparse.ArgumentParser(description='ASTRA-sim result plotter.')
+    parser.add_argument('--timing', action='store_true',
+                        help='report startup time (until the command starts running) and total time')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ingest_parser = subparsers.add_parser('ingest', help='load result csv files and refresh the dataset cache')
+    add_path_arguments(ingest_parser)
+    ingest_parser.add_argument('--cache-dir', type=str, default='../cache',
+                               help='directory to write the cached datasets into')
+    ingest_parser.add_argument('--quarantine', action='store_true',
+                               help='skip (quarantine) the files that fail the pre-flight check or fail to load, '
+                                    'instead of stopping')
+    ingest_parser.add_argument('--report', type=str, default=None,
+                               help='json report of the problems found and quarantined files '
+                                    '(default: {cache-dir}/ingest_report.json)')
+    ingest_parser.set_defaults(run=ingest)
+
+    preflight_parser = subparsers.add_parser('preflight', help='check that every result file can be ingested, '
+                                                               'without loading any measurement')
+    add_path_arguments(preflight_parser)
+    preflight_parser.add_argument('--report', type=str, default=None,
+                                  help='also write the problems found into this json report')
+    preflight_parser.set_defaults(run=preflight)
+
+    list_parser = subparsers.add_parser('list', help='list the available plot combinations')
+    add_path_arguments(list_parser)
+    add_filter_arguments(list_parser)
+    list_parser.add_argument('--cache-dir', type=str, default='../cache',
+                             help='use the datasets cached in this directory, if any')
+    list_parser.set_defaults(run=list_combinations)
+
+    render_parser = subparsers.add_parser('render', help='draw every plot (same as draw.py)')
+    draw.add_arguments(render_parser)
+    render_parser.set_defaults(run=draw.render)
+
+    activity_parser = subparsers.add_parser('activity', help='draw activity-time plots (same as draw_activity_plot.py)')
+    draw_activity_plot.add_arguments(activity_parser)
+    activity_parser.set_defaults(run=draw_activity_plot.draw_activity)
+
+    analyze_parser = subparsers.add_parser('analyze', help='summarize activity traces (same as analyze_activity.py)')
+    analyze_activity.add_arguments(analyze_parser)
+    analyze_parser.set_defaults(run=analyze_activity.analyze)
+
+    activity_compare_parser = subparsers.add_parser('activity-compare',
+                                                    help='overlay and compare activity traces on a common time grid '
+                                                         '(same as compare_activity.py)')
+    compare_activity.add_arguments(activity_compare_parser)
+    activity_compare_parser.set_defaults(run=compare_activity.compare_activity)
+
+    watch_parser = subparsers.add_parser('watch', help='draw every plot, then re-draw changed plots as sweeps finish')
+    watch.add_arguments(watch_parser)
+    watch_parser.set_defaults(run=watch.watch)
+
+    compare_parser = subparsers.add_parser('compare', help='compare a baseline and a candidate sweep '
+                                                           '(ranked regression table and delta plots)')
+    compare.add_arguments(compare_parser)
+    compare_parser.set_defaults(run=compare.compare)
+
+    export_parser = subparsers.add_parser('export', help='write KPI tables (csv, parquet) without drawing plots '
+                                                         '(same as export_kpis.py)')
+    export_kpis.add_arguments(export_parser)
+    export_parser.set_defaults(run=export_kpis.export_kpis)
+
+    merge_parser = subparsers.add_parser('merge-manifests', help='merge and check the manifests of sharded rendering')
+    merge_manifests.add_arguments(merge_parser)
+    merge_parser.set_defaults(run=merge_manifests.merge_manifests)
+
+    args = parser.parse_args()
+
+    # run command
+    command_start_time = time.perf_counter()
+    args.run(args)
+
+    if args.timing:
+        end_time = time.perf_counter()
+        print(f"[{args.command}] startup: {command_start_time - start_time:.3f} s, "
+              f"total: {end_time - start_time:.3f} s")
+
+
+if __name__ == '__main__':
+    main()
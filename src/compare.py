@@ -0,0 +1,159 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+import argparse
+from data.dataset_type import DatasetType
+from helper.argument_helper import add_filter_arguments, create_dataset_filter, get_system_dir, get_topology_dir
+
+
+# plot families that can draw deltas (candidate - baseline)
+DELTA_FAMILIES = ['CommsTime_CommScale', 'CommsTime_Topology', 'CommsTimeBW_CommScale', 'CommsTimeBwDim_CommScale']
+
+# join keys (parsed run name columns)
+RUN_NAME_KEYS = ['RunName', 'Workload', 'System', 'Topology', 'CommScale', 'UnitsCount', 'Passes']
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """
+    Add compare.py arguments to parser.
+
+    :param parser: parser to add arguments to
+    """
+    parser.add_argument('--baseline-dir', type=str, required=True,
+                        help='result directory of the baseline sweep')
+    parser.add_argument('--candidate-dir', type=str, required=True,
+                        help='result directory of the candidate sweep')
+    parser.add_argument('--inputs-dir', type=str, default='../inputs',
+                        help='ASTRA-sim inputs directory of the baseline sweep (default: ../inputs)')
+    parser.add_argument('--candidate-inputs-dir', type=str, default=None,
+                        help='ASTRA-sim inputs directory of the candidate sweep (default: same as --inputs-dir)')
+    parser.add_argument('--output-dir', type=str, default='../compare',
+                        help='directory to write the regression table and delta plots into (default: ../compare)')
+    add_filter_arguments(parser)
+    parser.add_argument('--join-on', type=str, nargs='+', default=RUN_NAME_KEYS, choices=RUN_NAME_KEYS,
+                        help='run name columns to join the sweeps on (default: all). '
+                             'drop a column to compare sweeps that renamed it (e.g., a new system file): '
+                             "its values then read 'baseline -> candidate' where they differ")
+    parser.add_argument('--rank-by', type=str, default='CommsTime',
+                        help='metric to rank regressions by: CommsTime, CommsTime_BW or CommsTime_BW_Dim{d} '
+                             '(default: CommsTime)')
+    parser.add_argument('--top', type=int, default=20,
+                        help='number of worst regressions to print (default: 20)')
+    parser.add_argument('--family', type=str, nargs='+', default=DELTA_FAMILIES, choices=DELTA_FAMILIES,
+                        help='plot families to draw deltas with')
+    parser.add_argument('--no-plots', action='store_true',
+                        help='only write the regression table')
+
+
+def compare(args: argparse.Namespace):
+    """
+    Compare two sweeps: write the ranked regression table, and draw delta plots.
+
+    :param args: parsed arguments (check add_arguments)
+    """
+    from data.dataset_loader import DatasetLoader
+    from data.sweep_comparator import SweepComparator
+
+    # load both sweeps
+    dataset_filter = create_dataset_filter(args)
+    candidate_args = argparse.Namespace(inputs_dir=args.candidate_inputs_dir or args.inputs_dir)
+    datasets = dict()
+    for sweep, result_dir, inputs_args in (('baseline', args.baseline_dir, args),
+                                           ('candidate', args.candidate_dir, candidate_args)):
+        dataset_loader = DatasetLoader(csv_dir=result_dir,
+                                       system_dir=get_system_dir(inputs_args),
+                                       topology_dir=get_topology_dir(inputs_args),
+                                       dataset_filter=dataset_filter)
+        datasets[sweep] = dataset_loader.load_dataset(dataset_type=DatasetType.BackendEndToEnd)
+        print(f"Loaded {len(datasets[sweep])} {sweep} rows from {result_dir}.")
+
+    # metrics of both sweeps
+    metrics = [col for col in SweepComparator.metric_cols(datasets['baseline'])
+               if col in datasets['candidate'].columns]
+    if args.rank_by not in metrics:
+        print(f"Can't rank by {args.rank_by}: not a metric of both sweeps (metrics: {', '.join(metrics)}).")
+        exit(-1)
+
+    # join and rank
+    sweep_comparator = SweepComparator(keys=args.join_on)
+    comparison = sweep_comparator.compare(baseline=datasets['baseline'], candidate=datasets['candidate'])
+    ranked = sweep_comparator.rank(comparison=comparison, metric=args.rank_by)
+
+    if not os.path.exists(args.output_dir):
+        os.makedirs(name=args.output_dir)
+    regressions_path = os.path.join(args.output_dir, 'regressions.csv')
+    ranked.to_csv(regressions_path, index=False)
+    print(f"Compared {len(ranked)} runs into {regressions_path}.")
+
+    unmatched = sweep_comparator.unmatched(baseline=datasets['baseline'], candidate=datasets['candidate'],
+                                           keys=args.join_on)
+    if len(unmatched) > 0:
+        unmatched_path = os.path.join(args.output_dir, 'unmatched.csv')
+        unmatched.to_csv(unmatched_path, index=False)
+        print(f"{len(unmatched)} runs found in only one sweep: {unmatched_path}.")
+
+    # worst regressions
+    rank_cols = ['Rank'] + args.join_on + [f'{args.rank_by}_Baseline', f'{args.rank_by}_Candidate',
+                                           f'{args.rank_by}_Ratio']
+    print(ranked[rank_cols].head(args.top).to_string(index=False))
+
+    if not args.no_plots:
+        draw_deltas(args=args, delta=sweep_comparator.delta_dataset(comparison=comparison, keys=args.join_on))
+
+
+def draw_deltas(args: argparse.Namespace, delta):
+    """
+    Draw the delta dataset with the existing plot families.
+
+    :param args: parsed arguments (check add_arguments)
+    :param delta: delta dataset (check SweepComparator.delta_dataset)
+    """
+    # plotting libraries are heavy: import them only when drawing
+    import draw
+    from plot.plot_controller import PlotController
+    from plot.plotter import Plotter
+    from sink.sink_factory import create_output_sink
+
+    # columns every plot title needs
+    required_cols = {'RunName', 'Passes', 'Workload', 'CommScale', 'Topology', 'PhysicalTopology',
+                     'IntraScheduling', 'InterScheduling'}
+    missing_cols = required_cols.difference(delta.columns)
+    if len(missing_cols) > 0 or len(delta) == 0:
+        print(f"Delta plots skipped (missing columns: {sorted(missing_cols)}, rows: {len(delta)}).")
+        return
+
+    PlotController.set_pre_aesthetics()
+    PlotController.set_title_prefix(title_prefix='Delta (candidate - baseline)')
+    sink = create_output_sink(top_directory=args.output_dir)
+    PlotController.set_output_sink(sink=sink)
+
+    sink.create_top_directory(reset_if_exist=False)
+    for workload in sorted(delta['Workload'].unique()):
+        for family in args.family:
+            sink.create_subdirectory(path=f'{family}/{workload}', reset_if_exist=True)
+            sink.create_subdirectory(path=f'{family}/{workload}/breakdown', reset_if_exist=True)
+
+    # deltas can be negative: always fit the y axis to the values
+    plotter = Plotter(dataset=delta)
+    for family, dataset_type, plot_args in draw.create_plot_jobs():
+        if family not in args.family or dataset_type != DatasetType.BackendEndToEnd:
+            continue
+
+        plotter.plot(path=os.path.join(args.output_dir, family), **dict(plot_args, tight_axis=True))
+
+    sink.close()
+
+
+def main():
+    # parse arguments
+    parser = argparse.ArgumentParser(description='Compare a baseline and a candidate ASTRA-sim sweep.')
+    add_arguments(parser)
+
+    compare(args=parser.parse_args())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import io
+import os
+import argparse
+from helper.argument_helper import add_path_arguments, add_filter_arguments, create_dataset_filter, \
+    create_file_index
+
+
+# run name columns traces can be compared over, and the run name columns that change with them
+# (e.g., PhysicalTopology, UnitsCount and NPUsCount change with the Topology)
+COMPARE_OVER_KEYS = {'System': ['System'],
+                     'Topology': ['Topology', 'PhysicalTopology', 'UnitsCount', 'NPUsCount'],
+                     'RunName': ['RunName']}
+
+# parts of the filenames of a group: (run name column, format)
+# (Topology, UnitsCount and NPUsCount are part of PhysicalTopology)
+FILENAME_PARTS = [('Workload', '{}'), ('RunName', '{}'), ('System', '{}'), ('PhysicalTopology', '{}'),
+                  ('CommScale', '{}mb'), ('Passes', '{}pass')]
+
+# number of traces read at once (archives are read once per batch)
+READ_BATCH = 64
+
+
+def read_trace(source):
+    """
+    Parse a single activity trace as arrays.
+
+    :param source: what pd.read_csv reads (check ResultSource.open)
+    :return: (sorted sample times, activity of every sample (samples x dims), dimension indices)
+    """
+    from data.activity_reader import ActivityReader
+    from data.activity_aligner import ActivityAligner
+
+    return ActivityAligner.trace_arrays(ActivityReader.parse_activity(source))
+
+
+def group_traces(file_paths, compare_over: str):
+    """
+    Group the traces that only differ by the compare_over column (and the columns that change with it).
+
+    :param file_paths: paths of the activity traces
+    :param compare_over: run name column to compare over (check COMPARE_OVER_KEYS)
+    :return: [(group config, [(compared value, file path)] sorted by value)], groups sorted by key
+    """
+    from data.activity_reader import ActivityReader
+    from analyze_activity import RUN_NAME_KEYS
+
+    group_keys = [key for key in RUN_NAME_KEYS if key not in COMPARE_OVER_KEYS[compare_over]]
+    label_key = 'PhysicalTopology' if compare_over == 'Topology' else compare_over  # (units count included)
+
+    groups = dict()
+    for file_path in file_paths:
+        config = ActivityReader.parse_run_name(os.path.basename(file_path).strip())
+        key = tuple(str(config[group_key]) for group_key in group_keys)
+        groups.setdefault(key, (config, list()))[1].append((str(config[label_key]), file_path))
+
+    return [(config, sorted(traces)) for _, (config, traces) in sorted(groups.items())]
+
+
+def batch_groups(groups, batch_size: int = READ_BATCH):
+    """
+    :param groups: groups of traces (check group_traces)
+    :param batch_size: number of traces per batch (a larger group is a batch on its own)
+    :return: consecutive batches of groups, of about batch_size traces each
+    """
+    batch, batch_traces = list(), 0
+    for group in groups:
+        if len(batch) > 0 and batch_traces + len(group[1]) > batch_size:
+            yield batch
+            batch, batch_traces = list(), 0
+        batch.append(group)
+        batch_traces += len(group[1])
+
+    if len(batch) > 0:
+        yield batch
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """
+    Add compare_activity.py arguments to parser.
+
+    :param parser: parser to add arguments to
+    """
+    add_path_arguments(parser)
+    add_filter_arguments(parser)
+    parser.add_argument('--compare-over', type=str, default='System', choices=list(COMPARE_OVER_KEYS),
+                        help='overlay the traces that only differ by this run name column (default: System)')
+    parser.add_argument('--baseline', type=str, default=None,
+                        help='value of the compared column to draw differences against, '
+                             'e.g., "sw_ring (4_4)" (PhysicalTopology) for Topology '
+                             '(default: first value of every group, in sorted order)')
+    parser.add_argument('--grid-size', type=int, default=512,
+                        help='number of buckets of the common time grid (default: 512)')
+    parser.add_argument('--method', type=str, default='mean', choices=['mean', 'interp'],
+                        help="resampling method: 'mean' (time-weighted mean of every bucket) "
+                             "or 'interp' (linear interpolation at bucket centers)")
+    parser.add_argument('--workers', type=int, default=8,
+                        help='number of threads reading traces (default: 8)')
+    parser.add_argument('--archive', type=str, default=None,
+                        help='write every plot and matrix into this archive (.zip or .tar[.gz|.bz2|.xz]) '
+                             'instead of the output directory tree')
+
+
+def compare_activity(args: argparse.Namespace):
+    """
+    Align the activity traces of runs that only differ by one run name column onto a common time grid,
+    and draw overlay and difference plots of every group, with its aligned matrices (.npz).
+
+    :param args: parsed arguments (check add_arguments)
+    """
+    # plotting libraries are heavy: import them only when drawing
+    import numpy as np
+    from plot.figure_style import FigureStyle
+    from sink.sink_factory import create_output_sink
+    from data.activity_reader import ActivityReader
+    from data.activity_aligner import ActivityAligner
+    from data.result_source import ResultSource
+
+    compare_over = args.compare_over
+    aligner = ActivityAligner(grid_size=args.grid_size, method=args.method)
+
+    # create directory
+    # (when comparing a filtered subset, keep the other comparisons already in the directory)
+    dataset_filter = create_dataset_filter(args)
+    top_dir = args.output_dir
+    sink = create_output_sink(top_directory=top_dir, archive_path=args.archive)
+    sink.create_top_directory(reset_if_exist=False)
+    sink.create_subdirectory(path='activity_compare', reset_if_exist=dataset_filter.is_empty())
+
+    # group traces (groups of a single trace have nothing to compare)
+    file_paths = ActivityReader(dir=args.result_dir,
+                                file_index=create_file_index(args)).find_activity_files(dataset_filter=dataset_filter)
+    groups = [group for group in group_traces(file_paths, compare_over=compare_over) if len(group[1]) > 1]
+    if len(groups) == 0:
+        print(f"No activity traces to compare over {compare_over}.")
+        sink.close()
+        return
+
+    # traces are read in parallel, a batch of groups at a time (archives are read once per batch)
+    FigureStyle.install()
+    result_source = ResultSource(workers=args.workers)
+    excluded_keys = COMPARE_OVER_KEYS[compare_over]
+    for batch in batch_groups(groups):
+        batch_paths = [file_path for _, traces in batch for _, file_path in traces]
+        arrays = iter(result_source.read_files(paths=batch_paths, read=read_trace))
+
+        for config, traces in batch:
+            labels = [value for value, _ in traces]
+            group_arrays = [next(arrays) for _ in traces]
+
+            # baseline of the differences
+            if args.baseline is not None and args.baseline not in labels:
+                print(f"Skipping a group without baseline {args.baseline} ({', '.join(labels)}).")
+                continue
+            baseline = labels.index(args.baseline) if args.baseline is not None else 0
+
+            # align
+            time, matrices = aligner.align(traces=group_arrays)
+            dims = list(matrices)
+
+            # filename and title: every run name column but the compared ones
+            name_parts = [name_format.format(config[key]).replace(' ', '_')
+                          for key, name_format in FILENAME_PARTS if key not in excluded_keys]
+            graph_filename = f"{'_'.join(name_parts)}_by_{compare_over}"
+            print(f"Comparing {graph_filename} ({len(traces)} traces)")
+
+            title = f"{config['Workload']}" \
+                    + (f" ({config['RunName']})" if 'RunName' not in excluded_keys else '') \
+                    + (f"\nSystem: {config['System']}" if 'System' not in excluded_keys else '') \
+                    + (f"\nTopology: {config['PhysicalTopology']}" if 'Topology' not in excluded_keys else '') \
+                    + f"\nCommScale: {config['CommScale']} MB" \
+                      f"\nPass: {config['Passes']}" \
+                      f"\n{compare_over} (baseline: {labels[baseline]})"
+
+            # overlay and difference plots: one subplot per dimension
+            for kind in ['overlay', 'difference']:
+                fig, axes = FigureStyle.create_figure(nrows=1, ncols=len(dims))
+                axes = np.atleast_1d(axes)
+
+                for ax, dim in zip(axes, dims):
+                    matrix = matrices[dim]
+                    for row, label in enumerate(labels):
+                        if kind == 'overlay':
+                            ax.plot(time, matrix[row], label=label)
+                        elif row != baseline:
+                            ax.plot(time, matrix[row] - matrix[baseline], label=f"{label} - {labels[baseline]}")
+
+                    if kind == 'overlay':
+                        ax.set_ylim((-5, 105))
+                        ax.set_ylabel('Activity (%)')
+                    else:
+                        ax.axhline(y=0, color='black', linewidth=1)
+                        ax.set_ylim((-105, 105))
+                        ax.set_ylabel('Activity difference (%)')
+                    ax.set_xlabel('Time (us)')
+                    ax.set_title(f"dim{dim}")
+                    ax.legend()
+
+                # aesthetics post-update
+                fig.set_size_inches((7 * len(dims), 8))
+                fig.suptitle(title)
+                fig.tight_layout()
+                sink.save_figure(fig=fig,
+                                 path=os.path.join(top_dir, 'activity_compare', f"{graph_filename}_{kind}.pdf"))
+
+            # aligned matrices: one (traces x buckets) matrix per dimension
+            buffer = io.BytesIO()
+            np.savez_compressed(buffer, time=time, labels=np.array(labels),
+                                **{f"dim{dim}": matrix for dim, matrix in matrices.items()})
+            sink.write_bytes(path=os.path.join(top_dir, 'activity_compare', f"{graph_filename}.npz"),
+                             data=buffer.getvalue())
+
+    # finish pending writes
+    sink.close()
+
+
+def main():
+    # parse arguments
+    parser = argparse.ArgumentParser(description='Overlay and compare activity traces on a common time grid.')
+    add_arguments(parser)
+
+    compare_activity(args=parser.parse_args())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from data.activity_analyzer import ActivityAnalyzer
+
+
+class ActivityAligner:
+    # resampling methods (check resample)
+    methods = ['mean', 'interp']
+
+    def __init__(self, grid_size: int = 512, method: str = 'mean'):
+        """
+        Instantiate a new ActivityAligner instance.
+        ActivityAligner resamples activity traces, each with its own irregular time axis,
+        onto a common time grid of grid_size buckets from 0 to the end of the longest trace,
+        so that traces can be overlaid, subtracted, and stacked into (traces x buckets) matrices.
+
+        :param grid_size: number of buckets of the common time grid
+        :param method: 'mean': time-weighted mean activity of each bucket (sample i holds its value until sample i + 1),
+                       'interp': activity linearly interpolated at the center of each bucket (np.interp)
+        """
+        assert method in self.methods, f"Resampling method {method} not supported."
+
+        self.grid_size = grid_size
+        self.method = method
+
+    @staticmethod
+    def trace_arrays(trace: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, List[int]]:
+        """
+        :param trace: trace loaded by ActivityReader.read_activity
+        :return: (sorted sample times, activity of every sample (samples x dims), dimension indices)
+        """
+        dims = ActivityAnalyzer.dims_of(trace)
+        trace = trace.sort_values(by='time', kind='mergesort')
+
+        return trace['time'].to_numpy(dtype=float), trace[[f'dim{dim}' for dim in dims]].to_numpy(dtype=float), dims
+
+    def create_grid(self, end_time: float) -> np.ndarray:
+        """
+        :param end_time: end of the grid (e.g., end of the longest trace)
+        :return: bucket edges of the grid (grid_size + 1 values)
+        """
+        return np.linspace(0, end_time if end_time > 0 else 1, self.grid_size + 1)
+
+    def resample(self, time: np.ndarray, activity: np.ndarray, edges: np.ndarray) -> np.ndarray:
+        """
+        Resample a trace onto a grid. The trace is idle (0) after its last sample.
+
+        :param time: sorted sample times
+        :param activity: activity of every sample (samples x dims)
+        :param edges: bucket edges of the grid (check create_grid)
+        :return: activity of every bucket (buckets x dims)
+        """
+        resampled = np.zeros((len(edges) - 1, activity.shape[1]))
+        if len(time) == 0:
+            return resampled
+
+        if self.method == 'interp':
+            centers = (edges[:-1] + edges[1:]) / 2
+            inside = centers <= time[-1]
+            for i in range(activity.shape[1]):
+                resampled[inside, i] = np.interp(centers[inside], time, activity[:, i])
+            return resampled
+
+        # the integral of a step function is piecewise linear between samples: interpolating the cumulative
+        # area at the bucket edges is exact (and constant after the last sample, i.e., idle)
+        duration = np.diff(time)
+        for i in range(activity.shape[1]):
+            area = np.concatenate(([0.0], np.cumsum(activity[:-1, i] * duration)))
+            resampled[:, i] = np.diff(np.interp(edges, time, area)) / np.diff(edges)
+
+        return resampled
+
+    def align(self, traces: List[Tuple[np.ndarray, np.ndarray, List[int]]],
+              end_time: Optional[float] = None) -> Tuple[np.ndarray, Dict[int, np.ndarray]]:
+        """
+        Resample traces onto a common grid.
+
+        :param traces: (time, activity, dims) of every trace (check trace_arrays)
+        :param end_time: end of the grid (default: end of the longest trace)
+        :return: (bucket centers, dim -> aligned matrix (traces x buckets), NaN rows for traces without the dim)
+        """
+        if end_time is None:
+            end_time = max([time[-1] for time, _, _ in traces if len(time) > 0], default=0)
+        edges = self.create_grid(end_time)
+
+        all_dims = sorted(set(dim for _, _, dims in traces for dim in dims))
+        matrices = {dim: np.full((len(traces), self.grid_size), np.nan) for dim in all_dims}
+        for row, (time, activity, dims) in enumerate(traces):
+            resampled = self.resample(time=time, activity=activity, edges=edges)
+            for i, dim in enumerate(dims):
+                matrices[dim][row] = resampled[:, i]
+
+        return (edges[:-1] + edges[1:]) / 2, matrices
@@ -0,0 +1,138 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+from typing import List, Tuple
+import numpy as np
+import pandas as pd
+
+
+class ActivityAnalyzer:
+    """
+    Compute per-dimension utilization metrics of a single activity trace.
+    Every metric is time-weighted: sample i holds its activity value until sample i + 1.
+    """
+
+    def __init__(self, saturation_threshold: float = 100, idle_quantiles: Tuple[float, ...] = (0.5, 0.95)):
+        """
+        Instantiate a new ActivityAnalyzer instance.
+
+        :param saturation_threshold: activity (%) at or above which a dimension is saturated
+        :param idle_quantiles: quantiles of the idle interval distribution to report
+        """
+        self.saturation_threshold = saturation_threshold
+        self.idle_quantiles = idle_quantiles
+
+    @staticmethod
+    def dims_of(trace: pd.DataFrame) -> List[int]:
+        """
+        :param trace: trace loaded by ActivityReader.read_activity
+        :return: dimension indices reported in the trace
+        """
+        return [int(col[len('dim'):]) for col in trace.columns if col.startswith('dim')]
+
+    def analyze(self, trace: pd.DataFrame):
+        """
+        Compute utilization metrics of a trace.
+
+        :param trace: trace loaded by ActivityReader.read_activity
+        :return: dictionary of metrics, per-dimension metrics are suffixed with _Dim{d}
+                 (every metric is NaN if the trace has no samples, e.g., a header-only trace left by a killed run)
+        """
+        dims = self.dims_of(trace)
+        trace = trace.sort_values(by='time', kind='mergesort')
+        time = trace['time'].to_numpy(dtype=float)
+        activity = trace[[f'dim{dim}' for dim in dims]].to_numpy(dtype=float)  # (samples, dims)
+
+        # no samples: compute over a single idle sample (same metric names), then blank every metric
+        empty = len(time) == 0
+        if empty:
+            time = np.zeros(1)
+            activity = np.zeros((1, len(dims)))
+
+        # duration of each sample (the last sample closes the trace)
+        duration = np.diff(time, append=time[-1])
+        total_time = time[-1] - time[0]
+        if total_time <= 0:
+            total_time = np.nan
+
+        busy = activity > 0
+        metrics = dict()
+        metrics['TraceTime'] = time[-1] - time[0]
+
+        # busy fraction and mean activity
+        busy_fraction = (busy * duration[:, None]).sum(axis=0) / total_time
+        mean_activity = (activity * duration[:, None]).sum(axis=0) / total_time
+
+        # time to first saturation
+        saturated = activity >= self.saturation_threshold
+        first_saturation = np.where(saturated.any(axis=0), time[saturated.argmax(axis=0)] - time[0], np.nan)
+
+        # idle intervals
+        idle_stats = self.idle_interval_stats(time=time, busy=busy)
+
+        # overlap between dimensions
+        busy_time = busy.T.astype(float) @ (busy * duration[:, None])  # (dims, dims) co-busy time
+        concurrency = busy.sum(axis=1)
+        metrics['OverlapFraction'] = duration[concurrency >= 2].sum() / total_time
+        metrics['MeanConcurrentDims'] = (concurrency * duration).sum() / total_time
+
+        for i, dim in enumerate(dims):
+            metrics[f'BusyFraction_Dim{dim}'] = busy_fraction[i]
+            metrics[f'MeanActivity_Dim{dim}'] = mean_activity[i]
+            metrics[f'FirstSaturationTime_Dim{dim}'] = first_saturation[i]
+            for name, values in idle_stats.items():
+                metrics[f'{name}_Dim{dim}'] = values[i]
+            for j in range(i + 1, len(dims)):
+                metrics[f'Overlap_Dim{dim}_Dim{dims[j]}'] = busy_time[i, j] / total_time
+
+        if empty:
+            metrics = dict.fromkeys(metrics, np.nan)
+
+        return metrics
+
+    def idle_interval_stats(self, time: np.ndarray, busy: np.ndarray):
+        """
+        Compute the idle interval distribution of every dimension at once.
+
+        :param time: sample times, shape (samples,)
+        :param busy: busy flags, shape (samples, dims)
+        :return: dictionary of metric name -> ndarray of shape (dims,)
+        """
+        dims_count = busy.shape[1]
+
+        # find idle runs: +1 where idle starts, -1 where idle ends (scan each dim in order)
+        idle = np.pad(~busy, pad_width=((1, 1), (0, 0))).T.astype(np.int8)  # (dims, samples + 2)
+        edges = np.diff(idle, axis=1)
+        start_dim, start_index = np.nonzero(edges == 1)
+        _, end_index = np.nonzero(edges == -1)
+
+        # idle interval lasts from the first idle sample until the next busy sample (or the trace end)
+        end_time = np.append(time, time[-1])
+        interval = end_time[end_index] - time[start_index]
+        valid = interval > 0
+        interval, interval_dim = interval[valid], start_dim[valid]
+
+        count = np.bincount(interval_dim, minlength=dims_count)
+        total = np.bincount(interval_dim, weights=interval, minlength=dims_count)
+        maximum = np.zeros(dims_count)
+        np.maximum.at(maximum, interval_dim, interval)
+
+        stats = dict()
+        stats['IdleIntervalCount'] = count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            stats['IdleIntervalMean'] = total / count
+        stats['IdleIntervalMax'] = np.where(count > 0, maximum, np.nan)
+
+        # quantiles: sort by (dim, interval) and pick the nearest rank inside each dim's block
+        order = np.lexsort((interval, interval_dim))
+        sorted_interval = interval[order]
+        offset = np.concatenate(([0], np.cumsum(count)[:-1]))
+        for quantile in self.idle_quantiles:
+            rank = offset + np.floor(quantile * np.maximum(count - 1, 0)).astype(int)
+            value = sorted_interval[np.minimum(rank, max(len(sorted_interval) - 1, 0))] \
+                if len(sorted_interval) > 0 else np.zeros(dims_count)
+            stats[f'IdleIntervalP{int(round(quantile * 100))}'] = np.where(count > 0, value, np.nan)
+
+        return stats
@@ -0,0 +1,121 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+from data.dataset_filter import DatasetFilter
+from data.file_index import FileIndex
+from data.result_source import ResultSource
+
+
+class ActivityReader:
+    def __init__(self, dir: str = '../../result/', file_index: Optional[FileIndex] = None):
+        """
+        Instantiate a new ActivityReader instance.
+        ActivityReader is used for finding and loading per-dimension activity traces (run-*.csv).
+
+        :param dir: directory that contains activity csv files.
+        :param file_index: FileIndex of dir to find traces with (default: a new, not persisted one)
+        """
+        self.dir = dir
+        self.file_index = file_index if file_index is not None else FileIndex(dir=dir)
+
+    @staticmethod
+    def is_activity_file(filename: str) -> bool:
+        """
+        :param filename: filename to check
+        :return: True if the file is an activity trace
+        """
+        return filename.endswith('.csv') and filename.startswith('run-')
+
+    @staticmethod
+    def parse_run_name(run_name: str):
+        """
+        Parse the run name of a single activity trace.
+
+        :param run_name: activity trace filename
+        :return: dictionary with parsed results
+        """
+        # runname example: run-equal-workload-microAllReduce.txt-system-ring_ring.txt-network-ring64_ring64.json-commscale-2-unitscount-4 4-passes-10
+        #   c.f., Run_name index breakdown
+        #       1: main run name (e.g., row14)
+        #       3: workload (e.g., microAllReduce.txt)
+        #       5: system (e.g., ring_direct_switch.txt)
+        #       7: topology (e.g., tRing_nDirect_ppSwitch.json)
+        #       9: comm scale (e.g., 2)
+        #       11: units count (2.g., 4 4) <- split by whitespace
+        #       13: passes count (e.g., 10)
+
+        # populate parse_dict
+        parse_dict = dict()
+
+        # split run name
+        run_name_split = run_name.split('-')
+
+        # create rows as required
+        parse_dict['RunName'] = run_name_split[1]
+        parse_dict['Workload'] = run_name_split[3].split('.')[0]
+        parse_dict['System'] = run_name_split[5].split('.')[0]
+        parse_dict['Topology'] = run_name_split[7].split('.')[0]
+        parse_dict['CommScale'] = int(run_name_split[9])
+        parse_dict['UnitsCount'] = run_name_split[11].replace(" ", "_")
+        parse_dict['Passes'] = int(run_name_split[13].split("_")[0])
+
+        # add new columns (same form as CsvReader.parse_run_name, so the two can be joined)
+        parse_dict['NPUsCount'] = int(np.prod(list(map(int, parse_dict['UnitsCount'].split('_')))))
+        parse_dict['PhysicalTopology'] = parse_dict['Topology'] + " (" + parse_dict['UnitsCount'] + ')'
+
+        return parse_dict
+
+    def find_activity_files(self, dataset_filter: Optional[DatasetFilter] = None) -> List[str]:
+        """
+        :param dataset_filter: if set, only return the traces whose run name passes this filter
+        :return: paths of all the activity traces inside self.dir
+        """
+        file_paths = self.file_index.find_files(match=self.is_activity_file)
+
+        if dataset_filter is not None:
+            file_paths = [file_path for file_path in file_paths
+                          if dataset_filter.matches(self.parse_run_name(os.path.basename(file_path).strip()))]
+
+        return file_paths
+
+    @staticmethod
+    def read_activity(file_path: str) -> pd.DataFrame:
+        """
+        Load a single activity trace.
+
+        :param file_path: path to the activity trace (or archive member, check ResultSource)
+        :return: pd.DataFrame with 'time' column and one 'dim{d}' column per dimension
+        """
+        return ActivityReader.parse_activity(ResultSource.open(file_path))
+
+    @staticmethod
+    def parse_activity(source) -> pd.DataFrame:
+        """
+        Parse a single activity trace.
+
+        :param source: opened activity trace (check ResultSource.open)
+        :return: pd.DataFrame with 'time' column and one 'dim{d}' column per dimension
+        """
+        dataset = pd.read_csv(source)
+
+        # parse dataset and reset index
+        dataset.dropna(how='all', inplace=True)
+        dataset.reset_index(drop=True, inplace=True)
+
+        for col in dataset.columns:
+            if col.startswith('Unnamed'):
+                del dataset[col]
+
+        # rename dataset
+        dataset.rename(columns=lambda name: 'time' if name.strip().startswith('time') else name,
+                       inplace=True)
+        dataset.rename(columns=lambda name: name.strip().split(' ')[0] if name.strip().startswith('dim') else name,
+                       inplace=True)
+
+        return dataset
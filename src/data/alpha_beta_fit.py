@@ -0,0 +1,90 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+from typing import List
+import numpy as np
+import pandas as pd
+
+
+class AlphaBetaFit:
+    def __init__(self, x: str = 'CommScale', y: str = 'CommsTime',
+                 group_over: List[str] = ('RunName', 'PhysicalTopology', 'Workload', 'IntraScheduling',
+                                          'InterScheduling', 'Passes')):
+        """
+        Instantiate a new AlphaBetaFit instance.
+        AlphaBetaFit fits the alpha-beta (latency-bandwidth) model y = alpha + beta x inside each group:
+        alpha is the effective latency (y at x = 0), beta the effective inverse bandwidth (y per unit of x).
+
+        :param x: message size column (e.g., CommScale, MB)
+        :param y: time column (e.g., CommsTime)
+        :param group_over: columns to group the points by. a model is fitted per group
+                           (by default, per series of the CommsTime_CommScale plots).
+        """
+        self.x = x
+        self.y = y
+        self.group_over = list(group_over)
+
+    def fit(self, dataset: pd.DataFrame) -> pd.DataFrame:
+        """
+        Least-squares fit of every group at once: the sums of the normal equations
+        (n, sum x, sum y, sum x^2, sum xy) of every group are accumulated in one pass (np.bincount),
+        then solved in closed form for all groups together. Rows with a missing x or y are ignored.
+
+        :param dataset: dataset to use
+        :return: one row per group (sorted by group), with Points, Alpha, Beta, Bandwidth (1 / Beta) and R2 columns.
+                 Alpha and Beta are NaN if the group has less than two distinct x values.
+        """
+        groups = dataset.groupby(self.group_over, sort=True, dropna=False)
+        group_codes = groups.ngroup().to_numpy()
+        table = groups.size().rename('Points').reset_index()
+        groups_count = len(table)
+
+        x = dataset[self.x].to_numpy(dtype=float)
+        y = dataset[self.y].to_numpy(dtype=float)
+        valid = np.isfinite(x) & np.isfinite(y)
+        x, y, group_codes = x[valid], y[valid], group_codes[valid]
+
+        # normal equation sums
+        n = np.bincount(group_codes, minlength=groups_count).astype(float)
+        sum_x = np.bincount(group_codes, weights=x, minlength=groups_count)
+        sum_y = np.bincount(group_codes, weights=y, minlength=groups_count)
+        sum_xx = np.bincount(group_codes, weights=x * x, minlength=groups_count)
+        sum_xy = np.bincount(group_codes, weights=x * y, minlength=groups_count)
+        sum_yy = np.bincount(group_codes, weights=y * y, minlength=groups_count)
+
+        # closed-form solution (det = n^2 Var(x): not solvable without two distinct x values)
+        det = n * sum_xx - sum_x * sum_x
+        solvable = det > 1e-12 * np.maximum(n * sum_xx, 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            beta = np.where(solvable, (n * sum_xy - sum_x * sum_y) / det, np.nan)
+            alpha = np.where(solvable, (sum_y - beta * sum_x) / n, np.nan)
+
+            # coefficient of determination
+            residuals = y - alpha[group_codes] - beta[group_codes] * x
+            ss_res = np.bincount(group_codes, weights=residuals * residuals, minlength=groups_count)
+            ss_tot = sum_yy - sum_y * sum_y / n
+            r2 = np.where(ss_tot > 0, 1 - ss_res / ss_tot, np.nan)
+            bandwidth = np.where(beta > 0, 1 / beta, np.nan)
+
+        table['Points'] = n.astype(int)
+        table['Alpha'] = alpha
+        table['Beta'] = beta
+        table['Bandwidth'] = bandwidth
+        table['R2'] = np.where(solvable, r2, np.nan)
+
+        return table
+
+    def predict(self, dataset: pd.DataFrame, table: pd.DataFrame) -> np.ndarray:
+        """
+        :param dataset: dataset to use
+        :param table: fitted models (check fit)
+        :return: fitted y of every row (aligned with dataset rows; NaN if the row's group has no model)
+        """
+        rows = pd.MultiIndex.from_frame(table[self.group_over]) \
+            .get_indexer(pd.MultiIndex.from_frame(dataset[self.group_over]))
+        alpha = np.append(table['Alpha'].to_numpy(dtype=float), np.nan)[rows]  # -1 (no model) -> NaN
+        beta = np.append(table['Beta'].to_numpy(dtype=float), np.nan)[rows]
+
+        return alpha + beta * dataset[self.x].to_numpy(dtype=float)
@@ -0,0 +1,110 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+
+class ChunkLatencyCube:
+    # columns that select one (Topology x DimensionIndex) table
+    block_cols = ['Workload', 'Passes', 'CommScale', 'RunName']
+
+    def __init__(self, dataset: pd.DataFrame, value: str = 'AverageChunkLatency'):
+        """
+        Instantiate a new ChunkLatencyCube instance.
+        ChunkLatencyCube sums value over (Workload, Passes, CommScale, RunName, Topology, DimensionIndex) once
+        per dataset, and keeps only the existing cells, in flat arrays sorted by (Workload, Passes, CommScale, RunName).
+        The (Topology x DimensionIndex) table of any (Workload, Passes, CommScale, RunName) is then
+        a dictionary lookup and an array slice, instead of a groupby over a filtered dataset.
+
+        :param dataset: BackendLayerWise dataset
+        :param value: column to sum
+        """
+        # category codes of every column (in order of first appearance)
+        block_ids = dataset.groupby(self.block_cols, sort=False).ngroup().to_numpy()
+        topology_codes, self.topologies = pd.factorize(dataset['Topology'], sort=False)
+        dimension_codes, self.dimensions = pd.factorize(dataset['DimensionIndex'], sort=False)
+        values = dataset[value].to_numpy(dtype=float)
+
+        # drop rows that groupby would drop (missing keys)
+        valid = (block_ids >= 0) & (topology_codes >= 0) & (dimension_codes >= 0)
+        block_ids, topology_codes, dimension_codes = block_ids[valid], topology_codes[valid], dimension_codes[valid]
+        values = np.nan_to_num(values[valid])
+        rows = np.flatnonzero(valid)
+
+        # sum per existing cell (cells sorted by block, topology, dimension)
+        cell_keys = (block_ids * len(self.topologies) + topology_codes) * len(self.dimensions) + dimension_codes
+        cells, cell_index = np.unique(cell_keys, return_inverse=True)
+        self.sums = np.bincount(cell_index, weights=values, minlength=len(cells))
+        self.first_rows = np.full(len(cells), np.iinfo(np.int64).max)
+        np.minimum.at(self.first_rows, cell_index, rows)
+
+        self.cell_dimensions = cells % len(self.dimensions)
+        self.cell_topologies = (cells // len(self.dimensions)) % len(self.topologies)
+        cell_blocks = cells // (len(self.dimensions) * len(self.topologies))
+
+        # block key -> [start, end) range of its cells
+        # (block ids number the block keys in order of first appearance, as drop_duplicates keeps them)
+        block_keys = list(dataset[self.block_cols].dropna().drop_duplicates().itertuples(index=False, name=None))
+        block_ids_found = np.unique(block_ids)
+        starts = np.searchsorted(cell_blocks, block_ids_found, side='left')
+        ends = np.searchsorted(cell_blocks, block_ids_found, side='right')
+        self.blocks = {block_keys[block_id]: (start, end)
+                       for block_id, start, end in zip(block_ids_found.tolist(), starts.tolist(), ends.tolist())}
+
+    def get(self, workload, passes, comm_scale, run_name) -> Optional[pd.DataFrame]:
+        """
+        :param workload: Workload value
+        :param passes: Passes value
+        :param comm_scale: CommScale value
+        :param run_name: RunName value
+        :return: summed value per (Topology, DimensionIndex), Topology as index and DimensionIndex as columns,
+                 both in order of first appearance (same as groupby(sort=False).sum().unstack()),
+                 or None if there's no such rows
+        """
+        block_range = self.blocks.get((workload, passes, comm_scale, run_name))
+        if block_range is None:
+            return None
+
+        start, end = block_range
+        topologies = self.cell_topologies[start:end]
+        dimensions = self.cell_dimensions[start:end]
+        first_rows = self.first_rows[start:end]
+
+        # local topology / dimension order: order of first appearance
+        local_topologies = self.first_appearance_order(topologies, first_rows)
+        local_dimensions = self.first_appearance_order(dimensions, first_rows)
+
+        table = np.full((len(local_topologies), len(local_dimensions)), np.nan)
+        table[self.positions(local_topologies, topologies),
+              self.positions(local_dimensions, dimensions)] = self.sums[start:end]
+
+        return pd.DataFrame(table,
+                            index=pd.Index(self.topologies[local_topologies], name='Topology'),
+                            columns=pd.Index(self.dimensions[local_dimensions], name='DimensionIndex'))
+
+    @staticmethod
+    def first_appearance_order(codes: np.ndarray, first_rows: np.ndarray) -> np.ndarray:
+        """
+        :param codes: category code of each cell
+        :param first_rows: first dataset row of each cell
+        :return: unique codes, ordered by their first dataset row
+        """
+        unique_codes, inverse = np.unique(codes, return_inverse=True)
+        first = np.full(len(unique_codes), np.iinfo(np.int64).max)
+        np.minimum.at(first, inverse, first_rows)
+
+        return unique_codes[np.argsort(first, kind='stable')]
+
+    @staticmethod
+    def positions(ordered_codes: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """
+        :param ordered_codes: unique codes
+        :param codes: codes to locate
+        :return: position of each code inside ordered_codes
+        """
+        sorter = np.argsort(ordered_codes)
+        return sorter[np.searchsorted(ordered_codes, codes, sorter=sorter)]
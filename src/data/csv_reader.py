@@ -3,20 +3,31 @@ This source code is licensed under the MIT license found in the
 LICENSE file in the root directory of this source tree.
 """
 
-import os
+from typing import Dict, List, Optional
 import numpy as np
 import pandas as pd
 from data.dataset_type import DatasetType
+from data.dataset_filter import DatasetFilter
+from data.file_index import FileIndex
+from data.result_source import ResultSource
 
 
 class CsvReader:
-    def __init__(self, dir: str = '../../result/'):
+    def __init__(self, dir: str = '../../result/', dataset_filter: Optional[DatasetFilter] = None,
+                 file_index: Optional[FileIndex] = None, columns: Optional[List[str]] = None):
         """
         Instantiate a new CsvReader instance.
 
         :param dir: directory that contains csv files.
+        :param dataset_filter: if set, only keep the rows that pass this filter.
+        :param file_index: FileIndex of dir to find csv files with (default: a new, not persisted one)
+        :param columns: if set, only read these csv columns (and RunName). 'Prefix*' matches every column starting with Prefix.
         """
         self.dir = dir
+        self.dataset_filter = dataset_filter
+        self.columns = columns
+        self.file_index = file_index if file_index is not None else FileIndex(dir=dir)
+        self.result_source = ResultSource()
 
     @staticmethod
     def filename_to_load(dataset_type: DatasetType):
@@ -35,6 +46,16 @@ class CsvReader:
             print(f"Given data_type {dataset_type.name} not supported.")
             exit(-1)
 
+    @staticmethod
+    def matches(column: str, patterns: List[str]) -> bool:
+        """
+        :param column: column name
+        :param patterns: column names, or 'Prefix*' patterns
+        :return: True if column matches one of patterns
+        """
+        return any(column.startswith(pattern[:-1]) if pattern.endswith('*') else column == pattern
+                   for pattern in patterns)
+
     @staticmethod
     def parse_run_name(dataset: pd.DataFrame):
         """
@@ -68,37 +89,84 @@ class CsvReader:
         dataset['NPUsCount'] = [np.prod(list(map(int, uc))) for uc in dataset['UnitsCount'].str.split('_')]
         dataset['PhysicalTopology'] = dataset['Topology'] + " (" + dataset['UnitsCount'] + ')'
 
-    def read_csv(self, dataset_type: DatasetType):
+    def find_files(self, dataset_type: DatasetType) -> List[str]:
         """
-        Load dataset
-
-        :param dataset_type: dataset type to load (check dataset_type.py)
-        :return: pd.DataFrame with loaded dataset
+        :param dataset_type: dataset type to find (check dataset_type.py)
+        :return: paths of all the csv files of dataset_type inside self.dir
         """
         filename_to_load = self.filename_to_load(dataset_type)
 
-        # dataframe to fill up
-        dataset = pd.DataFrame()
+        return self.file_index.find_files(match=lambda filename: filename == filename_to_load)
 
-        # iterate recursively inside self.dir to find files
-        for dirpath, _, filenames in os.walk(top=self.dir):
-            for filename in filenames:
-                if filename != filename_to_load:
-                    continue
+    def read_file(self, file_path: str, dataset_filter: Optional[DatasetFilter] = None) -> pd.DataFrame:
+        """
+        Load and parse a single csv file.
 
-                # matching file found: load and parse
-                # load file
-                file_path = os.path.join(dirpath, filename)
-                load_dataset = pd.read_csv(file_path)
+        :param file_path: path to the csv file (or archive member, check ResultSource)
+        :param dataset_filter: filter to apply instead of self.dataset_filter
+        :return: pd.DataFrame with loaded rows
+        """
+        return self.parse_file(source=ResultSource.open(file_path), dataset_filter=dataset_filter)
 
-                # parse dataset
-                load_dataset.dropna(how='all', inplace=True)
-                self.parse_run_name(dataset=load_dataset)
+    def parse_file(self, source, dataset_filter: Optional[DatasetFilter] = None,
+                   lines: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Parse a single csv file.
 
-                # merge this dataset
-                dataset = dataset.append(load_dataset)
+        :param source: opened csv file (check ResultSource.open)
+        :param dataset_filter: filter to apply instead of self.dataset_filter
+        :param lines: if set, only parse these lines of the file (line numbers, the header is line 0):
+                      the other lines are skipped by the tokenizer, without being parsed into rows
+        :return: pd.DataFrame with loaded rows
+        """
+        if dataset_filter is None:
+            dataset_filter = self.dataset_filter
+
+        # load file (only the required columns and lines, if set)
+        usecols = None
+        if self.columns is not None:
+            usecols = lambda column: column == 'RunName' or self.matches(column, self.columns)
+        skiprows = None
+        if lines is not None:
+            keep = np.zeros(int(lines.max(initial=0)) + 1, dtype=bool)
+            keep[0] = True  # header
+            keep[lines] = True
+            skiprows = lambda line: line >= len(keep) or not keep[line]
+        load_dataset = pd.read_csv(source, usecols=usecols, skiprows=skiprows)
+
+        # parse dataset
+        load_dataset.dropna(how='all', inplace=True)
+        self.parse_run_name(dataset=load_dataset)
+
+        # drop filtered-out rows before any further processing
+        if dataset_filter is not None:
+            load_dataset = dataset_filter.apply(load_dataset)
+
+        return load_dataset
+
+    def read_csv(self, dataset_type: DatasetType, file_paths: Optional[List[str]] = None,
+                 dataset_filter: Optional[DatasetFilter] = None, file_lines: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Load dataset
 
-        # reset index
+        :param dataset_type: dataset type to load (check dataset_type.py)
+        :param file_paths: csv files to load (default: every csv file of dataset_type inside self.dir)
+        :param dataset_filter: filter to apply instead of self.dataset_filter
+        :param file_lines: if set, only parse these lines of each file (file path -> line numbers, check parse_file)
+        :return: pd.DataFrame with loaded dataset
+        """
+        if file_paths is None:
+            file_paths = self.find_files(dataset_type)
+        if file_lines is None:
+            file_lines = dict()
+
+        # read (and decompress) files in parallel, merge datasets and reset index
+        datasets = self.result_source.read_files(
+            paths=file_paths,
+            read=[lambda source, lines=file_lines.get(file_path):
+                  self.parse_file(source=source, dataset_filter=dataset_filter, lines=lines)
+                  for file_path in file_paths])
+        dataset = pd.concat(datasets) if len(datasets) > 0 else pd.DataFrame()
         dataset.reset_index(drop=True, inplace=True)
 
         return dataset
@@ -0,0 +1,158 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+import json
+from typing import Optional
+import pandas as pd
+from data.csv_reader import CsvReader
+from data.dataset_type import DatasetType
+from data.dataset_filter import DatasetFilter
+
+
+class DatasetCache:
+    # bump when the cache format changes (datasets cached by older versions are ignored)
+    version = 1
+
+    def __init__(self, dir: str = '../../cache'):
+        """
+        Instantiate a new DatasetCache instance.
+        DatasetCache keeps loaded and processed datasets, so that they can be reused without re-reading csv files.
+        Every cached dataset comes with a manifest (check create_manifest) of what it was loaded from:
+        a cached dataset is only used if its manifest matches the one of the dataset to load.
+
+        :param dir: directory that contains cached datasets
+        """
+        self.dir = dir
+
+    def path(self, dataset_type: DatasetType) -> str:
+        """
+        :param dataset_type: dataset type (check dataset_type.py)
+        :return: path of the cached dataset
+        """
+        filename = os.path.splitext(CsvReader.filename_to_load(dataset_type))[0] + '.pkl'
+        return os.path.join(self.dir, filename)
+
+    def manifest_path(self, dataset_type: DatasetType) -> str:
+        """
+        :param dataset_type: dataset type (check dataset_type.py)
+        :return: path of the manifest of the cached dataset
+        """
+        return os.path.splitext(self.path(dataset_type))[0] + '.json'
+
+    @staticmethod
+    def snapshot_inputs(dir: str) -> list:
+        """
+        :param dir: input directory (system or topology files)
+        :return: sorted [name, size, mtime] of the files inside dir (empty if dir doesn't exist)
+        """
+        if not os.path.isdir(dir):
+            return list()
+
+        with os.scandir(dir) as iterator:
+            return sorted([entry.name, entry.stat().st_size, entry.stat().st_mtime]
+                          for entry in iterator if entry.is_file())
+
+    @staticmethod
+    def create_manifest(dataset_type: DatasetType, dataset_loader) -> dict:
+        """
+        Describe what a dataset is (or would be) loaded from.
+
+        :param dataset_type: dataset type (check dataset_type.py)
+        :param dataset_loader: DatasetLoader the dataset is loaded with
+        :return: cache format and loader versions, result directory, dataset filter,
+                 (path, size, mtime) of the dataset's csv files (check FileIndex), and of the input files
+        """
+        from data.dataset_loader import DatasetLoader
+
+        csv_reader = dataset_loader.csv_reader
+        dataset_filter = csv_reader.dataset_filter if csv_reader.dataset_filter is not None else DatasetFilter()
+        file_paths = set(csv_reader.find_files(dataset_type))
+
+        return {'version': DatasetCache.version,
+                'loader_version': DatasetLoader.version,
+                'result_dir': os.path.abspath(csv_reader.dir),
+                'filter': {'workloads': dataset_filter.workloads, 'run_names': dataset_filter.run_names,
+                           'comm_scales': dataset_filter.comm_scales, 'topologies': dataset_filter.topologies},
+                'files': sorted([os.path.relpath(path, csv_reader.dir), size, mtime]
+                                for path, size, mtime, kind in csv_reader.file_index.entries()
+                                if path in file_paths),
+                'systems': DatasetCache.snapshot_inputs(dataset_loader.system_config_parser.dir),
+                'topologies': DatasetCache.snapshot_inputs(dataset_loader.topology_config_parser.dir)}
+
+    def exists(self, dataset_type: DatasetType) -> bool:
+        """
+        :param dataset_type: dataset type (check dataset_type.py)
+        :return: True if the dataset is cached
+        """
+        return os.path.exists(self.path(dataset_type))
+
+    def check(self, dataset_type: DatasetType, manifest: dict) -> Optional[str]:
+        """
+        Check that the cached dataset can be used in place of the dataset to load.
+        A dataset cached without filter can be used with any filter (the filter is applied to it).
+
+        :param dataset_type: dataset type (check dataset_type.py)
+        :param manifest: manifest of the dataset to load (check create_manifest)
+        :return: None if the cached dataset can be used, or why it can't
+        """
+        if not self.exists(dataset_type):
+            return "not cached"
+
+        try:
+            with open(self.manifest_path(dataset_type), mode='r') as manifest_file:
+                cached = json.load(manifest_file)
+        except (OSError, ValueError):
+            return "no manifest (cached by an older version)"
+
+        if cached.get('version') != manifest['version'] or cached.get('loader_version') != manifest['loader_version']:
+            return "cached by another version"
+        if cached['result_dir'] != manifest['result_dir']:
+            return f"cached from another result directory ({cached['result_dir']})"
+        if any(value is not None for value in cached['filter'].values()) and cached['filter'] != manifest['filter']:
+            return "cached with another filter"
+        if cached['files'] != manifest['files']:
+            cached_files = {path: (size, mtime) for path, size, mtime in cached['files']}
+            files = {path: (size, mtime) for path, size, mtime in manifest['files']}
+            changed = sum(1 for path in files.keys() & cached_files.keys() if files[path] != cached_files[path])
+            return f"result files changed ({len(files.keys() - cached_files.keys())} added, " \
+                   f"{len(cached_files.keys() - files.keys())} removed, {changed} modified)"
+        if cached['systems'] != manifest['systems'] or cached['topologies'] != manifest['topologies']:
+            return "system or topology files changed"
+
+        return None
+
+    def save(self, dataset_type: DatasetType, dataset: pd.DataFrame, manifest: dict):
+        """
+        Cache a dataset.
+
+        :param dataset_type: dataset type (check dataset_type.py)
+        :param dataset: loaded and processed dataset
+        :param manifest: what the dataset was loaded from (check create_manifest)
+        """
+        if not os.path.exists(self.dir):
+            os.makedirs(name=self.dir)
+
+        # the manifest is written last (atomically): an interrupted save leaves no valid cache
+        manifest_path = self.manifest_path(dataset_type)
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+        dataset.to_pickle(self.path(dataset_type))
+
+        temp_path = manifest_path + '.tmp'
+        with open(temp_path, mode='w') as manifest_file:
+            json.dump(manifest, manifest_file)
+        os.replace(temp_path, manifest_path)
+
+    def load(self, dataset_type: DatasetType) -> pd.DataFrame:
+        """
+        Load a cached dataset.
+
+        :param dataset_type: dataset type (check dataset_type.py)
+        :return: cached dataset
+        """
+        assert self.exists(dataset_type), f"Dataset {dataset_type.name} not cached in {self.dir}."
+
+        return pd.read_pickle(self.path(dataset_type))
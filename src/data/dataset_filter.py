@@ -0,0 +1,87 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+from typing import List, Optional
+import pandas as pd
+
+
+class DatasetFilter:
+    def __init__(self, workloads: Optional[List[str]] = None,
+                 run_names: Optional[List[str]] = None,
+                 comm_scales: Optional[List[int]] = None,
+                 topologies: Optional[List[str]] = None):
+        """
+        Instantiate a new DatasetFilter instance.
+        DatasetFilter selects the subset of runs to load and plot.
+        Each criterion is ignored if set to None.
+
+        :param workloads: Workload values to keep
+        :param run_names: RunName values to keep
+        :param comm_scales: CommScale values to keep
+        :param topologies: Topology or PhysicalTopology values to keep
+        """
+        self.workloads = workloads
+        self.run_names = run_names
+        self.comm_scales = comm_scales
+        self.topologies = topologies
+
+    def is_empty(self) -> bool:
+        """
+        :return: True if the filter keeps everything
+        """
+        return self.workloads is None and self.run_names is None \
+            and self.comm_scales is None and self.topologies is None
+
+    def restrict_workloads(self, workloads: List[str]) -> 'DatasetFilter':
+        """
+        :param workloads: Workload values to keep
+        :return: copy of this filter that also only keeps workloads
+        """
+        if self.workloads is not None:
+            workloads = [workload for workload in workloads if workload in self.workloads]
+
+        return DatasetFilter(workloads=workloads, run_names=self.run_names,
+                             comm_scales=self.comm_scales, topologies=self.topologies)
+
+    def matches(self, config: dict) -> bool:
+        """
+        Check a single parsed run name.
+
+        :param config: parsed run name (e.g., ActivityReader.parse_run_name)
+        :return: True if the run passes the filter
+        """
+        if self.workloads is not None and config['Workload'] not in self.workloads:
+            return False
+        if self.run_names is not None and config['RunName'] not in self.run_names:
+            return False
+        if self.comm_scales is not None and config['CommScale'] not in self.comm_scales:
+            return False
+        if self.topologies is not None and config['Topology'] not in self.topologies \
+                and config['PhysicalTopology'] not in self.topologies:
+            return False
+
+        return True
+
+    def apply(self, dataset: pd.DataFrame) -> pd.DataFrame:
+        """
+        Filter a dataset whose RunName is already parsed (check CsvReader.parse_run_name).
+
+        :param dataset: dataset to filter
+        :return: rows that pass the filter
+        """
+        if self.is_empty() or len(dataset) == 0:
+            return dataset
+
+        mask = pd.Series(True, index=dataset.index)
+        if self.workloads is not None:
+            mask &= dataset['Workload'].isin(self.workloads)
+        if self.run_names is not None:
+            mask &= dataset['RunName'].isin(self.run_names)
+        if self.comm_scales is not None:
+            mask &= dataset['CommScale'].isin(self.comm_scales)
+        if self.topologies is not None:
+            mask &= dataset['Topology'].isin(self.topologies) | dataset['PhysicalTopology'].isin(self.topologies)
+
+        return dataset.loc[mask]
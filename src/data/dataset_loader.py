@@ -3,16 +3,34 @@ This source code is licensed under the MIT license found in the
 LICENSE file in the root directory of this source tree.
 """
 
+from typing import List, Optional
+import numpy as np
 from data.csv_reader import CsvReader
 from data.dataset_type import DatasetType
+from data.dataset_filter import DatasetFilter
+from data.file_index import FileIndex
+from data.optimal_bound import OptimalBound
 from data.system_config_parser import SystemConfigParser
 from data.topology_config_parser import TopologyConfigParser
 
 
 class DatasetLoader:
+    # bump when the loaded or computed columns change (datasets cached by older versions are ignored)
+    version = 1
+
+    # computed columns -> csv columns they are computed from
+    sources = {'CommsTime_BW': ['CommsTime', 'TotalPayloadSize'],
+               'CommsTime_BW_Dim*': ['CommsTime', 'PayloadSize_Dim*'],
+               'CommsTime_Optimal': ['CommsTime'],
+               'CommsTime_OptimalRatio': ['CommsTime']}
+
     def __init__(self, csv_dir: str = '../graph',
                  system_dir: str = '../inputs/system',
-                 topology_dir: str = '../inputs/network/analytical'):
+                 topology_dir: str = '../inputs/network/analytical',
+                 dataset_filter: Optional[DatasetFilter] = None,
+                 file_index: Optional[FileIndex] = None,
+                 exit_on_error: bool = True,
+                 columns: Optional[List[str]] = None):
         """
         Create DatasetLoader instance.
         DatasetLoader is used for loading and creating dataset for plotting.
@@ -20,57 +38,120 @@ class DatasetLoader:
         :param csv_dir: path to directory that contains result csv files
         :param system_dir: path to directory that contains system .txt files
         :param topology_dir: path to directory that contains topology .json configs
+        :param dataset_filter: if set, only load the rows that pass this filter
+        :param file_index: FileIndex of csv_dir to find csv files with (default: a new, not persisted one)
+        :param exit_on_error: if True, exit when a system or topology file is missing. if False, raise IngestError.
+        :param columns: if set, only read and compute these metric columns ('Prefix*' matches every column starting
+                        with Prefix; e.g., check PlotFamily.columns). run name columns and scheduling policies are
+                        always loaded. if None, load every column.
+        """
+        self.columns = columns
+        self.csv_reader = CsvReader(dir=csv_dir, dataset_filter=dataset_filter, file_index=file_index,
+                                    columns=self.csv_columns(columns))
+        self.system_config_parser = SystemConfigParser(dir=system_dir, exit_on_error=exit_on_error)
+        self.topology_config_parser = TopologyConfigParser(dir=topology_dir, exit_on_error=exit_on_error)
+
+    @staticmethod
+    def csv_columns(columns: Optional[List[str]]) -> Optional[List[str]]:
+        """
+        :param columns: metric columns to load (None: every column)
+        :return: csv columns to read to load columns (None: every column)
+        """
+        if columns is None:
+            return None
+
+        csv_columns = dict()
+        for column in columns:
+            csv_columns.update(dict.fromkeys(DatasetLoader.sources.get(column, [column])))
+
+        return list(csv_columns)
+
+    def requires(self, column: str) -> bool:
+        """
+        :param column: computed column (check sources)
+        :return: True if column has to be computed
         """
-        self.csv_reader = CsvReader(dir=csv_dir)
-        self.system_config_parser = SystemConfigParser(dir=system_dir)
-        self.topology_config_parser = TopologyConfigParser(dir=topology_dir)
+        return self.columns is None or column in self.columns
 
-    def load_dataset(self, dataset_type: DatasetType):
+    def load_dataset(self, dataset_type: DatasetType, file_paths: Optional[List[str]] = None,
+                     dataset_filter: Optional[DatasetFilter] = None):
         """
         Read csv file, create dataset, and run required post-processing on it.
 
         :param dataset_type: DatasetType to use. Refer to dataset_type.py.
+        :param file_paths: csv files to read (default: every csv file of dataset_type)
+        :param dataset_filter: filter to apply instead of the one given at construction
         :return: loaded and processed dataset (can be used for plotting)
         """
         # read csv file
-        dataset = self.csv_reader.read_csv(dataset_type=dataset_type)
+        dataset = self.csv_reader.read_csv(dataset_type=dataset_type, file_paths=file_paths,
+                                           dataset_filter=dataset_filter)
 
+        return self.process_dataset(dataset_type=dataset_type, dataset=dataset)
+
+    def process_dataset(self, dataset_type: DatasetType, dataset):
+        """
+        Run required post-processing on a dataset read by csv_reader.
+
+        :param dataset_type: DatasetType of dataset
+        :param dataset: dataset read by csv_reader (modified in place)
+        :return: processed dataset
+        """
         # do additional post-processing per each dataset type
         if dataset_type == DatasetType.BackendEndToEnd:
-            for index, row in dataset.iterrows():
-                # get accumulated BW
-                self.topology_config_parser.load_topology(name=row['Topology'])
-                accumulated_bw = self.topology_config_parser.accumulated_bandwidth() * 1024 / 1e6  # MB/us
-
-                # compute CommsTime_BW
-                bw_utilization_total = (row['TotalPayloadSize'] / row['CommsTime']) / accumulated_bw
-                dataset.loc[index, 'CommsTime_BW'] = bw_utilization_total
-
-                # compute CommsTime_BW per each dim
-                # extract reported dim index from the dataset
-                # for example, reported_dim_index can be [0, 1, 2, 3, 4, 5, 6]
-                reported_dim_index = list(filter(lambda x: x.startswith("PayloadSize_Dim"), dataset.columns.unique()))
-                reported_dim_index = list(map(lambda x: int(x[len("PayloadSize_Dim"):]), reported_dim_index))
-
-                # compute CommsTime_BW_Dim
-                for dim in reported_dim_index:
-                    payload_size = row[f'PayloadSize_Dim{dim}']
-                    if payload_size > 0:
-                        topology_bw_dim = self.topology_config_parser.get_bandwidth_at_dim(dim=dim) * 1024 / 1e6  # MB/us
-                        dataset.loc[index, f'CommsTime_BW_Dim{dim}'] = (payload_size / row['CommsTime']) / topology_bw_dim
+            # load every topology once (columns are computed over the whole dataset)
+            topology_table = None
+            if any(self.requires(column) for column in self.sources):
+                topology_table = self.topology_config_parser.topology_table(names=dataset['Topology'])
+                topology_rows = topology_table.index.get_indexer(dataset['Topology'])
+                comms_time = dataset['CommsTime'].to_numpy(dtype=float)
+
+            # compute CommsTime_BW
+            if self.requires('CommsTime_BW'):
+                accumulated_bw = topology_table['Bandwidth'].to_numpy(dtype=float)[topology_rows]  # MB/us
+                dataset['CommsTime_BW'] = (dataset['TotalPayloadSize'].to_numpy(dtype=float) / comms_time) / accumulated_bw
+
+            # compute CommsTime_BW per each dim
+            # extract reported dim index from the dataset
+            # for example, reported_dim_index can be [0, 1, 2, 3, 4, 5, 6]
+            reported_dim_index = list(filter(lambda x: x.startswith("PayloadSize_Dim"), dataset.columns.unique()))
+            reported_dim_index = sorted(map(lambda x: int(x[len("PayloadSize_Dim"):]), reported_dim_index))
+            if not self.requires('CommsTime_BW_Dim*'):
+                reported_dim_index = list()
+
+            # compute CommsTime_BW_Dim (only for the runs that moved data on the dim)
+            for dim in reported_dim_index:
+                payload_size = dataset[f'PayloadSize_Dim{dim}'].to_numpy(dtype=float)
+                moved = payload_size > 0
+                if not moved.any():
+                    continue
+
+                bw_col = f'Bandwidth_Dim{dim}'
+                topology_bw_dim = topology_table[bw_col].to_numpy(dtype=float)[topology_rows] \
+                    if bw_col in topology_table.columns else np.full(len(dataset), np.nan)  # MB/us
+                assert not np.isnan(topology_bw_dim[moved]).any(), f"Requested dimension {dim} out of range."
+
+                dataset[f'CommsTime_BW_Dim{dim}'] = np.where(moved, (payload_size / comms_time) / topology_bw_dim, np.nan)
+
+            # compute CommsTime_Optimal (analytical bound) and CommsTime_OptimalRatio
+            if self.requires('CommsTime_Optimal') or self.requires('CommsTime_OptimalRatio'):
+                OptimalBound.annotate(dataset=dataset, topology_table=topology_table)
 
             # remove redundant columns
             payload_size_cols = filter(lambda x: 'PayloadSize' in x, dataset.columns.unique())
             dataset.drop(labels=payload_size_cols, axis='columns', inplace=True)
 
-        elif dataset_type == DatasetType.BackendLayerWise:
+        elif dataset_type == DatasetType.BackendLayerWise and 'DimensionIndex' in dataset.columns:
             dataset['DimensionIndex'] = dataset['DimensionIndex'].astype(int)
 
         # common post-processing
-        # get scheduling policy
-        for index, row in dataset.iterrows():
-            self.system_config_parser.load_system(name=row['System'])
-            dataset.loc[index, 'IntraScheduling'] = self.system_config_parser.get_intra_scheduling()
-            dataset.loc[index, 'InterScheduling'] = self.system_config_parser.get_inter_scheduling()
+        # get scheduling policy (every system is loaded once)
+        intra_scheduling, inter_scheduling = dict(), dict()
+        for system in dataset['System'].unique():
+            self.system_config_parser.load_system(name=system)
+            intra_scheduling[system] = self.system_config_parser.get_intra_scheduling()
+            inter_scheduling[system] = self.system_config_parser.get_inter_scheduling()
+        dataset['IntraScheduling'] = dataset['System'].map(intra_scheduling)
+        dataset['InterScheduling'] = dataset['System'].map(inter_scheduling)
 
         return dataset
@@ -0,0 +1,82 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+class DimMetricStore:
+    def __init__(self, offsets: np.ndarray, dims: np.ndarray, values: np.ndarray, prefix: str):
+        """
+        Instantiate a new DimMetricStore instance (use from_wide()).
+        DimMetricStore keeps a per-dimension metric (e.g., CommsTime_BW_Dim{d}) as a compressed sparse row table
+        with only the populated entries: runs that don't move data on a dim have no entry instead of a NaN cell.
+        The entries of row r are [offsets[r], offsets[r + 1]), sorted by dim.
+
+        :param offsets: first entry of every row, and the number of entries (rows count + 1 values)
+        :param dims: dimension of every entry
+        :param values: metric value of every entry
+        :param prefix: wide column name prefix (the wide column of dim d is f'{prefix}{d}')
+        """
+        self.offsets = offsets
+        self.dims = dims
+        self.values = values
+        self.prefix = prefix
+
+    @staticmethod
+    def wide_cols(dataset: pd.DataFrame, prefix: str) -> List[str]:
+        """
+        :param dataset: dataset with wide per-dimension columns
+        :param prefix: wide column name prefix
+        :return: wide columns of dataset, in dim order
+        """
+        return sorted([col for col in dataset.columns if col.startswith(prefix)],
+                      key=lambda col: int(col[len(prefix):]))
+
+    @staticmethod
+    def from_wide(dataset: pd.DataFrame, prefix: str = 'CommsTime_BW_Dim') -> 'DimMetricStore':
+        """
+        :param dataset: dataset with wide per-dimension columns (rows are identified by position, e.g., a RangeIndex)
+        :param prefix: wide column name prefix
+        :return: DimMetricStore of the populated cells of the wide columns
+        """
+        cols = DimMetricStore.wide_cols(dataset, prefix)
+        wide = dataset[cols].to_numpy(dtype=float)
+        populated = ~np.isnan(wide)  # row-major: entries come out sorted by (row, dim)
+
+        col_positions = np.nonzero(populated)[1]
+        dims = np.array([int(col[len(prefix):]) for col in cols], dtype=np.int8)
+
+        counts = populated.sum(axis=1)
+        offset_type = np.int32 if counts.sum() <= np.iinfo(np.int32).max else np.int64
+        offsets = np.zeros(len(dataset) + 1, dtype=offset_type)
+        np.cumsum(counts, out=offsets[1:])
+
+        return DimMetricStore(offsets=offsets, dims=dims[col_positions], values=wide[populated], prefix=prefix)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        :return: memory held by the table
+        """
+        return self.offsets.nbytes + self.dims.nbytes + self.values.nbytes
+
+    def take(self, rows: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        :param rows: row positions to select (None: every row)
+        :return: (row positions, dims, values) of the entries of rows, in rows order (then dim order)
+        """
+        if rows is None:
+            rows = np.arange(len(self.offsets) - 1)
+
+        # every row's entries are contiguous: gather their [start, end) ranges
+        rows = np.asarray(rows, dtype=np.int64)
+        starts = self.offsets[rows].astype(np.int64)
+        counts = self.offsets[rows + 1] - starts
+        positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        entries = np.repeat(starts, counts) + positions
+
+        return np.repeat(rows, counts), self.dims[entries], self.values[entries]
@@ -0,0 +1,163 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+import pickle
+import tarfile
+from typing import Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from data.result_source import ResultSource
+
+
+class FileIndex:
+    # bump when the persisted format changes (older index files are rebuilt)
+    version = 2
+
+    def __init__(self, dir: str = '../../result/', index_path: Optional[str] = None, workers: int = 32):
+        """
+        Instantiate a new FileIndex instance.
+        FileIndex lists every file inside dir as (path, size, mtime, kind) entries.
+        Directories are scanned in parallel (os.scandir on a thread pool, one tree level at a time),
+        and if index_path is set, the index is persisted there and only the directories
+        whose mtime changed since the last scan are listed again.
+        Tar archives (check ResultSource) are listed like directories: their members are indexed under
+        the archive path, and only listed again when the archive changes.
+
+        Note that modifying a file in place doesn't change the mtime of its directory:
+        the (size, mtime) of such a file is only refreshed when its directory is listed again.
+
+        :param dir: directory to index (recursively)
+        :param index_path: file to persist the index into (None: don't persist)
+        :param workers: number of threads scanning directories
+        """
+        self.dir = dir
+        self.index_path = index_path
+        self.workers = workers
+
+        # directory path -> (directory mtime, [(name, size, mtime, kind)]), kind is 'file' or 'dir'
+        self.directories: Dict[str, tuple] = dict()
+        self.refreshed = False
+
+    def load(self):
+        """
+        Load the persisted index, if any (and if it indexes the same directory).
+        """
+        if self.index_path is None or not os.path.exists(self.index_path):
+            return
+
+        try:
+            with open(self.index_path, 'rb') as index_file:
+                index = pickle.load(index_file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return  # unreadable: rebuild
+
+        if index.get('version') == self.version and index.get('dir') == os.path.abspath(self.dir):
+            self.directories = index['directories']
+
+    def save(self):
+        """
+        Persist the index (written atomically).
+        """
+        if self.index_path is None:
+            return
+
+        index_dir = os.path.dirname(self.index_path)
+        if index_dir != '' and not os.path.exists(index_dir):
+            os.makedirs(name=index_dir)
+
+        index = {'version': self.version, 'dir': os.path.abspath(self.dir), 'directories': self.directories}
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'wb') as index_file:
+            pickle.dump(index, index_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.index_path)
+
+    def scan_directory(self, path: str) -> Optional[tuple]:
+        """
+        List a directory (or tar archive), or reuse its previous listing if its mtime didn't change.
+
+        :param path: directory (or tar archive) path
+        :return: (directory mtime, [(name, size, mtime, kind)]), or None if the directory doesn't exist anymore.
+                 archive members are named by their path inside the archive.
+        """
+        try:
+            dir_mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        previous = self.directories.get(path)
+        if previous is not None and previous[0] == dir_mtime:
+            return previous
+
+        if os.path.isfile(path):
+            try:
+                return dir_mtime, [(name, size, mtime, 'file') for name, size, mtime in ResultSource.list_archive(path)]
+            except (tarfile.TarError, OSError, EOFError) as error:
+                print(f"Skipping archive {path}: {error}")
+                return dir_mtime, list()
+
+        entries = list()
+        try:
+            with os.scandir(path) as iterator:
+                for entry in iterator:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            entries.append((entry.name, 0, 0, 'dir'))
+                        else:
+                            stat = entry.stat()
+                            entries.append((entry.name, stat.st_size, stat.st_mtime, 'file'))
+                    except FileNotFoundError:
+                        continue  # removed while scanning
+        except FileNotFoundError:
+            return None
+
+        return dir_mtime, entries
+
+    def refresh(self):
+        """
+        Bring the index up to date with the directory tree (and persist it).
+        """
+        self.load()
+
+        directories = dict()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            level = [self.dir]
+            while len(level) > 0:
+                next_level = list()
+                for path, listing in zip(level, executor.map(self.scan_directory, level)):
+                    if listing is None:
+                        continue
+
+                    directories[path] = listing
+                    next_level.extend(os.path.join(path, name) for name, _, _, kind in listing[1]
+                                      if kind == 'dir' or ResultSource.is_archive(name))
+                level = next_level
+
+        self.directories = directories
+        self.refreshed = True
+        self.save()
+
+    def entries(self) -> List[tuple]:
+        """
+        :return: (path, size, mtime, kind) of every file and directory inside self.dir
+        """
+        if not self.refreshed:
+            self.refresh()
+
+        return [(os.path.join(path, name), size, mtime, kind)
+                for path, (_, listing) in self.directories.items()
+                for name, size, mtime, kind in listing]
+
+    def find_files(self, match: Callable[[str], bool]) -> List[str]:
+        """
+        :param match: filename predicate (compressed files are matched without their suffix, check ResultSource)
+        :return: sorted paths of the files whose filename matches
+        """
+        if not self.refreshed:
+            self.refresh()
+
+        return sorted(os.path.join(path, name)
+                      for path, (_, listing) in self.directories.items()
+                      for name, _, _, kind in listing
+                      if kind == 'file' and match(ResultSource.logical_name(os.path.basename(name))))
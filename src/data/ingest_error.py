@@ -0,0 +1,12 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+
+class IngestError(Exception):
+    """
+    Raised when a result or input file can't be loaded (missing, malformed, ...),
+    instead of exiting, so that bulk ingest can quarantine the file and carry on.
+    """
+    pass
@@ -0,0 +1,84 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+import json
+from typing import Set
+
+
+class IngestReport:
+    def __init__(self):
+        """
+        Initialize IngestReport instance.
+        IngestReport collects the problems found while checking (pre-flight) or loading (ingest) result files,
+        and the files quarantined because of them.
+        """
+        self.problems = list()  # {'path', 'stage', 'reason'}
+        self.loaded = dict()  # dataset type name -> {'files', 'rows'}
+
+    def add(self, path: str, stage: str, reason: str):
+        """
+        Record a problem.
+
+        :param path: file the problem was found in
+        :param stage: 'preflight' or 'ingest'
+        :param reason: description of the problem
+        """
+        self.problems.append({'path': path, 'stage': stage, 'reason': reason})
+
+    def set_loaded(self, dataset_type_name: str, files_count: int, rows_count: int):
+        """
+        Record what was loaded for a dataset type.
+
+        :param dataset_type_name: name of the DatasetType
+        :param files_count: number of files loaded
+        :param rows_count: number of rows loaded
+        """
+        self.loaded[dataset_type_name] = {'files': files_count, 'rows': rows_count}
+
+    def is_empty(self) -> bool:
+        """
+        :return: True if no problem was found
+        """
+        return len(self.problems) == 0
+
+    def bad_paths(self) -> Set[str]:
+        """
+        :return: files with at least one problem (quarantined)
+        """
+        return {problem['path'] for problem in self.problems}
+
+    def to_dict(self) -> dict:
+        """
+        :return: report contents (json serializable)
+        """
+        return {'quarantined': sorted(self.bad_paths()),
+                'problems': self.problems,
+                'loaded': self.loaded}
+
+    def write(self, path: str):
+        """
+        Write the report as json.
+
+        :param path: report file path
+        """
+        report_dir = os.path.dirname(path)
+        if report_dir != '' and not os.path.exists(report_dir):
+            os.makedirs(name=report_dir)
+
+        with open(path, 'w') as report_file:
+            json.dump(self.to_dict(), report_file, indent=2)
+
+    def print_summary(self, limit: int = 20):
+        """
+        Print the problems found (at most limit of them).
+
+        :param limit: maximum number of problems to print
+        """
+        print(f"{len(self.problems)} problems found in {len(self.bad_paths())} files.")
+        for problem in self.problems[:limit]:
+            print(f"  [{problem['stage']}] {problem['path']}: {problem['reason']}")
+        if len(self.problems) > limit:
+            print(f"  ... ({len(self.problems) - limit} more)")
@@ -0,0 +1,112 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import io
+import os
+from typing import List
+import pandas as pd
+from data.alpha_beta_fit import AlphaBetaFit
+
+
+class KpiTable:
+    # one KPI row per configuration
+    keys = ['Workload', 'RunName', 'Passes', 'CommScale', 'PhysicalTopology']
+
+    # statistics of every metric (over the runs of a configuration, e.g., one per system)
+    statistics = ['mean', 'min', 'max']
+
+    @staticmethod
+    def metric_cols(dataset: pd.DataFrame) -> List[str]:
+        """
+        :param dataset: BackendEndToEnd dataset
+        :return: metric columns of dataset (CommsTime, CommsTime_BW, CommsTime_BW_Dim{d} in dim order,
+                 CommsTime_Optimal, CommsTime_OptimalRatio, Cost)
+        """
+        dim_cols = sorted([col for col in dataset.columns if col.startswith('CommsTime_BW_Dim')],
+                          key=lambda col: int(col[len('CommsTime_BW_Dim'):]))
+
+        return [col for col in ['CommsTime', 'CommsTime_BW'] if col in dataset.columns] + dim_cols \
+            + [col for col in ['CommsTime_Optimal', 'CommsTime_OptimalRatio', 'Cost'] if col in dataset.columns]
+
+    @staticmethod
+    def end_to_end(dataset: pd.DataFrame) -> pd.DataFrame:
+        """
+        Summarize the end-to-end metrics of every configuration (one groupby pass).
+
+        :param dataset: BackendEndToEnd dataset
+        :return: one row per configuration (keys), with a Runs column and {metric}_{Mean|Min|Max} columns.
+                 per-dim bandwidth utilizations only count the runs that moved data on that dim.
+        """
+        metrics = KpiTable.metric_cols(dataset)
+        grouped = dataset.groupby(KpiTable.keys, sort=True)
+
+        table = grouped[metrics].agg(KpiTable.statistics)
+        table.columns = [f'{metric}_{statistic.capitalize()}' for metric, statistic in table.columns]
+        table.insert(0, 'Runs', grouped.size())
+
+        return table.reset_index()
+
+    @staticmethod
+    def chunk_latency(dataset: pd.DataFrame) -> pd.DataFrame:
+        """
+        Break down the chunk latency of every configuration by dimension (one groupby pass).
+
+        :param dataset: BackendLayerWise dataset
+        :return: one row per (configuration, DimensionIndex), with the Layers count, AverageChunkLatency
+                 {Sum|Mean|Min|Max} columns, and Share: the dim's part of the configuration's summed latency
+        """
+        table = dataset.groupby(KpiTable.keys + ['DimensionIndex'], sort=True)['AverageChunkLatency'] \
+            .agg(['size', 'sum'] + KpiTable.statistics)
+        table.columns = ['Layers'] + [f'AverageChunkLatency_{statistic.capitalize()}'
+                                      for statistic in ['sum'] + KpiTable.statistics]
+        table = table.reset_index()
+
+        total = table.groupby(KpiTable.keys, sort=False)['AverageChunkLatency_Sum'].transform('sum')
+        table['Share'] = (table['AverageChunkLatency_Sum'] / total).where(total != 0)
+
+        return table
+
+    @staticmethod
+    def alpha_beta(dataset: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fit the alpha-beta model CommsTime = Alpha + Beta x CommScale of every
+        (RunName, PhysicalTopology, Workload, IntraScheduling, InterScheduling, Passes) group at once.
+
+        :param dataset: BackendEndToEnd dataset
+        :return: one row per group, with Points, Alpha, Beta, Bandwidth and R2 columns (check AlphaBetaFit)
+        """
+        return AlphaBetaFit(x='CommScale', y='CommsTime').fit(dataset)
+
+    @staticmethod
+    def write(table: pd.DataFrame, path: str, formats: List[str], sink) -> List[str]:
+        """
+        Write a KPI table in every format.
+
+        :param table: KPI table
+        :param path: output path, without extension
+        :param formats: 'csv' and/or 'parquet' (parquet requires pyarrow or fastparquet, and is skipped if missing)
+        :param sink: OutputSink to write with
+        :return: paths written
+        """
+        written = list()
+        for file_format in formats:
+            if file_format == 'csv':
+                data = table.to_csv(index=False).encode()
+            elif file_format == 'parquet':
+                buffer = io.BytesIO()
+                try:
+                    table.to_parquet(buffer, index=False)
+                except ImportError:
+                    print(f"Skipping {os.path.basename(path)}.parquet: parquet output requires pyarrow or fastparquet.")
+                    continue
+                data = buffer.getvalue()
+            else:
+                print(f"KPI format {file_format} not supported.")
+                exit(-1)
+
+            sink.write_bytes(path=f'{path}.{file_format}', data=data)
+            written.append(f'{path}.{file_format}')
+
+        return written
@@ -0,0 +1,66 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class OptimalBound:
+    # data every NPU sends per collective, in multiples of (N-1)/N x collective size (N: NPUs count).
+    #   e.g., All-Reduce = Reduce-Scatter + All-Gather
+    # workloads are matched by name (e.g., microAllReduce), in this order
+    collective_traffic = [('AllReduce', 2), ('ReduceScatter', 1), ('AllGather', 1), ('AllToAll', 1)]
+
+    @staticmethod
+    def traffic_of(workloads: pd.Series) -> np.ndarray:
+        """
+        :param workloads: Workload column
+        :return: collective traffic multiplier of every row (NaN if the workload is not a known collective)
+        """
+        names = pd.unique(workloads)
+        traffic = np.full(len(names), np.nan)
+        for i, name in enumerate(names):
+            for collective, multiplier in OptimalBound.collective_traffic:
+                if collective in str(name):
+                    traffic[i] = multiplier
+                    break
+
+        return traffic[pd.Index(names).get_indexer(workloads)]
+
+    @staticmethod
+    def optimal_time(dataset: pd.DataFrame, topology_table: pd.DataFrame, size: str = 'CommScale') -> np.ndarray:
+        """
+        Bandwidth-optimal collective time of every run (one vectorized pass over the dataset):
+        every NPU has to send (and receive) traffic x (N-1)/N x collective size, at best through all its links at once,
+        i.e., at the accumulated links-count x link-bandwidth of every dimension.
+        The bound depends on the collective, not on the data a run actually moved (TotalPayloadSize):
+        a run can only reach it by moving no more than the collective's minimal traffic at full bandwidth.
+
+        :param dataset: BackendEndToEnd dataset (Workload, Topology and collective size columns)
+        :param topology_table: TopologyConfigParser.topology_table() of the dataset's topologies
+        :param size: collective size column (MB)
+        :return: optimal CommsTime of every row (same unit as CommsTime; NaN if unknown)
+        """
+        rows = topology_table.index.get_indexer(dataset['Topology'])
+        units_count = topology_table['UnitsCount'].to_numpy(dtype=float)[rows]
+        bandwidth = topology_table['Bandwidth'].to_numpy(dtype=float)[rows]  # MB/us
+
+        traffic = OptimalBound.traffic_of(dataset['Workload']) * (units_count - 1) / units_count
+        return traffic * dataset[size].to_numpy(dtype=float) / bandwidth
+
+    @staticmethod
+    def annotate(dataset: pd.DataFrame, topology_table: pd.DataFrame, size: str = 'CommScale'):
+        """
+        Add the CommsTime_Optimal and CommsTime_OptimalRatio (simulated / optimal, 1 = optimal) columns.
+
+        :param dataset: BackendEndToEnd dataset (modified in place)
+        :param topology_table: TopologyConfigParser.topology_table() of the dataset's topologies
+        :param size: collective size column (MB)
+        """
+        optimal = OptimalBound.optimal_time(dataset=dataset, topology_table=topology_table, size=size)
+        optimal[optimal <= 0] = np.nan  # e.g., a single NPU: nothing to bound
+
+        dataset['CommsTime_Optimal'] = optimal
+        dataset['CommsTime_OptimalRatio'] = dataset['CommsTime'].to_numpy(dtype=float) / optimal
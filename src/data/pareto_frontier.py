@@ -0,0 +1,66 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+from typing import List
+import numpy as np
+import pandas as pd
+
+
+class ParetoFrontier:
+    def __init__(self, x: str = 'Cost', y: str = 'CommsTime',
+                 group_over: List[str] = ('Workload', 'Passes', 'CommScale')):
+        """
+        Instantiate a new ParetoFrontier instance.
+        ParetoFrontier finds the points that minimize both x and y (skyline) inside each group.
+
+        :param x: first column to minimize
+        :param y: second column to minimize
+        :param group_over: columns to group the points by. a frontier is computed per group.
+        """
+        self.x = x
+        self.y = y
+        self.group_over = list(group_over)
+
+    def mark(self, dataset: pd.DataFrame) -> np.ndarray:
+        """
+        Find the Pareto-optimal rows of a dataset, for every group at once.
+        Sort by (group, x, y), then a row is optimal iff its y is strictly smaller
+        than every y before it in its group: O(n log n).
+
+        :param dataset: dataset to use
+        :return: boolean ndarray (aligned with dataset rows), True if the row is on its group's frontier
+        """
+        if len(dataset) == 0:
+            return np.zeros(0, dtype=bool)
+
+        group_codes = dataset.groupby(self.group_over, sort=False).ngroup().to_numpy()
+        x = dataset[self.x].to_numpy(dtype=float)
+        y = dataset[self.y].to_numpy(dtype=float)
+
+        # sort by group, then x, then y (np.lexsort: last key is the primary key)
+        order = np.lexsort((y, x, group_codes))
+        sorted_group = group_codes[order]
+        sorted_y = y[order]
+
+        # best y among the previous rows of the same group
+        running_min = pd.Series(sorted_y).groupby(sorted_group).cummin().to_numpy()
+        previous_min = np.empty_like(running_min)
+        previous_min[0] = np.inf
+        previous_min[1:] = running_min[:-1]
+        previous_min[np.r_[True, sorted_group[1:] != sorted_group[:-1]]] = np.inf
+
+        optimal = np.empty(len(dataset), dtype=bool)
+        optimal[order] = sorted_y < previous_min
+
+        return optimal
+
+    def frontier(self, dataset: pd.DataFrame) -> pd.DataFrame:
+        """
+        :param dataset: dataset to use
+        :return: Pareto-optimal rows, sorted by group and x
+        """
+        frontier = dataset.loc[self.mark(dataset)]
+
+        return frontier.sort_values(by=self.group_over + [self.x], kind='mergesort')
@@ -0,0 +1,221 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import queue
+import threading
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from data.csv_reader import CsvReader
+from data.dataset_type import DatasetType
+from data.dataset_loader import DatasetLoader
+from data.dataset_cache import DatasetCache
+from data.dataset_filter import DatasetFilter
+
+
+class PartitionStream:
+    # marks the end of a stage's output
+    end = object()
+
+    def __init__(self, dataset_loader: DatasetLoader, dataset_types: List[DatasetType],
+                 dataset_cache: Optional[DatasetCache] = None, buffer_size: int = 1):
+        """
+        Instantiate a new PartitionStream instance.
+        PartitionStream yields the datasets one Workload partition at a time, as a pipeline of stages
+        connected by bounded queues: a read thread (csv files of the partition), an enrichment thread
+        (DatasetLoader post-processing), and the consumer (e.g., slicing and rendering).
+        While a partition is consumed, the next ones are read and enriched, and at most buffer_size
+        partitions wait between two stages, so memory holds a few partitions instead of the whole sweep.
+
+        Partitions are planned by reading the RunName column of every csv file only, and recording the lines
+        of every workload in every file: each partition then only parses its own lines of the files
+        (a file holding every workload is tokenized once per workload, but parsed once).
+        Cached datasets (check DatasetCache) are already processed: they are loaded whole while planning,
+        and split into partitions (memory then holds the whole cached dataset, not a few partitions).
+
+        :param dataset_loader: DatasetLoader to read and process csv files with
+        :param dataset_types: dataset types of each partition
+        :param dataset_cache: if set, use the datasets cached in it, if any
+        :param buffer_size: maximum number of partitions waiting between two stages
+        """
+        self.dataset_loader = dataset_loader
+        self.dataset_types = dataset_types
+        self.dataset_cache = dataset_cache
+        self.buffer_size = buffer_size
+
+        # user filter (partitions apply it too)
+        self.dataset_filter = dataset_loader.csv_reader.dataset_filter
+        if self.dataset_filter is None:
+            self.dataset_filter = DatasetFilter()
+
+        self.cached_partitions = dict()  # DatasetType -> {Workload -> rows}, for cached datasets
+        self.cache_checks = dict()  # DatasetType -> True if read from the dataset cache
+        self.stop_event = threading.Event()
+
+    def cached(self, dataset_type: DatasetType) -> bool:
+        """
+        :param dataset_type: dataset type
+        :return: True if dataset_type is read from the dataset cache (checked once, check DatasetCache.check)
+        """
+        if self.dataset_cache is None:
+            return False
+
+        if dataset_type not in self.cache_checks:
+            reason = self.dataset_cache.check(
+                dataset_type=dataset_type,
+                manifest=DatasetCache.create_manifest(dataset_type=dataset_type, dataset_loader=self.dataset_loader))
+            if reason is not None and self.dataset_cache.exists(dataset_type):
+                print(f"Ignoring cached {dataset_type.name} ({reason}): reading csv files. "
+                      f"Run ingest to refresh the cache.")
+            self.cache_checks[dataset_type] = reason is None
+
+        return self.cache_checks[dataset_type]
+
+    def file_lines(self, source) -> Dict[str, np.ndarray]:
+        """
+        :param source: opened result csv file (check ResultSource.open)
+        :return: Workload -> line numbers (the header is line 0, check CsvReader.parse_file) of the runs
+                 inside the file that pass the filter (RunName column only is read)
+        """
+        # blank lines are kept: row i is line i + 1
+        row_run_names = pd.read_csv(source, usecols=['RunName'], skip_blank_lines=False)['RunName']
+        run_names = row_run_names.dropna().unique()
+        if len(run_names) == 0:
+            return dict()
+
+        runs = pd.DataFrame({'RunName': pd.Series(run_names, dtype=object)})
+        CsvReader.parse_run_name(dataset=runs)
+        runs.index = run_names
+        run_workloads = self.dataset_filter.apply(runs)['Workload']
+
+        row_workloads = row_run_names.map(run_workloads).to_numpy()
+        lines = np.arange(1, len(row_workloads) + 1)
+        return {workload: lines[row_workloads == workload] for workload in run_workloads.unique()}
+
+    def plan(self) -> Dict[str, Dict[DatasetType, Optional[Dict[str, np.ndarray]]]]:
+        """
+        :return: Workload -> {DatasetType -> {csv file to read -> lines of the workload}
+                 (None: read from the cached dataset)}, in Workload order
+        """
+        partitions = dict()
+        for dataset_type in self.dataset_types:
+            if self.cached(dataset_type):
+                dataset = self.dataset_filter.apply(self.dataset_cache.load(dataset_type))
+                self.cached_partitions[dataset_type] = {workload: rows.reset_index(drop=True)
+                                                        for workload, rows in dataset.groupby('Workload', sort=False)}
+                for workload in self.cached_partitions[dataset_type]:
+                    partitions.setdefault(workload, dict())[dataset_type] = None
+                continue
+
+            file_paths = self.dataset_loader.csv_reader.find_files(dataset_type)
+            file_lines = self.dataset_loader.csv_reader.result_source.read_files(paths=file_paths,
+                                                                                 read=self.file_lines)
+            for file_path, workload_lines in zip(file_paths, file_lines):
+                for workload, lines in workload_lines.items():
+                    partitions.setdefault(workload, dict()).setdefault(dataset_type, dict())[file_path] = lines
+
+        return {workload: partitions[workload] for workload in sorted(partitions)}
+
+    def read_partitions(self, plan: dict) -> Iterator[Tuple[str, Dict[DatasetType, pd.DataFrame]]]:
+        """
+        Read stage: read the rows of each partition (only the partition's lines of each file are parsed).
+
+        :param plan: result of plan()
+        :return: (Workload, {DatasetType -> rows read, None if cached}) of each partition
+        """
+        for workload, files in plan.items():
+            partition_filter = self.dataset_filter.restrict_workloads([workload])
+            rows = dict()
+            for dataset_type in self.dataset_types:
+                if self.cached(dataset_type):
+                    rows[dataset_type] = None
+                else:
+                    file_lines = files.get(dataset_type, dict())
+                    rows[dataset_type] = self.dataset_loader.csv_reader.read_csv(
+                        dataset_type=dataset_type, file_paths=list(file_lines), dataset_filter=partition_filter,
+                        file_lines=file_lines)
+            yield workload, rows
+
+    def process_partitions(self, partitions: Iterator) -> Iterator[Tuple[str, Dict[DatasetType, pd.DataFrame]]]:
+        """
+        Enrichment stage: post-process the rows of each partition (or take them from the cached datasets).
+
+        :param partitions: output of the read stage
+        :return: (Workload, {DatasetType -> processed dataset}) of each partition
+        """
+        for workload, rows in partitions:
+            datasets = dict()
+            for dataset_type, dataset in rows.items():
+                if dataset is None:
+                    # cached datasets are already processed
+                    datasets[dataset_type] = self.cached_partitions[dataset_type].pop(workload, pd.DataFrame())
+                elif len(dataset) == 0:
+                    datasets[dataset_type] = dataset
+                else:
+                    datasets[dataset_type] = self.dataset_loader.process_dataset(dataset_type=dataset_type,
+                                                                                 dataset=dataset)
+            yield workload, datasets
+
+    def start_stage(self, stage: Callable[[Iterator], Iterator], inputs: Iterator) -> queue.Queue:
+        """
+        Run a stage in its own thread.
+
+        :param stage: stage generator function
+        :param inputs: input of the stage
+        :return: bounded queue of the stage outputs (ends with self.end, or the exception raised by the stage)
+        """
+        outputs = queue.Queue(maxsize=self.buffer_size)
+
+        def put(item) -> bool:
+            # give up if the consumer is gone
+            while not self.stop_event.is_set():
+                try:
+                    outputs.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def run():
+            try:
+                for item in stage(inputs):
+                    if not put(item):
+                        return
+                put(self.end)
+            except BaseException as error:
+                put(error)
+
+        threading.Thread(target=run, daemon=True).start()
+        return outputs
+
+    def drain(self, outputs: queue.Queue) -> Iterator:
+        """
+        :param outputs: queue of a stage (check start_stage)
+        :return: items of the queue, until its end (an exception raised by the stage is raised here)
+        """
+        while not self.stop_event.is_set():
+            try:
+                item = outputs.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is self.end:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def __iter__(self) -> Iterator[Tuple[str, Dict[DatasetType, pd.DataFrame]]]:
+        """
+        :return: (Workload, {DatasetType -> dataset}) of each partition
+        """
+        self.stop_event.clear()
+        plan = self.plan()
+
+        read_outputs = self.start_stage(self.read_partitions, plan)
+        process_outputs = self.start_stage(self.process_partitions, self.drain(read_outputs))
+        try:
+            yield from self.drain(process_outputs)
+        finally:
+            self.stop_event.set()  # stop the stages if the consumer stopped early
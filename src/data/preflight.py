@@ -0,0 +1,158 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+from typing import List, Optional
+import pandas as pd
+from data.csv_reader import CsvReader
+from data.dataset_type import DatasetType
+from data.activity_reader import ActivityReader
+from data.file_index import FileIndex
+from data.result_source import ResultSource
+from data.ingest_error import IngestError
+from data.ingest_report import IngestReport
+from data.system_config_parser import SystemConfigParser
+from data.topology_config_parser import TopologyConfigParser
+
+
+class Preflight:
+    def __init__(self, csv_dir: str = '../result',
+                 system_dir: str = '../inputs/system',
+                 topology_dir: str = '../inputs/network/analytical',
+                 file_index: Optional[FileIndex] = None):
+        """
+        Initialize Preflight instance.
+        Preflight checks, without loading any measurement, that every result file can be ingested:
+        every run name parses, and every system and topology file it references exists and parses.
+        Only the RunName column of csv files is read (activity traces are checked by filename).
+
+        :param csv_dir: path to directory that contains result csv files
+        :param system_dir: path to directory that contains system .txt files
+        :param topology_dir: path to directory that contains topology .json configs
+        :param file_index: FileIndex of csv_dir to find files with (default: a new, not persisted one)
+        """
+        self.csv_dir = csv_dir
+        self.file_index = file_index if file_index is not None else FileIndex(dir=csv_dir)
+        self.system_config_parser = SystemConfigParser(dir=system_dir, exit_on_error=False)
+        self.topology_config_parser = TopologyConfigParser(dir=topology_dir, exit_on_error=False)
+
+        # checked system/topology name -> problem (None if fine)
+        self.system_problems = dict()
+        self.topology_problems = dict()
+
+    @staticmethod
+    def read_run_names(source):
+        """
+        :param source: opened csv file (check ResultSource.open)
+        :return: unique run names of the file (RunName column only is read), or the error if unreadable
+        """
+        try:
+            return pd.read_csv(source, usecols=['RunName'])['RunName'].dropna().unique()
+        except (ValueError, pd.errors.ParserError, UnicodeDecodeError) as error:
+            return error
+
+    @staticmethod
+    def check_run_name(run_name: str) -> Optional[str]:
+        """
+        :param run_name: run name (check CsvReader.parse_run_name)
+        :return: problem with run_name, or None if it parses
+        """
+        run_name_split = run_name.split('-')
+        if len(run_name_split) < 14:
+            return f"Malformed run name '{run_name}' ({len(run_name_split)} fields, expected 14)."
+
+        expected_keys = {0: 'run', 2: 'workload', 4: 'system', 6: 'network', 8: 'commscale', 10: 'unitscount', 12: 'passes'}
+        for index, key in expected_keys.items():
+            if run_name_split[index] != key:
+                return f"Malformed run name '{run_name}' (field {index} is '{run_name_split[index]}', expected '{key}')."
+
+        try:
+            int(run_name_split[9])
+            int(run_name_split[13].split('_')[0])
+            [int(units) for units in run_name_split[11].split(' ')]
+        except ValueError:
+            return f"Malformed run name '{run_name}' (non-integer comm scale, units count or passes)."
+
+        return None
+
+    def check_system(self, name: str) -> Optional[str]:
+        """
+        :param name: system name (without .txt)
+        :return: problem with the system file, or None if it loads
+        """
+        if name not in self.system_problems:
+            try:
+                self.system_config_parser.load_system(name=name)
+                self.system_problems[name] = None
+            except IngestError as error:
+                self.system_problems[name] = str(error)
+
+        return self.system_problems[name]
+
+    def check_topology(self, name: str) -> Optional[str]:
+        """
+        :param name: topology name (without .json)
+        :return: problem with the topology file, or None if it loads
+        """
+        if name not in self.topology_problems:
+            try:
+                self.topology_config_parser.load_topology(name=name)
+                self.topology_problems[name] = None
+            except IngestError as error:
+                self.topology_problems[name] = str(error)
+
+        return self.topology_problems[name]
+
+    def check_run_names(self, file_path: str, run_names: List[str], report: IngestReport):
+        """
+        Check run names, and the system and topology files they reference.
+
+        :param file_path: file the run names come from
+        :param run_names: run names to check
+        :param report: IngestReport to add problems into
+        """
+        problems = list()  # (in order, each problem once per file)
+        for run_name in run_names:
+            problem = self.check_run_name(run_name)
+            if problem is not None:
+                problems.append(problem)
+                continue
+
+            config = ActivityReader.parse_run_name(run_name)
+            problems.append(self.check_system(config['System']))
+            problems.append(self.check_topology(config['Topology']))
+
+        for problem in dict.fromkeys(problems):
+            if problem is not None:
+                report.add(path=file_path, stage='preflight', reason=problem)
+
+    def run(self, report: Optional[IngestReport] = None) -> IngestReport:
+        """
+        Check every result csv file and activity trace inside csv_dir.
+
+        :param report: IngestReport to add problems into (default: a new one)
+        :return: report
+        """
+        if report is None:
+            report = IngestReport()
+
+        # result csv files: read the RunName column only
+        for dataset_type in DatasetType:
+            filename = CsvReader.filename_to_load(dataset_type)
+            file_paths = self.file_index.find_files(match=lambda name: name == filename)
+            for file_path, run_names in zip(file_paths, ResultSource().read_files(paths=file_paths,
+                                                                               read=self.read_run_names)):
+                if isinstance(run_names, Exception):
+                    report.add(path=file_path, stage='preflight',
+                               reason=f"Unreadable csv file ({type(run_names).__name__}: {run_names}).")
+                    continue
+
+                self.check_run_names(file_path=file_path, run_names=[str(name) for name in run_names], report=report)
+
+        # activity traces: run name is the filename
+        for file_path in self.file_index.find_files(match=ActivityReader.is_activity_file):
+            self.check_run_names(file_path=file_path, run_names=[ResultSource.logical_name(os.path.basename(file_path)).strip()], report=report)
+
+        return report
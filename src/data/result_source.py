@@ -0,0 +1,191 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import io
+import os
+import gzip
+import tarfile
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ResultSource:
+    # tar archives whose members are read in place (.tar.zst requires the zstandard package)
+    archive_suffixes = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz', '.tar.zst', '.tzst')
+
+    def __init__(self, workers: int = 8):
+        """
+        Instantiate a new ResultSource instance.
+        ResultSource reads result files from the directory tree, from individually compressed files (.gz),
+        and from the members of tar archives, without extracting them to disk.
+
+        Archive members have virtual paths: the archive path followed by the member path
+        (e.g., ../result/sweep.tar.gz/row1/backend_end_to_end.csv), as listed by FileIndex.
+        Compressed tar archives are a single stream: the members of one archive are extracted in one
+        sequential pass, and decompression runs in parallel across archives and compressed files.
+
+        :param workers: number of threads reading (and decompressing) files
+        """
+        self.workers = workers
+
+    @staticmethod
+    def is_archive(filename: str) -> bool:
+        """
+        :param filename: filename to check
+        :return: True if the file is a tar archive (check archive_suffixes)
+        """
+        return filename.endswith(ResultSource.archive_suffixes)
+
+    @staticmethod
+    def logical_name(filename: str) -> str:
+        """
+        :param filename: filename (e.g., backend_end_to_end.csv.gz)
+        :return: filename without its compression suffix (e.g., backend_end_to_end.csv),
+                 which is matched by the same rules as uncompressed files
+        """
+        return filename[:-len('.gz')] if filename.endswith('.gz') and not ResultSource.is_archive(filename) \
+            else filename
+
+    @staticmethod
+    def split_path(path: str) -> Tuple[Optional[str], str]:
+        """
+        :param path: file path, or virtual path of an archive member
+        :return: (archive path, member path) of an archive member, or (None, path) of a file
+        """
+        components = path.split(os.sep)
+        for i, component in enumerate(components[:-1]):
+            if ResultSource.is_archive(component):
+                archive_path = os.sep.join(components[:i + 1])
+                if os.path.isfile(archive_path):
+                    return archive_path, '/'.join(components[i + 1:])
+
+        return None, path
+
+    @staticmethod
+    def open_archive(archive_path: str) -> tarfile.TarFile:
+        """
+        :param archive_path: tar archive
+        :return: TarFile, opened for sequential reading
+        """
+        if archive_path.endswith(('.tar.zst', '.tzst')):
+            try:
+                import zstandard
+            except ImportError:
+                raise tarfile.ReadError(f"Reading {archive_path} requires the zstandard package.")
+            stream = zstandard.ZstdDecompressor().stream_reader(open(archive_path, 'rb'), closefd=True)
+            return tarfile.open(fileobj=stream, mode='r|')
+
+        return tarfile.open(archive_path, mode='r|*')
+
+    @staticmethod
+    def list_archive(archive_path: str) -> List[Tuple[str, int, float]]:
+        """
+        :param archive_path: tar archive
+        :return: (member path, size, mtime) of every regular file inside the archive
+        """
+        with ResultSource.open_archive(archive_path) as archive:
+            return [(os.path.normpath(member.name), member.size, float(member.mtime))
+                    for member in archive if member.isfile()]
+
+    @staticmethod
+    def decompress(name: str, data: bytes) -> bytes:
+        """
+        :param name: name of the file data was read from
+        :param data: file contents
+        :return: decompressed contents (if name is an individually compressed file)
+        """
+        return gzip.decompress(data) if name.endswith('.gz') else data
+
+    @staticmethod
+    def open(path: str):
+        """
+        Open a single file (reading an archive member scans its archive: prefer read_files for many members).
+
+        :param path: file path, or virtual path of an archive member
+        :return: what pd.read_csv reads: the path of a file (compression is inferred from its name),
+                 or the decompressed contents of an archive member (io.BytesIO)
+        """
+        archive_path, member = ResultSource.split_path(path)
+        if archive_path is None:
+            return path
+
+        return io.BytesIO(ResultSource.extract_members(archive_path, [member])[member])
+
+    @staticmethod
+    def extract_members(archive_path: str, members: List[str]) -> Dict[str, bytes]:
+        """
+        Extract members in a single sequential pass over the archive.
+
+        :param archive_path: tar archive
+        :param members: member paths to extract
+        :return: member path -> decompressed contents
+        """
+        remaining = set(members)
+        contents = dict()
+        with ResultSource.open_archive(archive_path) as archive:
+            for member in archive:
+                name = os.path.normpath(member.name)
+                if name not in remaining:
+                    continue
+
+                contents[name] = ResultSource.decompress(name, archive.extractfile(member).read())
+                remaining.discard(name)
+                if len(remaining) == 0:
+                    break
+
+        if len(remaining) > 0:
+            raise FileNotFoundError(f"{sorted(remaining)[0]} not found inside {archive_path}.")
+
+        return contents
+
+    def read_files(self, paths: List[str], read: Union[Callable, List[Callable]]) -> list:
+        """
+        Read files in parallel: every file, and every archive (one pass), is read on its own thread,
+        and every extracted archive member is then parsed on its own thread.
+
+        :param paths: file paths, or virtual paths of archive members
+        :param read: function that parses a file, given what pd.read_csv reads (check open),
+                     or one such function per path
+        :return: result of read for every path (same order)
+        """
+        reads = read if isinstance(read, list) else [read] * len(paths)
+
+        archives = dict()  # archive path -> {member -> index into paths}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [None] * len(paths)
+            for index, path in enumerate(paths):
+                archive_path, member = self.split_path(path)
+                if archive_path is None:
+                    futures[index] = executor.submit(reads[index], path)
+                else:
+                    archives.setdefault(archive_path, dict())[member] = index
+
+            def read_archive(archive_path: str, members: Dict[str, int]) -> list:
+                contents = self.extract_members(archive_path, list(members))
+                return [(members[member], executor.submit(reads[members[member]], io.BytesIO(data)))
+                        for member, data in contents.items()]
+
+            # (archive tasks only submit parse tasks, they don't wait for them)
+            archive_futures = [executor.submit(read_archive, archive_path, members)
+                               for archive_path, members in archives.items()]
+            for archive_future in archive_futures:
+                for index, future in archive_future.result():
+                    futures[index] = future
+
+            return [future.result() for future in futures]
+
+    def iterate_files(self, paths: List[str], read: Callable, window: int = 64) -> Iterator[Tuple[str, object]]:
+        """
+        Read files in parallel, window by window (only a window of parsed files is held in memory).
+
+        :param paths: file paths, or virtual paths of archive members (members of an archive should be
+                      consecutive, e.g., sorted: every window reads an archive once)
+        :param read: function that parses a file (check read_files)
+        :param window: number of files read at once
+        :return: (path, result of read) of every path, in order
+        """
+        for start in range(0, len(paths), window):
+            window_paths = paths[start:start + window]
+            yield from zip(window_paths, self.read_files(window_paths, read))
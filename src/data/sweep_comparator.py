@@ -0,0 +1,156 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+
+
+class SweepComparator:
+    # parsed run name columns (check CsvReader.parse_run_name)
+    run_name_keys = ['RunName', 'Workload', 'System', 'Topology', 'CommScale', 'UnitsCount', 'Passes']
+
+    # configuration columns that may differ between sweeps (shown as 'baseline -> candidate' if they do)
+    config_cols = ['IntraScheduling', 'InterScheduling', 'PhysicalTopology', 'NPUsCount']
+
+    def __init__(self, keys: Optional[List[str]] = None):
+        """
+        Initialize SweepComparator instance.
+        SweepComparator joins a baseline and a candidate dataset (BackendEndToEnd) on their run name keys,
+        and computes the delta (candidate - baseline) and ratio (candidate / baseline) of every metric.
+
+        :param keys: columns to join on (default: every parsed run name column).
+                     drop a column to compare sweeps that renamed it (e.g., drop 'System' to compare two system files).
+        """
+        self.keys = keys if keys is not None else self.run_name_keys
+
+    @staticmethod
+    def other_cols(keys: List[str]) -> List[str]:
+        """
+        :param keys: join keys
+        :return: columns carried from both sweeps: configuration columns, and run name columns not joined on
+        """
+        return SweepComparator.config_cols + [key for key in SweepComparator.run_name_keys if key not in keys]
+
+    @staticmethod
+    def metric_cols(dataset: pd.DataFrame) -> List[str]:
+        """
+        :param dataset: dataset to compare
+        :return: metric columns of dataset (CommsTime, CommsTime_BW, CommsTime_BW_Dim{d})
+        """
+        return [col for col in dataset.columns
+                if col in ('CommsTime', 'CommsTime_BW') or col.startswith('CommsTime_BW_Dim')]
+
+    def index(self, dataset: pd.DataFrame) -> pd.DataFrame:
+        """
+        Index dataset by self.keys. Rows with the same keys are averaged.
+
+        :param dataset: dataset to index
+        :return: indexed dataset (unique index)
+        """
+        indexed = dataset.set_index(self.keys)
+        if indexed.index.is_unique:
+            return indexed
+
+        aggregation = {col: 'mean' if pd.api.types.is_numeric_dtype(indexed[col]) else 'first'
+                       for col in indexed.columns}
+        return indexed.groupby(level=self.keys, sort=False).agg(aggregation)
+
+    def compare(self, baseline: pd.DataFrame, candidate: pd.DataFrame) -> pd.DataFrame:
+        """
+        Join baseline and candidate on self.keys, and compute delta and ratio of every metric.
+
+        :param baseline: baseline dataset
+        :param candidate: candidate dataset
+        :return: one row per joined key, with {metric}_Baseline, {metric}_Candidate, {metric}_Delta and
+                 {metric}_Ratio columns, and the configuration columns of both sweeps (check other_cols)
+        """
+        metrics = [col for col in self.metric_cols(baseline) if col in candidate.columns]
+        config_cols = [col for col in self.other_cols(self.keys)
+                       if col in baseline.columns and col in candidate.columns]
+        cols = metrics + config_cols
+
+        joined = self.index(baseline)[cols].join(self.index(candidate)[cols], how='inner',
+                                                 lsuffix='_Baseline', rsuffix='_Candidate')
+
+        comparison = pd.DataFrame(index=joined.index)
+        for metric in metrics:
+            baseline_values = joined[f'{metric}_Baseline'].to_numpy(dtype=float)
+            candidate_values = joined[f'{metric}_Candidate'].to_numpy(dtype=float)
+
+            comparison[f'{metric}_Baseline'] = baseline_values
+            comparison[f'{metric}_Candidate'] = candidate_values
+            comparison[f'{metric}_Delta'] = candidate_values - baseline_values
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ratio = candidate_values / baseline_values
+            comparison[f'{metric}_Ratio'] = np.where(np.isfinite(ratio), ratio, np.nan)
+
+        for col in config_cols:
+            comparison[f'{col}_Baseline'] = joined[f'{col}_Baseline']
+            comparison[f'{col}_Candidate'] = joined[f'{col}_Candidate']
+
+        return comparison.reset_index()
+
+    @staticmethod
+    def unmatched(baseline: pd.DataFrame, candidate: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+        """
+        :param baseline: baseline dataset
+        :param candidate: candidate dataset
+        :param keys: join keys
+        :return: keys found in only one of the sweeps, with a 'Sweep' column ('baseline' or 'candidate')
+        """
+        keys_found = pd.concat([baseline[keys].drop_duplicates().assign(Sweep='baseline'),
+                                candidate[keys].drop_duplicates().assign(Sweep='candidate')], ignore_index=True)
+
+        return keys_found.drop_duplicates(subset=keys, keep=False).reset_index(drop=True)
+
+    @staticmethod
+    def rank(comparison: pd.DataFrame, metric: str = 'CommsTime') -> pd.DataFrame:
+        """
+        Rank comparison rows from the worst regression to the best improvement.
+        CommsTime is worse when higher, bandwidth utilizations (CommsTime_BW...) when lower.
+
+        :param comparison: result of compare()
+        :param metric: metric to rank by (its ratio)
+        :return: ranked comparison, with a 'Rank' column (1: worst regression)
+        """
+        higher_is_worse = not metric.startswith('CommsTime_BW')
+        ranked = comparison.sort_values(by=f'{metric}_Ratio', ascending=not higher_is_worse,
+                                        na_position='last', kind='mergesort')
+        ranked.insert(0, 'Rank', np.arange(1, len(ranked) + 1))
+
+        return ranked.reset_index(drop=True)
+
+    @staticmethod
+    def delta_dataset(comparison: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+        """
+        Create a dataset shaped like the compared datasets (so that the existing plot families can draw it),
+        where every metric column holds its delta (candidate - baseline).
+        Configuration columns (and run name columns not joined on) that differ between the sweeps
+        read 'baseline -> candidate'.
+
+        :param comparison: result of compare()
+        :param keys: join keys
+        :return: delta dataset
+        """
+        delta = comparison[keys].copy()
+
+        for col in comparison.columns:
+            if col.endswith('_Delta'):
+                delta[col[:-len('_Delta')]] = comparison[col]
+
+        for col in SweepComparator.other_cols(keys):
+            if f'{col}_Baseline' not in comparison.columns:
+                continue
+            baseline_values = comparison[f'{col}_Baseline']
+            candidate_values = comparison[f'{col}_Candidate']
+            if (baseline_values == candidate_values).all():
+                delta[col] = candidate_values
+            else:
+                delta[col] = baseline_values.astype(str).where(
+                    baseline_values == candidate_values,
+                    baseline_values.astype(str) + ' -> ' + candidate_values.astype(str))
+
+        return delta
@@ -4,16 +4,19 @@ LICENSE file in the root directory of this source tree.
 """
 
 import os
+from data.ingest_error import IngestError
 
 
 class SystemConfigParser:
-    def __init__(self, dir: str = '../../inputs/system'):
+    def __init__(self, dir: str = '../../inputs/system', exit_on_error: bool = True):
         """
         Instantiate a SystemConfigParser instance.
 
         :param dir: path to directory that contains all the system config .txt files
+        :param exit_on_error: if True, exit when a system file is missing. if False, raise IngestError.
         """
         self.dir = dir
+        self.exit_on_error = exit_on_error
         self.system_name = None
         self.chunks_count = None
         self.intra_scheduling = None
@@ -50,6 +53,8 @@ class SystemConfigParser:
                         elif key == 'inter-dimension-scheduling':
                             self.inter_scheduling = value
         except FileNotFoundError:
+            if not self.exit_on_error:
+                raise IngestError(f"System file {name} not found in {self.dir}.")
             print(f"System file {name} not found in {self.dir}.")
             exit(-1)
 
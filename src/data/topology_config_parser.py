@@ -6,16 +6,20 @@ LICENSE file in the root directory of this source tree.
 import os
 import json
 import numpy as np
+import pandas as pd
+from data.ingest_error import IngestError
 
 
 class TopologyConfigParser:
-    def __init__(self, dir: str = '../../inputs/network/analytical'):
+    def __init__(self, dir: str = '../../inputs/network/analytical', exit_on_error: bool = True):
         """
         Initialize TopologyConfigParser instance.
 
         :param dir: directory that contains all the .json configurations
+        :param exit_on_error: if True, exit when a topology file is missing. if False, raise IngestError.
         """
         self.dir = dir
+        self.exit_on_error = exit_on_error
         self.topology_name = None
         self.loaded_topology = None
         self.links_count = None
@@ -41,8 +45,14 @@ class TopologyConfigParser:
                 # simple validity check
                 assert self.links_count.size == self.links_bandwidth.size, "links-count and links-bandwidth length mismatch"
         except FileNotFoundError:
+            if not self.exit_on_error:
+                raise IngestError(f"Network file {name} not found in {self.dir}.")
             print(f"Network file {name} not found.")
             exit(-1)
+        except (ValueError, KeyError, AssertionError) as error:
+            if not self.exit_on_error:
+                raise IngestError(f"Network file {name} is malformed ({type(error).__name__}: {error}).")
+            raise
 
     def get_topology_name(self):
         """
@@ -77,3 +87,35 @@ class TopologyConfigParser:
         assert self.topology_name is not None, "Topology not loaded."
 
         return np.sum(self.links_count * self.links_bandwidth)
+
+    def get_units_count(self):
+        """
+        :return: units count of every dimension
+        """
+        assert self.topology_name is not None, "Topology not loaded."
+
+        return np.array(list(map(int, self.loaded_topology['units-count'])))
+
+    def topology_table(self, names) -> pd.DataFrame:
+        """
+        Load every topology once, for vectorized (whole-dataset) computations.
+
+        :param names: topology config file names (repetitions are loaded once)
+        :return: one row per topology (indexed by name), with the UnitsCount (NPUs count across all the dimensions,
+                 NaN if units-count is missing),
+                 Bandwidth (accumulated) and Bandwidth_Dim{d} (NaN beyond the topology's dimensions) columns, in MB/us
+        """
+        rows = dict()
+        for name in pd.unique(pd.Series(names, dtype=object)):
+            self.load_topology(name=name)
+            try:
+                units_count = int(np.prod(self.get_units_count()))
+            except (KeyError, ValueError):
+                units_count = np.nan  # no (valid) units-count: unknown NPUs count
+            row = {'UnitsCount': units_count,
+                   'Bandwidth': self.accumulated_bandwidth() * 1024 / 1e6}  # MB/us
+            for dim in range(len(self.links_bandwidth)):
+                row[f'Bandwidth_Dim{dim}'] = self.get_bandwidth_at_dim(dim=dim) * 1024 / 1e6  # MB/us
+            rows[name] = row
+
+        return pd.DataFrame.from_dict(rows, orient='index')
@@ -3,93 +3,394 @@ This source code is licensed under the MIT license found in the
 LICENSE file in the root directory of this source tree.
 """
 
+import os
+import argparse
+from typing import List, Optional
 from data.dataset_type import DatasetType
-from data.dataset_loader import DatasetLoader
-from plot.plot_controller import PlotController
-from plot.commstime_commscale import commstime_commscale
-from plot.commstimebw_commscale import commstimebw_commscale
-from plot.commstimebwdim_commscale import commstimebwdim_commscale
-from plot.commstimechunk_topology import commstimechunk_topology
-from plot.commstime_topology import commstime_topology
-from plot.commstime_cost import commstime_cost
-from helper.directory_manager import DirectoryManager
-from plot.plotter import Plotter
+from helper.argument_helper import add_path_arguments, add_filter_arguments, create_dataset_filter, \
+    get_system_dir, get_topology_dir, add_shard_argument, create_shard_manifest, create_file_index
+from export_kpis import add_kpi_format_argument, create_kpi_tables, write_kpi_tables
+from plot.plot_family import PLOT_FAMILIES, required_columns
 
 
-def main():
+# plot families (each one is drawn into its own {output_dir}/{family} directory, check plot_family.py)
+FAMILIES = [plot_family.name for plot_family in PLOT_FAMILIES]
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """
+    Add draw.py arguments to parser.
+
+    :param parser: parser to add arguments to
+    """
+    add_path_arguments(parser)
+    add_filter_arguments(parser)
+    parser.add_argument('--family', type=str, nargs='+', default=None, choices=FAMILIES,
+                        help='only draw these plot families')
+    parser.add_argument('--bundle', action='store_true',
+                        help='append plots into one multi-page pdf (with a json page index) per plot family and workload, '
+                             'instead of writing one pdf file per plot')
+    parser.add_argument('--archive', type=str, default=None,
+                        help='write every plot into this archive (.zip or .tar[.gz|.bz2|.xz]) '
+                             'instead of the output directory tree')
+    parser.add_argument('--background-writer', action='store_true',
+                        help='encode and write plots in a background thread while drawing the next one')
+    parser.add_argument('--density-threshold', type=int, default=None,
+                        help='draw plots with more points than this as density images '
+                             '(rasterized layer, vector axes) instead of one marker per point')
+    parser.add_argument('--formats', type=str, nargs='+', default=['pdf'],
+                        help='file formats to write each plot in, from a single draw pass (e.g., pdf png svg)')
+    parser.add_argument('--preview', action='store_true',
+                        help='only write low-resolution png thumbnails and a preview.html contact sheet')
+    parser.add_argument('--preview-dpi', type=float, default=30,
+                        help='resolution of the preview thumbnails (default: 30)')
+    parser.add_argument('--preview-sample', type=int, default=None,
+                        help='in preview mode, only draw (at most) this many random rows '
+                             'per (RunName, PhysicalTopology, CommScale, DimensionIndex) of each plot')
+    parser.add_argument('--cache-dir', type=str, default=None,
+                        help='use the datasets cached in this directory (see the ingest command), if any')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='draw plots in this many worker processes '
+                             '(datasets are shared with the workers through shared memory, not copied)')
+    parser.add_argument('--threads', type=int, default=1,
+                        help='draw plots in this many threads of this process '
+                             '(figures are independent, and encoding runs in parallel)')
+    parser.add_argument('--timings-file', type=str, default=None,
+                        help='persist the drawing time of every plot into this file: with --workers, '
+                             'plots predicted to be the longest (from the previous runs) are drawn first')
+    parser.add_argument('--stream', action='store_true',
+                        help='load and draw one workload at a time: the next workloads are read and processed '
+                             'while the current one is drawn, and memory only holds a few workloads '
+                             '(not with --cache-dir: cached datasets are loaded whole, then split by workload)')
+    parser.add_argument('--stream-buffer', type=int, default=1,
+                        help='in stream mode, number of workloads buffered between the read, process, '
+                             'and draw stages (default: 1)')
+    parser.add_argument('--kpis', action='store_true',
+                        help='also write KPI tables (per Workload, RunName, Passes, CommScale, PhysicalTopology) '
+                             'into {output_dir}/kpi')
+    add_kpi_format_argument(parser)
+    add_shard_argument(parser)
+
+
+def load_dataset(dataset_type: DatasetType, args: argparse.Namespace, file_index=None,
+                 columns: Optional[List[str]] = None):
+    """
+    Load a dataset from the dataset cache if cached (from the same csv files, check DatasetCache),
+    or from the result csv files if not.
+    Only the rows that pass the dataset filter arguments are loaded.
+
+    :param dataset_type: DatasetType to load
+    :param args: parsed arguments (check add_path_arguments and add_filter_arguments).
+                 if args.cache_dir is None, always read csv files.
+    :param file_index: FileIndex of the result directory to find csv files with (default: create one from args)
+    :param columns: if set, only read and compute these metric columns from the csv files (check DatasetLoader)
+    :return: loaded and processed dataset
+    """
+    from data.dataset_cache import DatasetCache
+    from data.dataset_loader import DatasetLoader
+
+    dataset_filter = create_dataset_filter(args)
+
+    dataset_loader = DatasetLoader(csv_dir=args.result_dir,
+                                   system_dir=get_system_dir(args),
+                                   topology_dir=get_topology_dir(args),
+                                   dataset_filter=dataset_filter,
+                                   file_index=file_index if file_index is not None else create_file_index(args),
+                                   columns=columns)
+
+    # use the cached dataset only if it was loaded from the same files (and versions)
+    cache_dir = getattr(args, 'cache_dir', None)
+    if cache_dir is not None:
+        dataset_cache = DatasetCache(dir=cache_dir)
+        reason = dataset_cache.check(dataset_type=dataset_type,
+                                     manifest=DatasetCache.create_manifest(dataset_type=dataset_type,
+                                                                           dataset_loader=dataset_loader))
+        if reason is None:
+            return dataset_filter.apply(dataset_cache.load(dataset_type))
+        if dataset_cache.exists(dataset_type):
+            print(f"Ignoring cached {dataset_type.name} ({reason}): reading csv files. Run ingest to refresh the cache.")
+
+    return dataset_loader.load_dataset(dataset_type=dataset_type)
+
+
+def create_plot_jobs():
+    """
+    :return: every plot job, as (family, dataset type, Plotter.plot arguments): grid plots first, then breakdown plots
+    """
+    grid_jobs = [(plot_family.name, plot_family.dataset_type, plot_family.grid_job())
+                 for plot_family in PLOT_FAMILIES if plot_family.grid_over is not None]
+    breakdown_jobs = [(plot_family.name, plot_family.dataset_type, plot_family.breakdown_job())
+                      for plot_family in PLOT_FAMILIES]
+
+    return grid_jobs + breakdown_jobs
+
+
+def render_columns(args: argparse.Namespace) -> Optional[List[str]]:
+    """
+    :param args: parsed arguments (check add_arguments)
+    :return: metric columns the selected plot families read (None: every column, e.g., for the KPI tables)
+    """
+    if getattr(args, 'kpis', False):
+        return None
+
+    return required_columns(FAMILIES if args.family is None else args.family)
+
+
+def render(args: argparse.Namespace, datasets: Optional[dict] = None, changed_rows: Optional[dict] = None):
+    """
+    Draw the selected plot families.
+
+    :param args: parsed arguments (check add_arguments)
+    :param datasets: already loaded datasets (DatasetType -> pd.DataFrame). missing ones are loaded.
+    :param changed_rows: if set (DatasetType -> pd.DataFrame), only re-draw the plots whose slice
+                         contains one of these rows, and keep every other plot in the output directory.
+    """
+    # plotting libraries are heavy: import them only when rendering
+    from plot.plot_controller import PlotController
+    from helper.pdf_bundle_manager import PdfBundleManager
+    from sink.sink_factory import create_output_sink
+    from plot.output_mode import OutputMode
+    from plot.plotter import Plotter
+    from data.pareto_frontier import ParetoFrontier
+    from data.alpha_beta_fit import AlphaBetaFit
+    from helper.contact_sheet import ContactSheet
+    from data.chunk_latency_cube import ChunkLatencyCube
+    from data.dim_metric_store import DimMetricStore
+    from plot.render_pool import RenderPool
+    from helper.render_timings import RenderTimings
+    from data.partition_stream import PartitionStream
+    from data.dataset_loader import DatasetLoader
+    from data.dataset_cache import DatasetCache
+    import pandas as pd
+    from concurrent.futures import ThreadPoolExecutor
+
+    # plot jobs: (family, dataset type, Plotter.plot arguments)
+    plot_jobs = create_plot_jobs()
+
+    # select plot families
+    families = FAMILIES if args.family is None else args.family
+    plot_jobs = [plot_job for plot_job in plot_jobs if plot_job[0] in families]
+
+    # sharded rendering: shards share the output directory, and can't share bundles
+    shard_manifest = create_shard_manifest(args, name='render')
+    sharded = shard_manifest is not None and shard_manifest.shard_count > 1
+    assert not (sharded and args.bundle), "Bundles can't be split across shards: --bundle requires a single shard."
+    workers = getattr(args, 'workers', 1)
+    assert workers <= 1 or (args.archive is None and not args.bundle), \
+        "Worker processes write plain files: --workers requires no --archive and no --bundle."
+    threads = getattr(args, 'threads', 1)
+    assert threads <= 1 or (workers <= 1 and not args.bundle), \
+        "Bundle pages are appended in order: --threads requires no --bundle (and no --workers)."
+    PlotController.set_shard_manifest(shard_manifest=shard_manifest)
+
+    # drawing times of previous runs (and partitions) predict the drawing time of the next plots
+    render_timings = RenderTimings(path=getattr(args, 'timings_file', None))
+    PlotController.set_render_timings(render_timings=render_timings)
+
     # Run plot pre_aesthetics
     PlotController.set_pre_aesthetics()
+    PlotController.set_density_threshold(density_threshold=args.density_threshold)
+
+    # set output sink and mode
+    sink = create_output_sink(top_directory=args.output_dir, archive_path=args.archive,
+                              background=args.background_writer)
+    PlotController.set_output_sink(sink=sink)
+
+    contact_sheet = None
+    sample_per_stratum = None
+    if args.preview:
+        contact_sheet = ContactSheet() if not sharded \
+            else ContactSheet(filename=f'preview-{shard_manifest.shard_index}-of-{shard_manifest.shard_count}.html')
+        sample_per_stratum = args.preview_sample
+        PlotController.set_output_formats(formats=['png'], dpi=args.preview_dpi, contact_sheet=contact_sheet)
+    else:
+        PlotController.set_output_formats(formats=args.formats)
+
+    pdf_bundle_manager = None
+    if args.bundle and not args.preview:
+        pdf_bundle_manager = PdfBundleManager(sink=sink)
+        PlotController.set_output_mode(output_mode=OutputMode.Bundle, pdf_bundle_manager=pdf_bundle_manager)
+
+    # load (only the required) datasets: at once, or one Workload partition at a time (--stream)
+    # (the result directory tree is only scanned once, on the first dataset loaded from csv files)
+    # only the columns the selected families read are read from csv files and computed
+    file_index = create_file_index(args)
+    columns = render_columns(args)
+    dataset_types = sorted(set(plot_job[1] for plot_job in plot_jobs), key=lambda x: x.value)
+    stream = getattr(args, 'stream', False)
+    assert not (stream and (datasets is not None or changed_rows is not None)), \
+        "Streaming only renders datasets loaded from the result directory (or cache)."
+    if stream:
+        partitions = PartitionStream(dataset_loader=DatasetLoader(csv_dir=args.result_dir,
+                                                                  system_dir=get_system_dir(args),
+                                                                  topology_dir=get_topology_dir(args),
+                                                                  dataset_filter=create_dataset_filter(args),
+                                                                  file_index=file_index,
+                                                                  columns=columns),
+                                     dataset_types=dataset_types,
+                                     dataset_cache=DatasetCache(dir=args.cache_dir) if args.cache_dir else None,
+                                     buffer_size=args.stream_buffer)
+    else:
+        loaded = dict()
+        for dataset_type in dataset_types:
+            if datasets is not None and dataset_type in datasets:
+                loaded[dataset_type] = datasets[dataset_type]
+            else:
+                loaded[dataset_type] = load_dataset(dataset_type=dataset_type, args=args, file_index=file_index,
+                                                    columns=columns)
+        partitions = [(None, loaded)]
+
+    # create top directory
+    # (when re-drawing a filtered or changed subset, or a shard, keep the other plots already in the directories)
+    reset_if_exist = create_dataset_filter(args).is_empty() and changed_rows is None and not sharded
+    sink.create_top_directory(reset_if_exist=False)
+
+    # plots can be drawn in threads: figures don't share pyplot state (check FigureStyle)
+    thread_pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='render') if threads > 1 else None
+
+    frontier_tables = list()
+    alpha_beta_tables = list()
+    kpi_tables = list()
+    for partition_workload, partition_datasets in partitions:
+        if partition_workload is not None:
+            print(f"Rendering partition [Workload: {partition_workload}].")
+
+        # prepare plotters (datasets without rows, e.g., a workload without layer-wise results, are skipped)
+        plotters = {dataset_type: Plotter(dataset=dataset) for dataset_type, dataset in partition_datasets.items()
+                    if len(dataset) > 0}
+        partition_jobs = [plot_job for plot_job in plot_jobs if plot_job[1] in plotters]
+
+        # KPI tables (configurations don't span workloads: partition tables are concatenated)
+        if getattr(args, 'kpis', False):
+            kpi_tables.append(create_kpi_tables(partition_datasets))
+
+        # create subdirectories
+        workloads = set()
+        for dataset_type, plotter in plotters.items():
+            if changed_rows is None:
+                workloads.update(plotter.dataset['Workload'].unique())
+            elif dataset_type in changed_rows:
+                workloads.update(changed_rows[dataset_type]['Workload'].unique())
+        for workload in sorted(workloads):
+            for family in families:
+                # grid directories
+                sink.create_subdirectory(path=f'{family}/{workload}', reset_if_exist=reset_if_exist)
+
+                # breakdown directories (bundles are written in the workload directory)
+                if not args.bundle or args.preview:
+                    sink.create_subdirectory(path=f'{family}/{workload}/breakdown', reset_if_exist=reset_if_exist)
+
+        # Pareto frontier of the CommsTime - Cost plots
+        if 'CommsTime_Cost' in families and DatasetType.BackendEndToEnd in plotters:
+            pareto_frontier = ParetoFrontier(x='Cost', y='CommsTime', group_over=['Workload', 'Passes', 'CommScale'])
+            end_to_end_dataset = plotters[DatasetType.BackendEndToEnd].dataset
+            end_to_end_dataset['ParetoOptimal'] = pareto_frontier.mark(end_to_end_dataset)
+            frontier_tables.append(pareto_frontier.frontier(end_to_end_dataset).drop(columns='ParetoOptimal'))
+
+        # alpha-beta models of the CommsTime - CommScale plots
+        # (one model per plotted series; Workload is a group key: partitions fit whole groups)
+        if 'CommsTime_CommScale' in families and DatasetType.BackendEndToEnd in plotters:
+            alpha_beta_fit = AlphaBetaFit(x='CommScale', y='CommsTime')
+            end_to_end_dataset = plotters[DatasetType.BackendEndToEnd].dataset
+            alpha_beta_table = alpha_beta_fit.fit(end_to_end_dataset)
+            end_to_end_dataset['CommsTime_Fit'] = alpha_beta_fit.predict(end_to_end_dataset, table=alpha_beta_table)
+            alpha_beta_tables.append(alpha_beta_table)
+
+        # per-dimension bandwidth utilizations: when they are drawn and mostly empty (e.g., many-dimension
+        # topologies next to 2-dimension ones), keep the populated cells only and drop the wide columns
+        bw_dim_store = None
+        if 'CommsTimeBwDim_CommScale' in families and DatasetType.BackendEndToEnd in plotters:
+            end_to_end_dataset = plotters[DatasetType.BackendEndToEnd].dataset.reset_index(drop=True)
+            bw_dim_cols = DimMetricStore.wide_cols(end_to_end_dataset, prefix='CommsTime_BW_Dim')
+            store = DimMetricStore.from_wide(end_to_end_dataset, prefix='CommsTime_BW_Dim')
+            if store.nbytes < end_to_end_dataset[bw_dim_cols].memory_usage(index=False).sum():
+                bw_dim_store = store
+                end_to_end_dataset = end_to_end_dataset.drop(columns=bw_dim_cols)
+                plotters[DatasetType.BackendEndToEnd] = Plotter(dataset=end_to_end_dataset)
+                partition_datasets[DatasetType.BackendEndToEnd] = end_to_end_dataset
+
+        # layer-wise chunk latencies, aggregated once for every CommsTimeChunk_Topology plot
+        shared_objects = dict()
+        if bw_dim_store is not None:
+            shared_objects['bw_dim_store'] = bw_dim_store
+            partition_jobs = [(family, dataset_type, dict(plot_args, plot_kwargs=dict(bw_dim_store=bw_dim_store))
+                               if family == 'CommsTimeBwDim_CommScale' else plot_args)
+                              for family, dataset_type, plot_args in partition_jobs]
+        if 'CommsTimeChunk_Topology' in families and DatasetType.BackendLayerWise in plotters:
+            chunk_latency_cube = ChunkLatencyCube(dataset=plotters[DatasetType.BackendLayerWise].dataset)
+            shared_objects['chunk_latency_cube'] = chunk_latency_cube
+            partition_jobs = [(family, dataset_type,
+                               dict(plot_args, plot_kwargs=dict(chunk_latency_cube=chunk_latency_cube))
+                               if family == 'CommsTimeChunk_Topology' else plot_args)
+                              for family, dataset_type, plot_args in partition_jobs]
+
+        # worker processes map the (final) datasets from shared memory, and get the precomputed objects once
+        render_pool = None
+        if workers > 1:
+            render_pool = RenderPool(datasets={dataset_type.name: plotter.dataset
+                                               for dataset_type, plotter in plotters.items()},
+                                     workers=workers, top_directory=args.output_dir, shared_objects=shared_objects)
+
+        # plot required figures
+        futures = list()
+        try:
+            for family, dataset_type, plot_args in partition_jobs:
+                only_slices = None
+                if changed_rows is not None:
+                    if dataset_type not in changed_rows:
+                        continue
+                    only_slices = changed_rows[dataset_type][plot_args['plot_over']].drop_duplicates()
+
+                futures += plotters[dataset_type].plot(path=os.path.join(args.output_dir, family),
+                                                       sample_per_stratum=sample_per_stratum, only_slices=only_slices,
+                                                       render_pool=render_pool, thread_pool=thread_pool, **plot_args)
+            for future in futures:
+                future.result()  # raises the errors of the plots drawn in threads
+        finally:
+            if render_pool is not None:
+                render_pool.close()  # waits for every plot, and frees the shared datasets
+
+    if thread_pool is not None:
+        thread_pool.shutdown(wait=True)
+
+    # Pareto frontier table of the CommsTime - Cost plots
+    if len(frontier_tables) > 0:
+        frontier_path = os.path.join(args.output_dir, 'CommsTime_Cost', 'frontier.csv')
+        frontier_table = pd.concat(frontier_tables, ignore_index=True)
+        sink.write_bytes(path=frontier_path, data=frontier_table.to_csv(index=False).encode())
+
+    # alpha-beta table of the CommsTime - CommScale plots
+    if len(alpha_beta_tables) > 0:
+        alpha_beta_path = os.path.join(args.output_dir, 'CommsTime_CommScale', 'alpha_beta.csv')
+        alpha_beta_table = pd.concat(alpha_beta_tables, ignore_index=True)
+        sink.write_bytes(path=alpha_beta_path, data=alpha_beta_table.to_csv(index=False).encode())
+
+    # KPI tables of every partition
+    if len(kpi_tables) > 0:
+        names = dict.fromkeys(name for tables in kpi_tables for name in tables)
+        write_kpi_tables(tables={name: pd.concat([tables[name] for tables in kpi_tables if name in tables],
+                                                 ignore_index=True) for name in names},
+                         sink=sink, formats=args.kpi_formats)
+
+    # finish bundles and pending writes
+    if pdf_bundle_manager is not None:
+        pdf_bundle_manager.close()
+    if contact_sheet is not None:
+        sink.flush()
+        contact_sheet.write(sink=sink)
+    if shard_manifest is not None:
+        sink.flush()  # the manifest is written last: every output it lists is complete
+        shard_manifest.write(sink=sink)
+    sink.close()
+    render_timings.save()
+
+
+def main():
+    # parse arguments
+    parser = argparse.ArgumentParser(description='Draw ASTRA-sim result plots.')
+    add_arguments(parser)
 
-    # load dataset
-    dataset_loader = DatasetLoader(csv_dir='../result/',
-                                   system_dir='../inputs/system',
-                                   topology_dir='../inputs/network/analytical')
-    backend_end_to_end_dataset = dataset_loader.load_dataset(dataset_type=DatasetType.BackendEndToEnd)
-    backend_layerwise_dataset = dataset_loader.load_dataset(dataset_type=DatasetType.BackendLayerWise)
-
-    # prepare plotter
-    end_to_end_plotter = Plotter(dataset=backend_end_to_end_dataset)
-    layerwise_plotter = Plotter(dataset=backend_layerwise_dataset)
-
-    # create top directory and subdirectories
-    directory_manager = DirectoryManager(top_directory='../graph')
-    directory_manager.create_top_directory(reset_if_exist=False)
-    for workload in backend_end_to_end_dataset['Workload'].unique():
-        # grid directories
-        directory_manager.create_subdirectory(path=f'CommsTime_CommScale/{workload}', reset_if_exist=True)
-        directory_manager.create_subdirectory(path=f'CommsTime_Topology/{workload}', reset_if_exist=True)
-        directory_manager.create_subdirectory(path=f'CommsTime_Cost/{workload}', reset_if_exist=True)
-        directory_manager.create_subdirectory(path=f'CommsTimeBW_CommScale/{workload}', reset_if_exist=True)
-        directory_manager.create_subdirectory(path=f'CommsTimeBwDim_CommScale/{workload}', reset_if_exist=True)
-        directory_manager.create_subdirectory(path=f'CommsTimeChunk_Topology/{workload}', reset_if_exist=True)
-
-        # breakdown directories
-        directory_manager.create_subdirectory(path=f'CommsTime_CommScale/{workload}/breakdown', reset_if_exist=True)
-        directory_manager.create_subdirectory(path=f'CommsTime_Topology/{workload}/breakdown', reset_if_exist=True)
-        directory_manager.create_subdirectory(path=f'CommsTime_Cost/{workload}/breakdown', reset_if_exist=True)
-        directory_manager.create_subdirectory(path=f'CommsTimeBW_CommScale/{workload}/breakdown', reset_if_exist=True)
-        directory_manager.create_subdirectory(path=f'CommsTimeBwDim_CommScale/{workload}/breakdown', reset_if_exist=True)
-        directory_manager.create_subdirectory(path=f'CommsTimeChunk_Topology/{workload}/breakdown', reset_if_exist=True)
-
-    # plot required figures
-    # grid plots
-    end_to_end_plotter.plot(plot_over=['Passes', 'Workload', 'CommScale'],
-                            grid_over='RunName',
-                            plot_fun=commstime_topology,
-                            path='../graph/CommsTime_Topology')
-    layerwise_plotter.plot(plot_over=['Passes', 'Workload', 'CommScale'],
-                            grid_over='RunName',
-                            plot_fun=commstimechunk_topology,
-                            path='../graph/CommsTimeChunk_Topology')
-
-    # breakdown plots
-    end_to_end_plotter.plot(plot_over=['RunName', 'Passes', 'Workload'],
-                            grid_over=None,
-                            plot_fun=commstime_commscale,
-                            path='../graph/CommsTime_CommScale')
-    end_to_end_plotter.plot(plot_over=['RunName', 'Passes', 'Workload', 'CommScale'],
-                            grid_over=None,
-                            plot_fun=commstime_topology,
-                            path='../graph/CommsTime_Topology')
-    end_to_end_plotter.plot(plot_over=['Passes', 'Workload', 'CommScale'],
-                            grid_over=None,
-                            plot_fun=commstime_cost,
-                            path='../graph/CommsTime_Cost')
-    end_to_end_plotter.plot(plot_over=['RunName', 'Passes', 'Workload'],
-                            grid_over=None,
-                            plot_fun=commstimebw_commscale,
-                            path='../graph/CommsTimeBW_CommScale',
-                            tight_axis=True)
-    end_to_end_plotter.plot(plot_over=['RunName', 'Passes', 'Workload', 'PhysicalTopology'],
-                            plot_fun=commstimebwdim_commscale,
-                            grid_over=None,
-                            path='../graph/CommsTimeBwDim_CommScale',
-                            tight_axis=True)
-    layerwise_plotter.plot(plot_over=['RunName', 'Passes', 'Workload', 'CommScale'],
-                           grid_over=None,
-                           plot_fun=commstimechunk_topology,
-                           path='../graph/CommsTimeChunk_Topology',
-                           tight_axis=True)
+    render(args=parser.parse_args())
 
 
 if __name__ == '__main__':
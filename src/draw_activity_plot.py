@@ -4,135 +4,179 @@ LICENSE file in the root directory of this source tree.
 """
 
 import os
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
-from helper.directory_manager import DirectoryManager
-from data.system_config_parser import SystemConfigParser
-
-
-def parse_run_name(run_name: str):
-    # runname example: run-equal-workload-microAllReduce.txt-system-ring_ring.txt-network-ring64_ring64.json-commscale-2-unitscount-4 4-passes-10
-    #   c.f., Run_name index breakdown
-    #       1: main run name (e.g., row14)
-    #       3: workload (e.g., microAllReduce.txt)
-    #       5: system (e.g., ring_direct_switch.txt)
-    #       7: topology (e.g., tRing_nDirect_ppSwitch.json)
-    #       9: comm scale (e.g., 2)
-    #       11: units count (2.g., 4 4) <- split by whitespace
-    #       13: passes count (e.g., 10)
-
-    # populate parse_dict
-    parse_dict = dict()
-
-    # split run name
-    run_name_split = run_name.split('-')
-
-    # create rows as required
-    parse_dict['RunName'] = run_name_split[1]
-    parse_dict['Workload'] = run_name_split[3].split('.')[0]
-    parse_dict['System'] = run_name_split[5].split('.')[0]
-    parse_dict['Topology'] = run_name_split[7].split('.')[0]
-    parse_dict['CommScale'] = int(run_name_split[9])
-    parse_dict['UnitsCount'] = run_name_split[11].replace(" ", "_")
-    parse_dict['Passes'] = int(run_name_split[13].split("_")[0])
-
-    # add new columns
-    parse_dict['NPUsCount'] = [np.prod(list(map(int, uc))) for uc in parse_dict['UnitsCount'].split('_')]
-    parse_dict['PhysicalTopology'] = parse_dict['Topology'] + " (" + parse_dict['UnitsCount'] + ')'
-
-    return parse_dict
+import argparse
+from helper.argument_helper import add_path_arguments, add_filter_arguments, create_dataset_filter, get_system_dir, \
+    add_shard_argument, create_shard_manifest, create_file_index
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """
+    Add draw_activity_plot.py arguments to parser.
+
+    :param parser: parser to add arguments to
+    """
+    add_path_arguments(parser)
+    add_filter_arguments(parser)
+    parser.add_argument('--archive', type=str, default=None,
+                        help='write every plot into this archive (.zip or .tar[.gz|.bz2|.xz]) '
+                             'instead of the output directory tree')
+    parser.add_argument('--background-writer', action='store_true',
+                        help='encode and write plots in a background thread while drawing the next one')
+    parser.add_argument('--density-threshold', type=int, default=None,
+                        help='draw traces with more samples than this as density images '
+                             '(rasterized layer, vector axes) instead of lines')
+    add_shard_argument(parser)
+
+
+def graph_filenames(file_paths, result_dir: str) -> dict:
+    """
+    :param file_paths: paths of the activity traces
+    :param result_dir: directory the traces were found in
+    :return: file path -> plot filename. traces that would share a filename (e.g., the same trace name
+             in two result subdirectories) are told apart by their directory relative to result_dir
+    """
+    from data.activity_reader import ActivityReader
+
+    filenames = dict()
+    for file_path in file_paths:
+        config = ActivityReader.parse_run_name(os.path.basename(file_path).strip())
+        filenames[file_path] = f"{config['Workload']}_{config['RunName']}_" \
+                               f"{config['PhysicalTopology'].replace(' ', '_')}_{config['CommScale']}mb_" \
+                               f"{config['Passes']}pass"
+
+    counts = dict()
+    for filename in filenames.values():
+        counts[filename] = counts.get(filename, 0) + 1
+
+    for file_path, filename in filenames.items():
+        relative_dir = os.path.dirname(os.path.relpath(file_path, result_dir))
+        if counts[filename] > 1 and relative_dir != '':
+            filename += '_' + relative_dir.replace(os.sep, '_').replace(' ', '_')
+        filenames[file_path] = filename + '.pdf'
+
+    return filenames
+
+
+def draw_activity(args: argparse.Namespace):
+    """
+    Draw the activity-time plot of every activity trace.
+
+    :param args: parsed arguments (check add_arguments)
+    """
+    # plotting libraries are heavy: import them only when drawing
+    import seaborn as sns
+    from plot.figure_style import FigureStyle
+    from sink.sink_factory import create_output_sink
+    from plot.density_renderer import DensityRenderer
+    from data.activity_reader import ActivityReader
+    from data.result_source import ResultSource
+    from data.system_config_parser import SystemConfigParser
 
-
-def main():
     # directory to search
-    csv_dir = '../result'
+    csv_dir = args.result_dir
 
     # parser
-    system_config_parser = SystemConfigParser(dir='../inputs/system/')
+    system_config_parser = SystemConfigParser(dir=get_system_dir(args))
+
+    # sharded rendering: traces are assigned to shards by their path relative to the result directory
+    shard_manifest = create_shard_manifest(args, name='activity')
+    sharded = shard_manifest is not None and shard_manifest.shard_count > 1
 
     # create directory
-    top_dir = '../graph'
-    directory_manager = DirectoryManager(top_directory=top_dir)
-    directory_manager.create_top_directory(reset_if_exist=False)
-    directory_manager.create_subdirectory(path='activity', reset_if_exist=True)
-
-    # iterate recursively inside self.dir to find files
-    for dirpath, _, filenames in os.walk(top=csv_dir):
-        for filename in filenames:
-            if not filename.endswith('.csv') or not filename.startswith('run-'):
-                continue
-
-            # status
-            print(f"Drawing {filename}")
-
-            # matching file found: load and parse
-            # parse information
-            config = parse_run_name(filename.strip())
-            system_config_parser.load_system(name=config['System'])
-            config['IntraScheduling'] = system_config_parser.get_intra_scheduling()
-            config['InterScheduling'] = system_config_parser.get_inter_scheduling()
-
-            # load file
-            file_path = os.path.join(dirpath, filename)
-            dataset = pd.read_csv(file_path)
-
-            # parse dataset and reset index
-            dataset.dropna(how='all', inplace=True)
-            dataset.reset_index(drop=True, inplace=True)
-
-            for col in dataset.columns:
-                if col.startswith('Unnamed'):
-                    del dataset[col]
-
-            # rename dataset
-            dataset.rename(columns=lambda name: 'time' if name.strip().startswith('time') else name,
-                           inplace=True)
-            dataset.rename(columns=lambda name: name.strip().split(' ')[0] if name.strip().startswith('dim') else name,
-                           inplace=True)
-
-            # melt dataset
-            activity_cols = [col for col in dataset.columns if col.startswith('dim')]
-            dataset = dataset.melt(id_vars='time', value_vars=activity_cols,
-                                   var_name='dim', value_name='activity')
-
-            # draw plot
-            # aesthetics pre-update
-            sns.set(font_scale=1.5)
-            sns.set_style('ticks')
-
-            # lineplot
-            fig, ax = plt.subplots(nrows=1, ncols=1)
+    # (when re-drawing a filtered subset or a shard, keep the other plots already in the directory)
+    dataset_filter = create_dataset_filter(args)
+    top_dir = args.output_dir
+    sink = create_output_sink(top_directory=top_dir, archive_path=args.archive,
+                              background=args.background_writer)
+    sink.create_top_directory(reset_if_exist=False)
+    sink.create_subdirectory(path='activity', reset_if_exist=dataset_filter.is_empty() and not sharded)
+
+    # find activity traces
+    activity_reader = ActivityReader(dir=csv_dir, file_index=create_file_index(args))
+
+    # traces to draw (by this shard)
+    all_file_paths = activity_reader.find_activity_files(dataset_filter=dataset_filter)
+    filenames = graph_filenames(all_file_paths, result_dir=csv_dir)
+    slice_keys = {file_path: shard_manifest.create_slice_key(family='activity', plot_over=['File'],
+                                                             values=(os.path.relpath(file_path, csv_dir),))
+                  for file_path in all_file_paths} if shard_manifest is not None else dict()
+    file_paths = [file_path for file_path in all_file_paths
+                  if shard_manifest is None or shard_manifest.owns(slice_keys[file_path])]
+
+    # traces are read (and decompressed, or extracted from archives) ahead, in parallel
+    for file_path, dataset in ResultSource().iterate_files(paths=file_paths, read=ActivityReader.parse_activity):
+        filename = os.path.basename(file_path)
+
+        if shard_manifest is not None:
+            shard_manifest.begin(slice_keys[file_path])
+
+        # status
+        print(f"Drawing {filename}")
+
+        # matching file found: load and parse
+        # parse information
+        config = activity_reader.parse_run_name(filename.strip())
+        system_config_parser.load_system(name=config['System'])
+        config['IntraScheduling'] = system_config_parser.get_intra_scheduling()
+        config['InterScheduling'] = system_config_parser.get_inter_scheduling()
+
+        # melt dataset
+        activity_cols = [col for col in dataset.columns if col.startswith('dim')]
+        dataset = dataset.melt(id_vars='time', value_vars=activity_cols,
+                               var_name='dim', value_name='activity')
+
+        # draw plot
+        # aesthetics pre-update
+        FigureStyle.install()
+
+        # lineplot
+        fig, ax = FigureStyle.create_figure(nrows=1, ncols=1)
+        if args.density_threshold is not None and len(dataset) > args.density_threshold:
+            DensityRenderer().draw(ax=ax, data=dataset, x='time', y='activity', hue='dim')
+        else:
             sns.lineplot(data=dataset,
                          x='time', y='activity',
                          hue='dim',
                          ax=ax)
 
-            # aesthetics post-update
-            fig.set_size_inches((14, 7))
+        # aesthetics post-update
+        fig.set_size_inches((14, 7))
+
+        title = f"{config['Workload']} ({config['RunName']})" \
+                f"\nTopology: {config['PhysicalTopology']}" \
+                f"\nCommScale: {config['CommScale']} MB" \
+                f"\nPass: {config['Passes']}" \
+                f"\nScheduling: (intra: {config['IntraScheduling']}, inter: {config['InterScheduling']})"
+        fig.suptitle(title)
+
+        ax.set_ylim((-5, 105))
 
-            title = f"{config['Workload']} ({config['RunName']})" \
-                    f"\nTopology: {config['PhysicalTopology']}" \
-                    f"\nCommScale: {config['CommScale']} MB" \
-                    f"\nPass: {config['Passes']}" \
-                    f"\nScheduling: (intra: {config['IntraScheduling']}, inter: {config['InterScheduling']})"
-            fig.suptitle(title)
+        ax.set_xlabel('Time (us)')
+        ax.set_ylabel('Activity (%)')
 
-            ax.set_ylim((-5, 105))
+        # save plot
+        graph_file_path = os.path.join(top_dir, 'activity', filenames[file_path])
 
-            ax.set_xlabel('Time (us)')
-            ax.set_ylabel('Activity (%)')
+        fig.tight_layout()
+        sink.save_figure(fig=fig, path=graph_file_path)
 
-            # save plot
-            graph_filename = f"{config['Workload']}_{config['RunName']}_{config['PhysicalTopology'].replace(' ', '_')}_{config['CommScale']}mb_{config['Passes']}pass.pdf"
-            graph_file_path = os.path.join(top_dir, 'activity', graph_filename)
+        if shard_manifest is not None:
+            shard_manifest.add_output(sink.relative_path(graph_file_path))
+            shard_manifest.end()
+
+    # finish pending writes
+    if shard_manifest is not None:
+        sink.flush()  # the manifest is written last: every output it lists is complete
+        shard_manifest.write(sink=sink)
+    sink.close()
+
+
+def main():
+    # parse arguments
+    parser = argparse.ArgumentParser(description='Draw activity-time plots of each dimension.')
+    add_arguments(parser)
 
-            fig.tight_layout()
-            # fig.show()
-            fig.savefig(graph_file_path)
-            fig.clf()
-            plt.close(fig=fig)
+    draw_activity(args=parser.parse_args())
 
 
 if __name__ == '__main__':
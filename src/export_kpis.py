@@ -0,0 +1,111 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+import argparse
+from typing import List
+from data.dataset_type import DatasetType
+from helper.argument_helper import add_path_arguments, add_filter_arguments, create_file_index
+
+
+# KPI tables: name -> (dataset type, KpiTable method name)
+KPI_TABLES = {'kpi_end_to_end': (DatasetType.BackendEndToEnd, 'end_to_end'),
+              'kpi_chunk_latency': (DatasetType.BackendLayerWise, 'chunk_latency'),
+              'kpi_alpha_beta': (DatasetType.BackendEndToEnd, 'alpha_beta')}
+
+KPI_FORMATS = ['csv', 'parquet']
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """
+    Add export_kpis.py arguments to parser.
+
+    :param parser: parser to add arguments to
+    """
+    add_path_arguments(parser)
+    add_filter_arguments(parser)
+    add_kpi_format_argument(parser)
+    parser.add_argument('--cache-dir', type=str, default=None,
+                        help='use the datasets cached in this directory (see the ingest command), if any')
+
+
+def add_kpi_format_argument(parser: argparse.ArgumentParser):
+    """
+    Add the KPI table formats argument to parser.
+
+    :param parser: parser to add arguments to
+    """
+    parser.add_argument('--kpi-formats', type=str, nargs='+', default=KPI_FORMATS, choices=KPI_FORMATS,
+                        help='file formats of the KPI tables (default: csv parquet; '
+                             'parquet requires pyarrow or fastparquet)')
+
+
+def create_kpi_tables(datasets: dict) -> dict:
+    """
+    :param datasets: DatasetType -> dataset (missing or empty datasets are skipped)
+    :return: KPI table name -> table (check KpiTable)
+    """
+    from data.kpi_table import KpiTable
+
+    tables = dict()
+    for name, (dataset_type, method) in KPI_TABLES.items():
+        dataset = datasets.get(dataset_type)
+        if dataset is not None and len(dataset) > 0:
+            tables[name] = getattr(KpiTable, method)(dataset)
+
+    return tables
+
+
+def write_kpi_tables(tables: dict, sink, formats: List[str]) -> List[str]:
+    """
+    Write KPI tables into the kpi/ directory of sink.
+
+    :param tables: KPI table name -> table
+    :param sink: OutputSink to write with
+    :param formats: file formats (check KPI_FORMATS)
+    :return: paths written
+    """
+    from data.kpi_table import KpiTable
+
+    sink.create_subdirectory(path='kpi', reset_if_exist=False)
+
+    written = list()
+    for name, table in tables.items():
+        written += KpiTable.write(table=table, path=os.path.join(sink.top_directory, 'kpi', name),
+                                  formats=formats, sink=sink)
+
+    return written
+
+
+def export_kpis(args: argparse.Namespace):
+    """
+    Load the datasets and write their KPI tables, without drawing any plot.
+
+    :param args: parsed arguments (check add_arguments)
+    """
+    import draw
+    from sink.sink_factory import create_output_sink
+
+    file_index = create_file_index(args)
+    datasets = {dataset_type: draw.load_dataset(dataset_type=dataset_type, args=args, file_index=file_index)
+                for dataset_type in DatasetType}
+
+    sink = create_output_sink(top_directory=args.output_dir)
+    sink.create_top_directory(reset_if_exist=False)
+    for path in write_kpi_tables(tables=create_kpi_tables(datasets), sink=sink, formats=args.kpi_formats):
+        print(f"Wrote {path}.")
+    sink.close()
+
+
+def main():
+    # parse arguments
+    parser = argparse.ArgumentParser(description='Export KPI tables of ASTRA-sim results.')
+    add_arguments(parser)
+
+    export_kpis(args=parser.parse_args())
+
+
+if __name__ == '__main__':
+    main()
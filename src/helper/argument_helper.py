@@ -0,0 +1,113 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+import argparse
+
+
+def add_path_arguments(parser: argparse.ArgumentParser):
+    """
+    Add input/output root arguments to parser.
+
+    :param parser: parser to add arguments to
+    """
+    parser.add_argument('--result-dir', type=str, default='../result',
+                        help='directory that contains the ASTRA-sim result files (default: ../result)')
+    parser.add_argument('--inputs-dir', type=str, default='../inputs',
+                        help='ASTRA-sim inputs directory, with system/ and network/analytical/ (default: ../inputs)')
+    parser.add_argument('--output-dir', type=str, default='../graph',
+                        help='directory to write plots into (default: ../graph)')
+    parser.add_argument('--file-index', type=str, default=None,
+                        help='persist the index of the result directory tree into this file, '
+                             'so that later runs only re-list the directories that changed')
+
+
+def get_system_dir(args: argparse.Namespace) -> str:
+    """
+    :param args: parsed arguments (check add_path_arguments)
+    :return: directory that contains system .txt files
+    """
+    return os.path.join(args.inputs_dir, 'system')
+
+
+def get_topology_dir(args: argparse.Namespace) -> str:
+    """
+    :param args: parsed arguments (check add_path_arguments)
+    :return: directory that contains topology .json configs
+    """
+    return os.path.join(args.inputs_dir, 'network', 'analytical')
+
+
+def create_file_index(args: argparse.Namespace):
+    """
+    :param args: parsed arguments (check add_path_arguments)
+    :return: FileIndex of the result directory
+    """
+    from data.file_index import FileIndex
+
+    return FileIndex(dir=args.result_dir, index_path=args.file_index)
+
+
+def add_filter_arguments(parser: argparse.ArgumentParser):
+    """
+    Add dataset filter arguments to parser.
+
+    :param parser: parser to add arguments to
+    """
+    parser.add_argument('--workload', type=str, nargs='+', default=None,
+                        help='only use these workloads')
+    parser.add_argument('--run-name', type=str, nargs='+', default=None,
+                        help='only use these run names')
+    parser.add_argument('--comm-scale', type=int, nargs='+', default=None,
+                        help='only use these comm scales (MB)')
+    parser.add_argument('--topology', type=str, nargs='+', default=None,
+                        help='only use these topologies (Topology or PhysicalTopology)')
+
+
+def create_dataset_filter(args: argparse.Namespace):
+    """
+    :param args: parsed arguments (check add_filter_arguments)
+    :return: DatasetFilter built from the arguments
+    """
+    from data.dataset_filter import DatasetFilter
+
+    return DatasetFilter(workloads=args.workload,
+                         run_names=args.run_name,
+                         comm_scales=args.comm_scale,
+                         topologies=args.topology)
+
+
+def add_shard_argument(parser: argparse.ArgumentParser):
+    """
+    Add sharded rendering argument to parser.
+
+    :param parser: parser to add arguments to
+    """
+    def parse_shard(spec: str):
+        from helper.shard_manifest import ShardManifest
+
+        try:
+            return ShardManifest.parse_shard(spec)
+        except ValueError as error:
+            raise argparse.ArgumentTypeError(f"invalid shard '{spec}' (expected i/N, 0 <= i < N): {error}")
+
+    parser.add_argument('--shard', type=parse_shard, default=None, metavar='i/N',
+                        help='only draw the plots of shard i (0-based) out of N, and write a {command}-manifest-i-of-N.json '
+                             'of the outputs and drawing times (merge them with the merge-manifests command)')
+
+
+def create_shard_manifest(args: argparse.Namespace, name: str):
+    """
+    :param args: parsed arguments (check add_shard_argument)
+    :param name: name of the sharded command (e.g., 'render')
+    :return: ShardManifest of the selected shard, or None if not sharded
+    """
+    from helper.shard_manifest import ShardManifest
+
+    if args.shard is None:
+        return None
+
+    shard_index, shard_count = args.shard
+    return ShardManifest(name=name, shard_index=shard_index, shard_count=shard_count)
@@ -0,0 +1,53 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+import html
+
+
+class ContactSheet:
+    def __init__(self, filename: str = 'preview.html'):
+        """
+        Initialize ContactSheet instance.
+        ContactSheet collects preview thumbnails and writes an html page that shows all of them.
+
+        :param filename: contact sheet filename (written in the top directory of the sink)
+        """
+        self.filename = filename
+        self.entries = list()  # (relative path, title)
+
+    def add(self, relative_path: str, title: str):
+        """
+        Add a thumbnail.
+
+        :param relative_path: thumbnail path, relative to the top directory
+        :param title: plot title
+        """
+        self.entries.append((relative_path, title))
+
+    def write(self, sink):
+        """
+        Write the contact sheet (thumbnails grouped by their directory).
+
+        :param sink: OutputSink the thumbnails were written into
+        """
+        sections = dict()
+        for relative_path, title in sorted(self.entries):
+            sections.setdefault(os.path.dirname(relative_path), list()).append((relative_path, title))
+
+        lines = ['<!DOCTYPE html>',
+                 '<html><head><meta charset="utf-8"><title>Preview</title>',
+                 '<style>figure { display: inline-block; margin: 4px; vertical-align: top; } '
+                 'figcaption { font: 11px sans-serif; white-space: pre-line; max-width: 320px; }</style>',
+                 '</head><body>']
+        for section, entries in sections.items():
+            lines.append(f'<h2>{html.escape(section)}</h2>')
+            for relative_path, title in entries:
+                src = html.escape(relative_path, quote=True)
+                lines.append(f'<figure><a href="{src}"><img src="{src}" loading="lazy"></a>'
+                             f'<figcaption>{html.escape(title)}</figcaption></figure>')
+        lines.append('</body></html>')
+
+        sink.write_bytes(path=os.path.join(sink.top_directory, self.filename), data='\n'.join(lines).encode())
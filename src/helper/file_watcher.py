@@ -0,0 +1,118 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+import time
+from typing import Dict, List, Set, Tuple
+
+
+class FileWatcher:
+    def __init__(self, dirs: List[str], debounce: float = 2.0, poll_interval: float = 5.0):
+        """
+        Initialize FileWatcher instance.
+        FileWatcher blocks until files inside dirs change, and reports which ones changed.
+        Uses inotify (inotify_simple package) to wake up if available, and polling if not.
+        Bursts of changes are debounced: a change is only reported once dirs stay quiet for `debounce` seconds.
+
+        :param dirs: directories to watch (recursively)
+        :param debounce: quiet time (seconds) that ends a burst of changes
+        :param poll_interval: polling interval (seconds) when inotify is not available
+        """
+        self.dirs = dirs
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.snapshot = self.take_snapshot()
+
+        try:
+            import inotify_simple
+            self.inotify_flags = inotify_simple.flags
+            self.inotify = inotify_simple.INotify()
+            self.watched_dirs = set()
+            self.add_inotify_watches()
+        except (ImportError, OSError):
+            # inotify not available: poll
+            self.inotify = None
+
+    def take_snapshot(self) -> Dict[str, Tuple[int, float]]:
+        """
+        :return: path -> (size, mtime) of every file inside self.dirs
+        """
+        snapshot = dict()
+        for top in self.dirs:
+            for dirpath, _, filenames in os.walk(top=top):
+                for filename in filenames:
+                    file_path = os.path.join(dirpath, filename)
+                    try:
+                        stat = os.stat(file_path)
+                    except FileNotFoundError:
+                        continue  # removed while walking
+                    snapshot[file_path] = (stat.st_size, stat.st_mtime)
+
+        return snapshot
+
+    def add_inotify_watches(self):
+        """
+        Watch every (new) directory inside self.dirs.
+        """
+        flags = self.inotify_flags
+        mask = flags.CREATE | flags.CLOSE_WRITE | flags.MOVED_TO | flags.MOVED_FROM | flags.DELETE | flags.MODIFY
+        for top in self.dirs:
+            for dirpath, _, _ in os.walk(top=top):
+                if dirpath not in self.watched_dirs:
+                    self.inotify.add_watch(dirpath, mask)
+                    self.watched_dirs.add(dirpath)
+
+    def wait_for_activity(self, timeout: float) -> bool:
+        """
+        :param timeout: seconds to wait
+        :return: True if something (possibly) changed within timeout
+        """
+        if self.inotify is None:
+            time.sleep(timeout)
+            return self.take_snapshot() != self.snapshot
+
+        events = self.inotify.read(timeout=int(timeout * 1000))
+        if len(events) > 0:
+            self.add_inotify_watches()  # new subdirectories
+
+        return len(events) > 0
+
+    def wait(self) -> Set[str]:
+        """
+        Block until files change (and then stay quiet for self.debounce seconds).
+
+        :return: paths of created, modified or deleted files
+        """
+        while True:
+            # wait for the first change
+            while not self.wait_for_activity(timeout=self.poll_interval):
+                pass
+
+            # debounce: wait until the burst ends
+            while self.still_changing():
+                pass
+
+            # report changes
+            snapshot = self.take_snapshot()
+            changed = {path for path in set(snapshot) | set(self.snapshot)
+                       if snapshot.get(path) != self.snapshot.get(path)}
+            self.snapshot = snapshot
+
+            if len(changed) > 0:
+                return changed
+
+    def still_changing(self) -> bool:
+        """
+        Debounce step.
+
+        :return: True if files changed during the last self.debounce seconds
+        """
+        if self.inotify is not None:
+            return self.wait_for_activity(timeout=self.debounce)
+
+        before = self.take_snapshot()
+        time.sleep(self.debounce)
+
+        return self.take_snapshot() != before
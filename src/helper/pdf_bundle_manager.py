@@ -0,0 +1,82 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+import json
+from typing import Optional
+import numpy as np
+from matplotlib.backends.backend_pdf import PdfPages
+from sink.output_sink import OutputSink
+from sink.directory_sink import DirectorySink
+
+
+class PdfBundleManager:
+    def __init__(self, bundle_name: str = 'bundle', sink: Optional[OutputSink] = None):
+        """
+        Initialize PdfBundleManager instance.
+        PdfBundleManager appends figures into a single multi-page pdf per directory,
+        and writes a json page index next to it.
+
+        :param bundle_name: bundle filename (without extension)
+        :param sink: OutputSink to write bundles into (default: plain directory)
+        """
+        self.bundle_name = bundle_name
+        self.sink = sink if sink is not None else DirectorySink()
+        self.bundles = dict()  # dir_path -> PdfPages
+        self.streams = dict()  # dir_path -> file object the PdfPages writes into
+        self.indices = dict()  # dir_path -> list of page entries
+
+    def append(self, dir_path: str, filename: str, fig, title: str, config: dict):
+        """
+        Append a figure to the bundle of dir_path.
+
+        :param dir_path: directory that holds the bundle (e.g., {path}/{Workload})
+        :param filename: filename the figure would have had in the one-file-per-plot mode
+        :param fig: matplotlib figure to append
+        :param title: title of the figure
+        :param config: configurations of the figure, recorded in the page index
+        """
+        if dir_path not in self.bundles:
+            bundle_path = self.bundle_path(dir_path)
+            self.streams[dir_path] = self.sink.open(bundle_path)
+            self.bundles[dir_path] = PdfPages(self.streams[dir_path])
+            self.indices[dir_path] = list()
+
+        # pages are appended in order by the sink (possibly in its background writer thread)
+        bundle = self.bundles[dir_path]
+        self.sink.submit(lambda: bundle.savefig(fig))
+
+        self.indices[dir_path].append({
+            'page': len(self.indices[dir_path]) + 1,
+            'filename': filename,
+            'title': title,
+            'config': {key: value.item() if isinstance(value, np.generic) else value
+                       for key, value in config.items()},
+        })
+
+    def bundle_path(self, dir_path: str) -> str:
+        """
+        :param dir_path: directory that holds the bundle
+        :return: path of the bundle pdf
+        """
+        return os.path.join(dir_path, self.bundle_name) + '.pdf'
+
+    def close(self):
+        """
+        Close every bundle and write their page indices.
+        """
+        self.sink.flush()
+
+        for dir_path, bundle in self.bundles.items():
+            bundle.close()
+            self.streams[dir_path].close()
+
+            index_path = os.path.join(dir_path, self.bundle_name) + '.json'
+            index = json.dumps(self.indices[dir_path], indent=2)
+            self.sink.write_bytes(path=index_path, data=index.encode())
+
+        self.bundles.clear()
+        self.streams.clear()
+        self.indices.clear()
@@ -0,0 +1,132 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+import json
+import heapq
+import threading
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+
+class RenderTimings:
+    version = 1
+
+    def __init__(self, path: Optional[str] = None, max_samples: int = 256):
+        """
+        Instantiate a new RenderTimings instance.
+        RenderTimings keeps the drawing time and slice size (rows) of the plots drawn by previous runs,
+        per job kind (plot family, grid or breakdown plots), and fits a linear cost model
+        (seconds = intercept + slope x rows) of every kind to predict the drawing time of the next plots.
+
+        :param path: file to persist the timings into (None: don't persist)
+        :param max_samples: number of (latest) timings kept per job kind
+        """
+        self.path = path
+        self.max_samples = max_samples
+        self.samples: Dict[str, List[Tuple[int, float]]] = dict()  # job kind -> [(rows, seconds)]
+        self.models: Optional[Dict[str, Tuple[float, float]]] = None  # job kind -> (intercept, slope)
+        self.lock = threading.Lock()  # plots can be drawn (and timed) from several threads
+        self.load()
+
+    @staticmethod
+    def job_kind(family: str, grid_over: Optional[str]) -> str:
+        """
+        :param family: plot family
+        :param grid_over: grid column of the plots (None if not grid plots)
+        :return: job kind (e.g., 'CommsTime_Topology/grid')
+        """
+        return f"{family}/{'grid' if grid_over is not None else 'breakdown'}"
+
+    def load(self):
+        """
+        Load the persisted timings, if any.
+        """
+        if self.path is None or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, mode='r') as timings_file:
+                timings = json.load(timings_file)
+        except (OSError, ValueError):
+            return  # unreadable: start over
+
+        if timings.get('version') == self.version:
+            self.samples = {kind: [tuple(sample) for sample in samples]
+                            for kind, samples in timings['samples'].items()}
+
+    def save(self):
+        """
+        Persist the timings (written atomically).
+        """
+        if self.path is None:
+            return
+
+        timings_dir = os.path.dirname(self.path)
+        if timings_dir != '' and not os.path.exists(timings_dir):
+            os.makedirs(name=timings_dir)
+
+        temp_path = self.path + '.tmp'
+        with open(temp_path, mode='w') as timings_file:
+            json.dump({'version': self.version, 'samples': self.samples}, timings_file)
+        os.replace(temp_path, self.path)
+
+    def add(self, kind: str, rows: int, seconds: float):
+        """
+        Record the drawing time of a plot.
+
+        :param kind: job kind (check job_kind)
+        :param rows: rows of the plot slice
+        :param seconds: drawing time
+        """
+        with self.lock:
+            samples = self.samples.setdefault(kind, list())
+            samples.append((int(rows), round(float(seconds), 6)))
+            del samples[:-self.max_samples]
+            self.models = None  # refit
+
+    def fit(self) -> Dict[str, Tuple[float, float]]:
+        """
+        Fit the cost model of every job kind (again only if timings were added since).
+
+        :return: job kind -> (intercept, slope) of seconds = intercept + slope x rows
+        """
+        with self.lock:
+            if self.models is None:
+                self.models = dict()
+                for kind, samples in self.samples.items():
+                    rows, seconds = np.array(samples, dtype=float).T
+                    slope = 0.0
+                    if len(np.unique(rows)) > 1:
+                        slope = max(np.polyfit(rows, seconds, deg=1)[0], 0.0)  # bigger slices don't draw faster
+                    self.models[kind] = (float(np.mean(seconds) - slope * np.mean(rows)), slope)
+
+            return self.models
+
+    def predict(self, kind: str, rows: int) -> Optional[float]:
+        """
+        :param kind: job kind (check job_kind)
+        :param rows: rows of the plot slice
+        :return: predicted drawing time (None if kind was never timed)
+        """
+        model = self.fit().get(kind)
+        if model is None:
+            return None
+
+        intercept, slope = model
+        return max(intercept + slope * rows, 0.0)
+
+    @staticmethod
+    def makespan(costs: List[float], workers: int) -> float:
+        """
+        :param costs: cost of every job, in dispatch order
+        :param workers: number of workers (each job goes to the first idle worker)
+        :return: time to finish every job
+        """
+        finish_times = [0.0] * workers
+        for cost in costs:
+            heapq.heappush(finish_times, heapq.heappop(finish_times) + cost)
+
+        return max(finish_times)
@@ -0,0 +1,209 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import List, Optional, Tuple
+
+
+class ShardManifest:
+    def __init__(self, name: str = 'render', shard_index: int = 0, shard_count: int = 1):
+        """
+        Initialize ShardManifest instance.
+        ShardManifest decides which plot slices a shard draws (stable hash of the slice key),
+        and records every slice seen, and the outputs and drawing time of every slice drawn.
+        Manifests of all shards are merged (and checked for missing slices) with merge().
+
+        :param name: name of the sharded command (manifests of different commands are kept apart)
+        :param shard_index: index of this shard (0 <= shard_index < shard_count)
+        :param shard_count: number of shards
+        """
+        assert 0 <= shard_index < shard_count, f"Invalid shard {shard_index}/{shard_count}."
+
+        self.name = name
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.slice_keys = list()  # every slice seen, drawn by this shard or not
+        self.jobs = list()  # slices drawn by this shard: {key, outputs, seconds}
+        self.local = threading.local()  # slice being drawn by each thread (check current_job)
+        self.start_time = time.perf_counter()
+
+    @property
+    def current_job(self) -> Optional[dict]:
+        """
+        :return: slice being drawn by the calling thread (None if not between begin() and end())
+        """
+        return getattr(self.local, 'job', None)
+
+    @current_job.setter
+    def current_job(self, job: Optional[dict]):
+        self.local.job = job
+
+    @staticmethod
+    def parse_shard(spec: str) -> Tuple[int, int]:
+        """
+        :param spec: shard specification 'i/N' (0-based shard index i, shard count N)
+        :return: (i, N)
+        """
+        index, count = spec.split('/')
+        index, count = int(index), int(count)
+        if not 0 <= index < count:
+            raise ValueError(f"Shard index must be in [0, {count}), got {index}.")
+
+        return index, count
+
+    @staticmethod
+    def create_slice_key(family: str, plot_over: List[str], values: tuple) -> str:
+        """
+        :param family: plot family (or 'activity')
+        :param plot_over: columns the slice is defined by
+        :param values: values of plot_over
+        :return: slice key (e.g., 'CommsTime_CommScale/RunName=row1/Passes=10/Workload=microAllReduce')
+        """
+        return '/'.join([family] + [f"{col}={value}" for col, value in zip(plot_over, values)])
+
+    def shard_of(self, slice_key: str) -> int:
+        """
+        :param slice_key: slice key (check create_slice_key)
+        :return: shard that draws the slice (stable across processes and machines)
+        """
+        digest = hashlib.sha1(slice_key.encode()).digest()
+        return int.from_bytes(digest[:8], byteorder='big') % self.shard_count
+
+    def owns(self, slice_key: str) -> bool:
+        """
+        Record slice_key as seen.
+
+        :param slice_key: slice key (check create_slice_key)
+        :return: True if this shard draws the slice
+        """
+        self.slice_keys.append(slice_key)
+        return self.shard_of(slice_key) == self.shard_index
+
+    def begin(self, slice_key: str):
+        """
+        Start recording the outputs of a slice.
+
+        :param slice_key: slice key (check create_slice_key)
+        """
+        self.current_job = {'key': slice_key, 'outputs': list(), 'start': time.perf_counter()}
+
+    def add_output(self, relative_path: str):
+        """
+        Record an output file of the current slice.
+
+        :param relative_path: output path, relative to the top directory
+        """
+        if self.current_job is not None:
+            self.current_job['outputs'].append(relative_path)
+
+    def end(self):
+        """
+        Finish recording the current slice.
+        """
+        job = self.current_job
+        self.jobs.append({'key': job['key'], 'outputs': job['outputs'],
+                          'seconds': round(time.perf_counter() - job['start'], 6)})
+        self.current_job = None
+
+    def add_job(self, slice_key: str, outputs: List[str], seconds: float):
+        """
+        Record a slice drawn elsewhere (e.g., by a render worker process).
+
+        :param slice_key: slice key (check create_slice_key)
+        :param outputs: output paths, relative to the top directory
+        :param seconds: drawing time
+        """
+        self.jobs.append({'key': slice_key, 'outputs': outputs, 'seconds': round(seconds, 6)})
+
+    def filename(self) -> str:
+        """
+        :return: manifest filename of this shard
+        """
+        return f"{self.name}-manifest-{self.shard_index}-of-{self.shard_count}.json"
+
+    def to_dict(self) -> dict:
+        """
+        :return: manifest contents (json serializable)
+        """
+        slice_digest = hashlib.sha1('\n'.join(sorted(self.slice_keys)).encode()).hexdigest()
+
+        return {'name': self.name,
+                'shard_index': self.shard_index,
+                'shard_count': self.shard_count,
+                'slice_count': len(self.slice_keys),
+                'slice_digest': slice_digest,
+                'seconds': round(time.perf_counter() - self.start_time, 6),
+                'jobs': self.jobs}
+
+    def write(self, sink):
+        """
+        Write the manifest into the top directory of sink.
+
+        :param sink: OutputSink the plots were written into
+        """
+        data = json.dumps(self.to_dict(), indent=2).encode()
+        sink.write_bytes(path=os.path.join(sink.top_directory, self.filename()), data=data)
+
+    @staticmethod
+    def merge(manifests: List[dict], output_dir: Optional[str] = None) -> Tuple[dict, List[str]]:
+        """
+        Merge the manifests of all shards of a run and check that nothing is missing.
+
+        :param manifests: manifest contents (check to_dict)
+        :param output_dir: if set, also check that every recorded output exists inside this directory
+        :return: (merged manifest, list of problems found)
+        """
+        problems = list()
+        if len(manifests) == 0:
+            return dict(), ['No manifest found.']
+
+        # every shard of the run is there (exactly once)
+        shard_counts = {manifest['shard_count'] for manifest in manifests}
+        if len(shard_counts) > 1:
+            problems.append(f"Manifests of different shard counts: {sorted(shard_counts)}.")
+        shard_count = max(shard_counts)
+        shard_indices = [manifest['shard_index'] for manifest in manifests]
+        for shard_index in range(shard_count):
+            if shard_indices.count(shard_index) == 0:
+                problems.append(f"Missing manifest of shard {shard_index}/{shard_count}.")
+            elif shard_indices.count(shard_index) > 1:
+                problems.append(f"Duplicate manifests of shard {shard_index}/{shard_count}.")
+
+        # every shard saw the same slices
+        slice_digests = {manifest['slice_digest'] for manifest in manifests}
+        if len(slice_digests) > 1:
+            problems.append("Shards saw different slices (different datasets or arguments).")
+
+        # every slice was drawn exactly once
+        jobs = [job for manifest in manifests for job in manifest['jobs']]
+        drawn_keys = [job['key'] for job in jobs]
+        slice_count = manifests[0]['slice_count']
+        if len(set(drawn_keys)) != len(drawn_keys):
+            problems.append(f"{len(drawn_keys) - len(set(drawn_keys))} slices drawn more than once.")
+        if len(set(drawn_keys)) < slice_count:
+            problems.append(f"{slice_count - len(set(drawn_keys))} of {slice_count} slices not drawn.")
+
+        # every output was written
+        if output_dir is not None:
+            for job in jobs:
+                for output in job['outputs']:
+                    if not os.path.exists(os.path.join(output_dir, output)):
+                        problems.append(f"Missing output {output} ({job['key']}).")
+
+        names = {manifest['name'] for manifest in manifests}
+        if len(names) > 1:
+            problems.append(f"Manifests of different commands: {sorted(names)}.")
+
+        merged = {'name': manifests[0]['name'],
+                  'shard_count': shard_count,
+                  'slice_count': slice_count,
+                  'shard_seconds': {manifest['shard_index']: manifest['seconds'] for manifest in manifests},
+                  'jobs': sorted(jobs, key=lambda job: job['key'])}
+
+        return merged, problems
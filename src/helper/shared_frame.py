@@ -0,0 +1,106 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+from typing import List, Union
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+
+class SharedFrame:
+    def __init__(self, descriptor: dict, blocks: List[shared_memory.SharedMemory], owner: bool):
+        """
+        Initialize SharedFrame instance (use publish() or attach()).
+        SharedFrame keeps the columns of a DataFrame in shared memory blocks, one block per column,
+        so that other processes can map them without copying or pickling.
+        Numeric columns are stored as is; other columns as integer codes into a (small) category list.
+
+        :param descriptor: columns layout (check publish)
+        :param blocks: shared memory blocks, in descriptor column order
+        :param owner: if True, the blocks are unlinked on close()
+        """
+        self.descriptor = descriptor
+        self.blocks = blocks
+        self.owner = owner
+
+        # numpy views of every block
+        self.arrays = dict()
+        for (name, dtype, _, _), block in zip(descriptor['columns'], blocks):
+            self.arrays[name] = np.ndarray(shape=(descriptor['rows'],), dtype=dtype, buffer=block.buf)
+
+    @staticmethod
+    def publish(dataset: pd.DataFrame) -> 'SharedFrame':
+        """
+        Copy dataset into shared memory (once).
+
+        :param dataset: dataset to publish
+        :return: owning SharedFrame
+        """
+        columns = list()
+        blocks = list()
+        for name in dataset.columns:
+            values = dataset[name]
+            categories = None
+            if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+                array = values.to_numpy()
+            else:
+                # codes (-1: missing) into categories
+                array, categories = pd.factorize(values, sort=False)
+                categories = np.append(categories.to_numpy(dtype=object), None)
+
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(shape=array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+            columns.append((name, array.dtype.str, block.name, categories))
+            blocks.append(block)
+
+        descriptor = {'rows': len(dataset), 'columns': columns}
+        return SharedFrame(descriptor=descriptor, blocks=blocks, owner=True)
+
+    @staticmethod
+    def attach(descriptor: dict) -> 'SharedFrame':
+        """
+        Map a published SharedFrame (e.g., in a worker process).
+
+        :param descriptor: descriptor of the published SharedFrame
+        :return: non-owning SharedFrame
+        """
+        blocks = list()
+        for _, _, block_name, _ in descriptor['columns']:
+            try:
+                # the publishing process owns (and unlinks) the block
+                block = shared_memory.SharedMemory(name=block_name, track=False)
+            except TypeError:
+                block = shared_memory.SharedMemory(name=block_name)  # python < 3.13
+            blocks.append(block)
+
+        return SharedFrame(descriptor=descriptor, blocks=blocks, owner=False)
+
+    def take(self, rows: Union[slice, np.ndarray]) -> pd.DataFrame:
+        """
+        :param rows: row range (numeric columns are mapped without copying) or row positions
+        :return: the rows as a DataFrame (index: row positions)
+        """
+        if isinstance(rows, slice):
+            index = pd.RangeIndex(start=rows.start, stop=rows.stop)
+        else:
+            index = pd.Index(rows)
+
+        data = dict()
+        for name, _, _, categories in self.descriptor['columns']:
+            values = self.arrays[name][rows]
+            data[name] = values if categories is None else categories[values]
+
+        return pd.DataFrame(data, index=index, copy=False)
+
+    def close(self):
+        """
+        Unmap the blocks (and free them, if owner).
+        """
+        self.arrays = dict()
+        for block in self.blocks:
+            block.close()
+            if self.owner:
+                block.unlink()
+        self.blocks = list()
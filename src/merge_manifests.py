@@ -0,0 +1,76 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+import glob
+import json
+import argparse
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """
+    Add merge_manifests.py arguments to parser.
+
+    :param parser: parser to add arguments to
+    """
+    parser.add_argument('manifests', type=str, nargs='*',
+                        help='shard manifests to merge (default: {output-dir}/{name}-manifest-*-of-*.json)')
+    parser.add_argument('--output-dir', type=str, default='../graph',
+                        help='directory the shards wrote plots into (default: ../graph)')
+    parser.add_argument('--name', type=str, default='render', choices=['render', 'activity'],
+                        help='sharded command whose manifests are merged (default: render)')
+    parser.add_argument('--no-check-outputs', action='store_true',
+                        help="don't check that every output listed in the manifests exists in the output directory "
+                             "(e.g., when shards wrote into archives)")
+
+
+def merge_manifests(args: argparse.Namespace):
+    """
+    Merge the manifests of every shard into {output_dir}/{name}-manifest.json,
+    and exit with an error if a shard, slice or output is missing.
+
+    :param args: parsed arguments (check add_arguments)
+    """
+    from helper.shard_manifest import ShardManifest
+
+    manifest_paths = args.manifests
+    if len(manifest_paths) == 0:
+        manifest_paths = sorted(glob.glob(os.path.join(args.output_dir, f'{args.name}-manifest-*-of-*.json')))
+
+    manifests = list()
+    for manifest_path in manifest_paths:
+        with open(manifest_path, 'r') as manifest_file:
+            manifests.append(json.load(manifest_file))
+
+    output_dir = None if args.no_check_outputs else args.output_dir
+    merged, problems = ShardManifest.merge(manifests=manifests, output_dir=output_dir)
+
+    if len(merged) > 0:
+        merged_path = os.path.join(args.output_dir, f'{args.name}-manifest.json')
+        with open(merged_path, 'w') as merged_file:
+            json.dump(merged, merged_file, indent=2)
+
+        outputs_count = sum(len(job['outputs']) for job in merged['jobs'])
+        print(f"Merged {len(manifests)} manifests ({len(merged['jobs'])} of {merged['slice_count']} slices, "
+              f"{outputs_count} outputs) into {merged_path}.")
+        for shard_index, seconds in sorted(merged['shard_seconds'].items()):
+            print(f"  shard {shard_index}/{merged['shard_count']}: {seconds:.2f} s")
+
+    if len(problems) > 0:
+        for problem in problems:
+            print(problem)
+        exit(-1)
+
+
+def main():
+    # parse arguments
+    parser = argparse.ArgumentParser(description='Merge and check the manifests of sharded rendering.')
+    add_arguments(parser)
+
+    merge_manifests(args=parser.parse_args())
+
+
+if __name__ == '__main__':
+    main()
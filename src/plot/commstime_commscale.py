@@ -27,17 +27,35 @@ def commstime_commscale(dataset: pd.DataFrame, plot_over: List[str], grid_over:
 
     # draw plot
     ax = plot_controller.get_axes()
-    sns.lineplot(data=dataset,
-                 x='CommScale', y='CommsTime',
-                 style='PhysicalTopology', hue='PhysicalTopology',
-                 markers=True, dashes=False, markersize=15,
-                 ax=ax)
+    if plot_controller.use_density(dataset):
+        plot_controller.draw_density(ax=ax, data=dataset, x='CommScale', y='CommsTime', hue='PhysicalTopology')
+    else:
+        sns.lineplot(data=dataset,
+                     x='CommScale', y='CommsTime',
+                     style='PhysicalTopology', hue='PhysicalTopology',
+                     markers=True, dashes=False, markersize=15,
+                     ax=ax)
+
+    # theoretical optimal (bandwidth-optimal bound, check OptimalBound)
+    if 'CommsTime_Optimal' in dataset.columns and dataset['CommsTime_Optimal'].notna().any():
+        sns.lineplot(data=dataset,
+                     x='CommScale', y='CommsTime_Optimal',
+                     hue='PhysicalTopology', linestyle='--', errorbar=None, legend=False,
+                     ax=ax)
+
+    # fitted alpha-beta model (check AlphaBetaFit)
+    if 'CommsTime_Fit' in dataset.columns and dataset['CommsTime_Fit'].notna().any():
+        sns.lineplot(data=dataset,
+                     x='CommScale', y='CommsTime_Fit',
+                     hue='PhysicalTopology', linestyle=':', errorbar=None, legend=False,
+                     ax=ax)
 
     # aesthetics update
     plot_controller.set_xlabel(xlabel='CommScale (MB)')
     plot_controller.set_ylabel(ylabel='CommsTime (ms)')
     plot_controller.set_title()
-    plot_controller.adjust_y_axis_range(yname='CommsTime', tight_axis=tight_axis)
+    plot_controller.adjust_y_axis_range(yname='CommsTime', tight_axis=tight_axis,
+                                        overlay_ynames=['CommsTime_Optimal', 'CommsTime_Fit'])
     plot_controller.set_post_aesthetics()
 
     # save plot
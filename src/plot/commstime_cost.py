@@ -7,11 +7,14 @@ from typing import List, Optional
 import pandas as pd
 import seaborn as sns
 from plot.plot_controller import PlotController
+from data.pareto_frontier import ParetoFrontier
 
 
 def commstime_cost(dataset: pd.DataFrame, plot_over: List[str], grid_over: Optional[str], path: str, tight_axis: bool = False):
     """
     <Scatter Plot> CommsTime - Cost
+    Only the Pareto frontier is drawn as markers; dominated points are summarized as a density (hexbin) layer.
+    Uses the 'ParetoOptimal' column if the dataset has one (check ParetoFrontier), or computes it if not.
 
     :param dataset: dataset to use
     :param path: path to save graph
@@ -23,13 +26,27 @@ def commstime_cost(dataset: pd.DataFrame, plot_over: List[str], grid_over: Optio
     # aesthetics pre-update
     plot_controller.set_pre_aesthetics()
 
+    # split frontier / dominated points
+    if 'ParetoOptimal' in dataset.columns:
+        optimal = dataset['ParetoOptimal'].to_numpy(dtype=bool)
+    else:
+        optimal = ParetoFrontier().mark(dataset)
+    frontier = dataset.loc[optimal].sort_values(by='Cost', kind='mergesort')
+    dominated = dataset.loc[~optimal]
+
     # draw plot
     ax = plot_controller.get_axes()
-    sns.scatterplot(data=dataset,
+    if plot_controller.use_density(dominated):
+        plot_controller.draw_density(ax=ax, data=dominated, x='Cost', y='CommsTime')
+    elif len(dominated) > 0:
+        ax.hexbin(dominated['Cost'], dominated['CommsTime'],
+                  gridsize=40, mincnt=1, cmap='Greys', linewidths=0, alpha=0.6)
+    ax.step(frontier['Cost'], frontier['CommsTime'], where='post', color='gray', zorder=1)
+    sns.scatterplot(data=frontier,
                     x='Cost', y='CommsTime',
                     hue='RunName', style='Topology',
                     s=300,
-                    ax=ax)
+                    ax=ax, zorder=2)
 
     # aesthetics update
     plot_controller.set_xlabel(xlabel='Cost ($)')
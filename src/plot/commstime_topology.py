@@ -64,17 +64,24 @@ def commstime_topology(dataset: pd.DataFrame, plot_over: List[str], grid_over: O
 
             ax.set_title(f"{grid_value}")
 
-    # todo: add theoretical optimal point
-    # sns.lineplot(data=dataset,
-    #              x='Topology', y='CommsTime_Optimal',
-    #              ax=ax)
+    # theoretical optimal point (bandwidth-optimal bound, check OptimalBound)
+    if 'CommsTime_Optimal' in dataset.columns and dataset['CommsTime_Optimal'].notna().any():
+        grid_data = [(plot_controller.get_axes(), dataset)] if grid_over is None else \
+            [(axes[i], dataset.loc[dataset[grid_over] == grid_values[i]]) for i in range(len(grid_values))]
+        for ax, data in grid_data:
+            sns.pointplot(data=data,
+                          x='Topology', y='CommsTime_Optimal',
+                          order=data['Topology'].unique(),
+                          color='black', marker='_', markersize=30, linestyle='none', errorbar=None,
+                          ax=ax)
 
     # aesthetics update
     plot_controller.set_xlabel(xlabel='Topology')
     plot_controller.rotate_xlabel()
     plot_controller.set_ylabel(ylabel='CommsTime (ms)')
     plot_controller.set_title()
-    plot_controller.adjust_y_axis_range(yname='CommsTime', tight_axis=tight_axis)
+    plot_controller.adjust_y_axis_range(yname='CommsTime', tight_axis=tight_axis,
+                                        overlay_ynames=['CommsTime_Optimal'])
     plot_controller.set_post_aesthetics(remove_legend=True)
 
     # save plot
@@ -4,12 +4,43 @@ LICENSE file in the root directory of this source tree.
 """
 
 from typing import List, Optional
+import numpy as np
 import pandas as pd
 import seaborn as sns
 from plot.plot_controller import PlotController
+from data.dim_metric_store import DimMetricStore
 
 
-def commstimebwdim_commscale(dataset: pd.DataFrame, plot_over: List[str], grid_over: Optional[str], path: str, tight_axis: bool = False):
+def bw_dim_table(data: pd.DataFrame, bw_dim_store: Optional[DimMetricStore] = None) -> pd.DataFrame:
+    """
+    :param data: rows of one plot
+    :param bw_dim_store: per-dimension bandwidth utilizations of the dataset (if None, read the wide
+                         CommsTime_BW_Dim{d} columns of data)
+    :return: (CommScale, Dimension, CommsTime_BW_Dim) rows: total utilization ('Total') of every row,
+             then the utilization of every dim ('Dim{d}') that moved data, dim by dim
+    """
+    total = pd.DataFrame({'CommScale': data['CommScale'].to_numpy(), 'Dimension': 'Total',
+                          'CommsTime_BW_Dim': data['CommsTime_BW'].to_numpy()})
+
+    if bw_dim_store is not None:
+        rows, dims, values = bw_dim_store.take(rows=data.index.to_numpy())
+        order = np.argsort(dims, kind='stable')  # dim by dim, rows in data order
+        row_positions = data.index.get_indexer(rows[order])
+        per_dim = pd.DataFrame({'CommScale': data['CommScale'].to_numpy()[row_positions],
+                                'Dimension': [f'Dim{dim}' for dim in dims[order]],
+                                'CommsTime_BW_Dim': values[order]})
+    else:
+        dim_cols = DimMetricStore.wide_cols(data, prefix='CommsTime_BW_Dim')
+        per_dim = pd.melt(data, id_vars=['CommScale'], value_vars=dim_cols,
+                          var_name='Dimension', value_name='CommsTime_BW_Dim')
+        per_dim['Dimension'] = per_dim['Dimension'].str[len('CommsTime_BW_'):]
+
+    melt_data = pd.concat([total, per_dim], ignore_index=True)
+    return melt_data.dropna().reset_index(drop=True)
+
+
+def commstimebwdim_commscale(dataset: pd.DataFrame, plot_over: List[str], grid_over: Optional[str], path: str,
+                             tight_axis: bool = False, bw_dim_store: Optional[DimMetricStore] = None):
     """
     <Lineplot> CommsTime_BW_dim - CommScale
 
@@ -19,19 +50,11 @@ def commstimebwdim_commscale(dataset: pd.DataFrame, plot_over: List[str], grid_o
     :param path: path to save graph
     :param tight_axis: if true, tightly cut y-axis range.
                        if false, y-axis starts with 0.
+    :param bw_dim_store: per-dimension bandwidth utilizations of the dataset (check DimMetricStore),
+                         if the dataset doesn't keep them as wide CommsTime_BW_Dim{d} columns
     """
     # melt dataset
-    dimensions_to_melt = list(filter(lambda x: x.startswith('CommsTime_BW_Dim'), dataset.columns))
-    dimensions_to_melt.insert(0, 'CommsTime_BW')
-
-    melt_data = pd.melt(dataset, id_vars=['CommScale'], value_vars=dimensions_to_melt,
-                        var_name='Dimension', value_name='CommsTime_BW_Dim')
-    melt_data.dropna(inplace=True)
-    for index, row in melt_data.iterrows():
-        if row['Dimension'] == 'CommsTime_BW':
-            melt_data.loc[index, 'Dimension'] = 'Total'
-        else:
-            melt_data.loc[index, 'Dimension'] = row['Dimension'].split('_')[2]
+    melt_data = bw_dim_table(data=dataset, bw_dim_store=bw_dim_store)
 
     # create plot_controller
     plot_controller = PlotController(dataset=dataset, melt_data=melt_data,
@@ -6,12 +6,31 @@ LICENSE file in the root directory of this source tree.
 from typing import List, Optional
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import seaborn as sns
 from plot.plot_controller import PlotController
+from data.chunk_latency_cube import ChunkLatencyCube
 
 
-def commstimechunk_topology(dataset: pd.DataFrame, plot_over: List[str], grid_over: Optional[str], path: str, tight_axis: bool = False):
+def chunk_latency_table(data: pd.DataFrame, chunk_latency_cube: Optional[ChunkLatencyCube]) -> pd.DataFrame:
+    """
+    :param data: dataset slice of a single (Workload, Passes, CommScale, RunName)
+    :param chunk_latency_cube: if set, look the table up in it instead of aggregating data
+    :return: AverageChunkLatency summed per (Topology, DimensionIndex), Topology as index
+    """
+    if chunk_latency_cube is not None:
+        config = data.iloc[0]
+        melt_data = chunk_latency_cube.get(workload=config['Workload'], passes=config['Passes'],
+                                           comm_scale=config['CommScale'], run_name=config['RunName'])
+        if melt_data is not None:
+            return melt_data
+
+    return data.groupby(['Topology', 'DimensionIndex'], sort=False)['AverageChunkLatency'] \
+        .sum() \
+        .unstack()
+
+
+def commstimechunk_topology(dataset: pd.DataFrame, plot_over: List[str], grid_over: Optional[str], path: str, tight_axis: bool = False,
+                            chunk_latency_cube: Optional[ChunkLatencyCube] = None):
     """
     <Stacked barplot> CommsTime_BW_Chunk - Topology
 
@@ -21,6 +40,8 @@ def commstimechunk_topology(dataset: pd.DataFrame, plot_over: List[str], grid_ov
     :param path: path to save graph
     :param tight_axis: if true, tightly cut y-axis range.
                        if false, y-axis starts with 0.
+    :param chunk_latency_cube: if set, look the (Topology x DimensionIndex) tables up in this ChunkLatencyCube
+                               (built from the whole dataset) instead of aggregating each slice.
     """
     if grid_over is None:
         grid_values = None
@@ -45,9 +66,7 @@ def commstimechunk_topology(dataset: pd.DataFrame, plot_over: List[str], grid_ov
 
     # draw plot
     if grid_over is None:
-        melt_data = dataset.groupby(['Topology', 'DimensionIndex'], sort=False)['AverageChunkLatency'] \
-            .sum() \
-            .unstack()
+        melt_data = chunk_latency_table(data=dataset, chunk_latency_cube=chunk_latency_cube)
         plot_controller.melt_data = melt_data
 
         ax = plot_controller.get_axes()
@@ -60,9 +79,7 @@ def commstimechunk_topology(dataset: pd.DataFrame, plot_over: List[str], grid_ov
         for i in range(len(grid_values)):
             grid_value = grid_values[i]
             data = dataset.loc[dataset[grid_over] == grid_value]
-            melt_data = data.groupby(['Topology', 'DimensionIndex'], sort=False)['AverageChunkLatency'] \
-                .sum() \
-                .unstack()
+            melt_data = chunk_latency_table(data=data, chunk_latency_cube=chunk_latency_cube)
             plot_controller.melt_data = melt_data
 
             # draw plot
@@ -0,0 +1,129 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+from typing import Optional, Tuple
+import numpy as np
+import pandas as pd
+import seaborn as sns
+from matplotlib.lines import Line2D
+
+
+class DensityRenderer:
+    """
+    Draw many points as a single fixed-resolution image instead of one marker per point.
+    Points are binned into (height, width) pixels per hue category (all at once),
+    and each pixel gets the count-weighted mean color of its categories and a log-scaled opacity.
+    Drawing and pdf writing time is independent of the number of points; axes and labels stay vector.
+    """
+
+    def __init__(self, resolution: Tuple[int, int] = (300, 400), spread: int = 3):
+        """
+        Instantiate a new DensityRenderer instance.
+
+        :param resolution: (height, width) of the density image in pixels
+        :param spread: spread each point over (2 * spread + 1)^2 pixels, so that isolated points stay visible
+        """
+        self.resolution = resolution
+        self.spread = spread
+
+    def draw(self, ax, data: pd.DataFrame, x: str, y: str, hue: Optional[str] = None, cmap: str = 'Greys'):
+        """
+        Draw the density image of (x, y) points on ax.
+
+        :param ax: Axes to draw on
+        :param data: dataset to use
+        :param x: x axis column
+        :param y: y axis column
+        :param hue: if set, color pixels by this column (with a legend). if not, use cmap.
+        :param cmap: colormap to use if hue is None
+        """
+        height, width = self.resolution
+        data = data.dropna(subset=[x, y])
+        if len(data) == 0:
+            return
+
+        x_values = data[x].to_numpy(dtype=float)
+        y_values = data[y].to_numpy(dtype=float)
+
+        # pixel extent (pad degenerate ranges, e.g., single x value)
+        x_min, x_max = self.padded_range(x_values)
+        y_min, y_max = self.padded_range(y_values)
+
+        # pixel index of each point
+        column = np.clip(((x_values - x_min) / (x_max - x_min) * width).astype(int), 0, width - 1)
+        row = np.clip(((y_values - y_min) / (y_max - y_min) * height).astype(int), 0, height - 1)
+
+        # category index of each point
+        if hue is None:
+            categories = [None]
+            category = np.zeros(len(data), dtype=int)
+        else:
+            category, categories = pd.factorize(data[hue], sort=False)
+
+        # counts per (category, row, column), in a single bincount
+        counts = np.bincount((category * height + row) * width + column,
+                             minlength=len(categories) * height * width) \
+            .reshape((len(categories), height, width)) \
+            .astype(float)
+        counts = self.spread_pixels(counts)
+        total = counts.sum(axis=0)
+
+        # opacity: log-scaled density
+        alpha = np.zeros_like(total)
+        occupied = total > 0
+        alpha[occupied] = 0.3 + 0.7 * np.log1p(total[occupied]) / np.log1p(total.max())
+
+        if hue is None:
+            image = np.ma.masked_where(~occupied, np.log1p(total))
+            ax.imshow(image, origin='lower', extent=(x_min, x_max, y_min, y_max),
+                      aspect='auto', interpolation='nearest', cmap=cmap, zorder=0)
+            return
+
+        # color: count-weighted mean of the category colors
+        colors = np.array(sns.color_palette(n_colors=len(categories)))
+        rgba = np.zeros((height, width, 4))
+        rgba[..., :3][occupied] = (np.tensordot(counts, colors, axes=(0, 0))[occupied]
+                                   / total[occupied][:, None])
+        rgba[..., 3] = alpha
+        ax.imshow(rgba, origin='lower', extent=(x_min, x_max, y_min, y_max),
+                  aspect='auto', interpolation='nearest', zorder=0)
+
+        # legend with proxy markers
+        handles = [Line2D([], [], marker='o', linestyle='', color=colors[i], label=str(categories[i]))
+                   for i in range(len(categories))]
+        ax.legend(handles=handles, title=hue)
+
+    def spread_pixels(self, counts: np.ndarray) -> np.ndarray:
+        """
+        Box-filter counts over the last two axes (summed-area differences, O(pixels)).
+
+        :param counts: counts of shape (categories, height, width)
+        :return: spread counts of the same shape
+        """
+        k = self.spread
+        if k <= 0:
+            return counts
+
+        for axis in (1, 2):
+            size = counts.shape[axis]
+            padded = np.concatenate([np.zeros_like(counts.take(range(k + 1), axis=axis)),
+                                     counts,
+                                     np.zeros_like(counts.take(range(k), axis=axis))], axis=axis)
+            cumulative = np.cumsum(padded, axis=axis)
+            counts = cumulative.take(range(2 * k + 1, 2 * k + 1 + size), axis=axis) \
+                - cumulative.take(range(0, size), axis=axis)
+
+        return counts
+
+    @staticmethod
+    def padded_range(values: np.ndarray) -> Tuple[float, float]:
+        """
+        :param values: values to cover
+        :return: (min, max) range covering the values, padded by 1% (or by 1 if all the values are equal)
+        """
+        v_min, v_max = np.min(values), np.max(values)
+        margin = 0.01 * (v_max - v_min) if v_max > v_min else 1
+
+        return v_min - margin, v_max + margin
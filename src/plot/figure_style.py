@@ -0,0 +1,89 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Optional
+import numpy as np
+import matplotlib as mpl
+import seaborn as sns
+from cycler import cycler
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+
+class FigureStyle:
+    """
+    Style and construction of every figure, without pyplot.
+    Figures are plain matplotlib Figures on an Agg canvas: they aren't registered in pyplot's global figure
+    manager (no plt.close needed), and can be drawn and saved from several threads at once.
+    The style (seaborn 'ticks' style, font scale 1.5, 'deep' palette) is installed into rcParams once per process,
+    and never changed afterwards, so concurrent figures read stable settings.
+    """
+
+    lock = threading.Lock()
+    installed = False
+    style: Optional[dict] = None
+
+    @staticmethod
+    def rc() -> dict:
+        """
+        :return: rcParams of the style (same as sns.set(font_scale=1.5) followed by sns.set_style('ticks'))
+        """
+        if FigureStyle.style is None:
+            style = dict(sns.axes_style('ticks'))
+            style.update(sns.plotting_context('notebook', font_scale=1.5))
+            style['font.family'] = ['sans-serif']
+            style['axes.prop_cycle'] = cycler('color', sns.color_palette('deep'))
+            FigureStyle.style = style
+
+        return FigureStyle.style
+
+    @staticmethod
+    def install():
+        """
+        Install the style into rcParams (once per process: later calls don't touch rcParams).
+        """
+        if FigureStyle.installed:
+            return
+
+        with FigureStyle.lock:
+            if not FigureStyle.installed:
+                mpl.rcParams.update(FigureStyle.rc())
+                sns.set_color_codes('deep')
+                FigureStyle.installed = True
+
+    @staticmethod
+    @contextmanager
+    def context():
+        """
+        Draw with the style without installing it (e.g., when embedded in an application with its own rcParams).
+        rcParams are process-wide: such figures are drawn one at a time. No-op if the style is installed.
+        """
+        if FigureStyle.installed:
+            yield
+            return
+
+        with FigureStyle.lock:
+            with mpl.rc_context(FigureStyle.rc()):
+                yield
+
+    @staticmethod
+    def create_figure(nrows: int = 1, ncols: int = 1, pyplot: bool = False):
+        """
+        :param nrows: rows of subplots
+        :param ncols: columns of subplots
+        :param pyplot: create the figure with pyplot instead (e.g., to show it in a window; single thread only)
+        :return: (figure (on its own Agg canvas if not pyplot), axes: one Axes if a single subplot, array of Axes if not)
+        """
+        if pyplot:
+            import matplotlib.pyplot as plt
+            fig = plt.figure()
+        else:
+            fig = Figure()
+            FigureCanvasAgg(fig)
+        axes = fig.subplots(nrows=nrows, ncols=ncols, squeeze=False)
+
+        return fig, axes[0, 0] if nrows * ncols == 1 else np.squeeze(axes)
@@ -0,0 +1,14 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+from enum import Enum
+
+
+class OutputMode(Enum):
+    """
+    Available plot output modes are defined here
+    """
+    PerPlot = 1  # one pdf file per plot
+    Bundle = 2  # one multi-page pdf per (plot family, workload)
@@ -6,9 +6,16 @@ LICENSE file in the root directory of this source tree.
 from typing import List, Optional
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import os
+from plot.output_mode import OutputMode
+from helper.pdf_bundle_manager import PdfBundleManager
+from sink.output_sink import OutputSink
+from sink.directory_sink import DirectorySink
+from plot.density_renderer import DensityRenderer
+from plot.figure_style import FigureStyle
+from helper.contact_sheet import ContactSheet
+from helper.shard_manifest import ShardManifest
+from helper.render_timings import RenderTimings
 
 
 class PlotController:
@@ -17,6 +24,33 @@ class PlotController:
     Used to create/design/control plots.
     """
 
+    # how and where save() writes the plots (shared by every plot)
+    output_mode = OutputMode.PerPlot
+    pdf_bundle_manager: Optional[PdfBundleManager] = None
+    sink: OutputSink = DirectorySink()
+
+    # file formats written from each drawn figure, their resolution,
+    # and the contact sheet to add thumbnails to (preview mode)
+    formats: List[str] = ['pdf']
+    dpi: Optional[float] = None
+    contact_sheet: Optional[ContactSheet] = None
+
+    # plots with more points than this are drawn as density images (None: never)
+    density_threshold: Optional[int] = None
+    density_renderer = DensityRenderer()
+
+    # prepended to every plot title (e.g., to mark delta plots)
+    title_prefix: str = ''
+
+    # if set, the outputs of every plot are recorded into this manifest (sharded rendering)
+    shard_manifest: Optional[ShardManifest] = None
+
+    # if set, the drawing time of every plot is recorded into (and predicted from) these timings
+    render_timings: Optional[RenderTimings] = None
+
+    # if set, figures are created with pyplot so that they can be shown (check show)
+    interactive: bool = False
+
     def __init__(self, dataset: pd.DataFrame, melt_data: Optional[pd.DataFrame],
                  plot_over: List[str],
                  ncols: int = 1,
@@ -38,9 +72,10 @@ class PlotController:
         self.melt_data = melt_data
         self.width = width
         self.height = height
+        self.title = ""
 
-        # create fig and axes
-        self.fig, self.axes = plt.subplots(nrows=1, ncols=ncols)
+        # create fig and axes (pyplot-free unless interactive: figures can be drawn from several threads)
+        self.fig, self.axes = FigureStyle.create_figure(nrows=1, ncols=ncols, pyplot=PlotController.interactive)
 
         # self.axes always in ndarray form
         if self.ncols == 1:
@@ -49,14 +84,115 @@ class PlotController:
         # flatten the axes
         self.axes = self.axes.flatten()
 
+    @staticmethod
+    def set_output_mode(output_mode: OutputMode, pdf_bundle_manager: Optional[PdfBundleManager] = None):
+        """
+        Set how plots are saved.
+
+        :param output_mode: OutputMode to use. Refer to output_mode.py.
+        :param pdf_bundle_manager: PdfBundleManager to append plots into. required for OutputMode.Bundle.
+        """
+        assert output_mode != OutputMode.Bundle or pdf_bundle_manager is not None, \
+            "OutputMode.Bundle requires a PdfBundleManager."
+
+        PlotController.output_mode = output_mode
+        PlotController.pdf_bundle_manager = pdf_bundle_manager
+
+    @staticmethod
+    def set_output_sink(sink: OutputSink):
+        """
+        Set where plots are saved.
+
+        :param sink: OutputSink to write plots into
+        """
+        PlotController.sink = sink
+
+    @staticmethod
+    def set_output_formats(formats: List[str], dpi: Optional[float] = None,
+                           contact_sheet: Optional[ContactSheet] = None):
+        """
+        Set the file formats written from each figure. All of them are written from a single draw pass.
+
+        :param formats: file formats (e.g., ['pdf', 'png', 'svg'])
+        :param dpi: resolution of raster formats (None: matplotlib default)
+        :param contact_sheet: if set, add every png plot to this contact sheet
+        """
+        PlotController.formats = formats
+        PlotController.dpi = dpi
+        PlotController.contact_sheet = contact_sheet
+
+    @staticmethod
+    def set_shard_manifest(shard_manifest: Optional[ShardManifest]):
+        """
+        Set the manifest the outputs of every plot are recorded into.
+
+        :param shard_manifest: ShardManifest to record outputs into (None: don't record)
+        """
+        PlotController.shard_manifest = shard_manifest
+
+    @staticmethod
+    def set_render_timings(render_timings: Optional[RenderTimings]):
+        """
+        Set the timings the drawing time of every plot is recorded into.
+
+        :param render_timings: RenderTimings to record into (None: don't record)
+        """
+        PlotController.render_timings = render_timings
+
+    @staticmethod
+    def set_title_prefix(title_prefix: str):
+        """
+        Set the line prepended to every plot title.
+
+        :param title_prefix: line to prepend (empty: none)
+        """
+        PlotController.title_prefix = title_prefix
+
+    @staticmethod
+    def set_interactive(interactive: bool):
+        """
+        Create the figures with pyplot, so that they can be shown (check show). Draw plots one at a time then.
+
+        :param interactive: True to create figures with pyplot
+        """
+        PlotController.interactive = interactive
+
+    @staticmethod
+    def set_density_threshold(density_threshold: Optional[int]):
+        """
+        Set when plots are drawn as density images instead of one vector object per point.
+
+        :param density_threshold: plots with more points than this are drawn as density images.
+                                  if None, always draw every point.
+        """
+        PlotController.density_threshold = density_threshold
+
+    def use_density(self, data: pd.DataFrame) -> bool:
+        """
+        :param data: data to draw
+        :return: True if data should be drawn as a density image
+        """
+        return PlotController.density_threshold is not None and len(data) > PlotController.density_threshold
+
+    def draw_density(self, ax, data: pd.DataFrame, x: str, y: str, hue: Optional[str] = None):
+        """
+        Draw data as a density image (check DensityRenderer).
+
+        :param ax: Axes to draw on
+        :param data: data to draw
+        :param x: x axis column
+        :param y: y axis column
+        :param hue: column to color pixels by
+        """
+        PlotController.density_renderer.draw(ax=ax, data=data, x=x, y=y, hue=hue)
+
     @staticmethod
     def set_pre_aesthetics():
         """
-        Set seaborn plot pre-aesthetics.
+        Set seaborn plot pre-aesthetics (installed once per process, check FigureStyle).
         """
         # aesthetics pre-update
-        sns.set(font_scale=1.5)
-        sns.set_style('ticks')
+        FigureStyle.install()
 
     def set_post_aesthetics(self, remove_legend: bool = False, move_legend_out: bool = False):
         """
@@ -114,18 +250,23 @@ class PlotController:
         for ax in self.axes:
             ax.set_xlim(xlim_min, xlim_max)
 
-    def adjust_y_axis_range(self, yname: str, tight_axis: bool = False):
+    def adjust_y_axis_range(self, yname: str, tight_axis: bool = False, overlay_ynames: Optional[List[str]] = None):
         """
         Adjust (scale) y axis range.
 
         :param yname: y axis value name (used to retrieve min/max value from the dataset)
         :param tight_axis: if True, y axis will be tightly adjusted.
                            if False, y axis will start from 0.
+        :param overlay_ynames: overlaid value names (e.g., CommsTime_Optimal) to keep in range too, if in the dataset
         """
         dataset = self.dataset if self.melt_data is None else self.melt_data
 
         y_min = min(dataset[yname])
         y_max = max(dataset[yname])
+        for overlay_yname in overlay_ynames or list():
+            if overlay_yname in dataset.columns and dataset[overlay_yname].notna().any():
+                y_min = min(y_min, dataset[overlay_yname].min())
+                y_max = max(y_max, dataset[overlay_yname].max())
 
         # if y_min = y_max, only one bar.
         #   dist = y_max
@@ -215,21 +356,28 @@ class PlotController:
         if 'Passes' in self.plot_over:
             title += f"\nPass: {config['Passes']}"
         title += f"\nScheduling: (intra: {config['IntraScheduling']}, inter: {config['InterScheduling']})"
+        if PlotController.title_prefix != '':
+            title = PlotController.title_prefix + '\n' + title
 
+        self.title = title
         self.fig.suptitle(title)
 
     def show(self):
         """
-        Show the plot using the matplotlib library.
+        Show the plot using the matplotlib library (interactive mode only, check set_interactive).
         """
+        import matplotlib.pyplot as plt
+
+        assert PlotController.interactive, "Figures aren't created by pyplot: call set_interactive(True) first."
+
         self.fig.tight_layout()
         plt.show()
-        self.fig.clf()
         plt.close(fig=self.fig)
 
     def save(self, path: str):
         """
-        Save the plot as a pdf file
+        Save the plot in every output format (pdf by default),
+        or append it to the (family, workload) bundle if OutputMode.Bundle is set (pdf only).
 
         :param path: path to save the plot.
         """
@@ -237,15 +385,38 @@ class PlotController:
 
         # subdirectory_path = os.path.join(subdirectory_path, config['Workload'], config['RunName'])
         dir_path = os.path.join(path, config['Workload'])
-        assert os.path.exists(dir_path), f"Path {dir_path} doesn't exist."
+        assert PlotController.sink.directory_exists(dir_path), f"Path {dir_path} doesn't exist."
 
         filename = self.create_plot_filename()
-        file_path = os.path.join(dir_path, filename)
 
+        # the figure is handed over to the sink (which may encode it in its writer thread)
         self.fig.tight_layout()
-        self.fig.savefig(file_path)
-        self.fig.clf()
-        plt.close(fig=self.fig)
+        for file_format in PlotController.formats:
+            if file_format == 'pdf' and PlotController.output_mode == OutputMode.Bundle:
+                plot_config = {key: config[key] for key in self.plot_over}
+                PlotController.pdf_bundle_manager.append(dir_path=dir_path, filename=filename, fig=self.fig,
+                                                         title=self.title, config=plot_config)
+                self.record_output(PlotController.pdf_bundle_manager.bundle_path(dir_path))
+                continue
+
+            file_path = os.path.join(dir_path, os.path.splitext(filename)[0] + '.' + file_format)
+            PlotController.sink.save_figure(fig=self.fig, path=file_path, format=file_format,
+                                          dpi=PlotController.dpi)
+            self.record_output(file_path)
+
+            if file_format == 'png' and PlotController.contact_sheet is not None:
+                PlotController.contact_sheet.add(relative_path=PlotController.sink.relative_path(file_path),
+                                                 title=self.title)
+
+    @staticmethod
+    def record_output(path: str):
+        """
+        Record an output file into the shard manifest, if set.
+
+        :param path: path of the output file inside the graph tree
+        """
+        if PlotController.shard_manifest is not None:
+            PlotController.shard_manifest.add_output(PlotController.sink.relative_path(path))
 
     def create_plot_filename(self):
         """
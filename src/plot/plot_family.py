@@ -0,0 +1,114 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import importlib
+from typing import List, Optional
+from data.dataset_type import DatasetType
+
+
+class PlotFamily:
+    def __init__(self, name: str, dataset_type: DatasetType, plot_fun: str, columns: List[str],
+                 plot_over: List[str], grid_over: Optional[str] = None, grid_plot_over: Optional[List[str]] = None,
+                 tight_axis: bool = False):
+        """
+        Instantiate a new PlotFamily instance.
+        A PlotFamily declares everything draw.py needs to know about a plot family, without importing it:
+        the dataset and the (metric) columns its plot function reads, and how the dataset is sliced into plots.
+        Run name columns (RunName, Workload, System, Topology, ...) and scheduling policies are always loaded.
+
+        :param name: family name (plots are drawn into {output_dir}/{name})
+        :param dataset_type: dataset the family is drawn from
+        :param plot_fun: name of the plot function, in the plot.{plot_fun} module (imported when rendering)
+        :param columns: metric columns the plot function reads ('Prefix*' matches every column starting with Prefix)
+        :param plot_over: slicing keys of the breakdown plots (one plot per unique value combination)
+        :param grid_over: if set, also draw grid plots with one subplot per value of this column
+        :param grid_plot_over: slicing keys of the grid plots
+        :param tight_axis: if True, tightly cut the y-axis range of the breakdown plots
+        """
+        self.name = name
+        self.dataset_type = dataset_type
+        self.plot_fun = plot_fun
+        self.columns = columns
+        self.plot_over = plot_over
+        self.grid_over = grid_over
+        self.grid_plot_over = grid_plot_over
+        self.tight_axis = tight_axis
+
+    def load_plot_fun(self):
+        """
+        :return: plot function of the family (plotting libraries are heavy: only import them when rendering)
+        """
+        return getattr(importlib.import_module(f'plot.{self.plot_fun}'), self.plot_fun)
+
+    def grid_job(self) -> Optional[dict]:
+        """
+        :return: Plotter.plot arguments of the grid plots (None if the family has no grid plots)
+        """
+        if self.grid_over is None:
+            return None
+
+        return dict(plot_over=self.grid_plot_over, grid_over=self.grid_over, plot_fun=self.load_plot_fun())
+
+    def breakdown_job(self) -> dict:
+        """
+        :return: Plotter.plot arguments of the breakdown plots
+        """
+        plot_args = dict(plot_over=self.plot_over, grid_over=None, plot_fun=self.load_plot_fun())
+        if self.tight_axis:
+            plot_args['tight_axis'] = True
+
+        return plot_args
+
+
+# every plot family, in drawing order
+PLOT_FAMILIES = [
+    PlotFamily(name='CommsTime_CommScale', dataset_type=DatasetType.BackendEndToEnd, plot_fun='commstime_commscale',
+               columns=['CommsTime', 'CommsTime_Optimal'],
+               plot_over=['RunName', 'Passes', 'Workload']),
+    PlotFamily(name='CommsTime_Topology', dataset_type=DatasetType.BackendEndToEnd, plot_fun='commstime_topology',
+               columns=['CommsTime', 'CommsTime_Optimal'],
+               plot_over=['RunName', 'Passes', 'Workload', 'CommScale'],
+               grid_over='RunName', grid_plot_over=['Passes', 'Workload', 'CommScale']),
+    PlotFamily(name='CommsTime_Cost', dataset_type=DatasetType.BackendEndToEnd, plot_fun='commstime_cost',
+               columns=['CommsTime', 'Cost'],
+               plot_over=['Passes', 'Workload', 'CommScale']),
+    PlotFamily(name='CommsTimeBW_CommScale', dataset_type=DatasetType.BackendEndToEnd, plot_fun='commstimebw_commscale',
+               columns=['CommsTime_BW'],
+               plot_over=['RunName', 'Passes', 'Workload'], tight_axis=True),
+    PlotFamily(name='CommsTimeBwDim_CommScale', dataset_type=DatasetType.BackendEndToEnd,
+               plot_fun='commstimebwdim_commscale',
+               columns=['CommsTime_BW', 'CommsTime_BW_Dim*'],
+               plot_over=['RunName', 'Passes', 'Workload', 'PhysicalTopology'], tight_axis=True),
+    PlotFamily(name='CommsTimeChunk_Topology', dataset_type=DatasetType.BackendLayerWise,
+               plot_fun='commstimechunk_topology',
+               columns=['DimensionIndex', 'AverageChunkLatency'],
+               plot_over=['RunName', 'Passes', 'Workload', 'CommScale'], tight_axis=True,
+               grid_over='RunName', grid_plot_over=['Passes', 'Workload', 'CommScale']),
+]
+
+
+def get_plot_family(name: str) -> PlotFamily:
+    """
+    :param name: family name
+    :return: registered PlotFamily of that name
+    """
+    for plot_family in PLOT_FAMILIES:
+        if plot_family.name == name:
+            return plot_family
+
+    print(f"Plot family {name} not supported.")
+    exit(-1)
+
+
+def required_columns(names: List[str]) -> List[str]:
+    """
+    :param names: names of the families to draw
+    :return: union of the columns the families read (in family order)
+    """
+    columns = dict()
+    for name in names:
+        columns.update(dict.fromkeys(get_plot_family(name).columns))
+
+    return list(columns)
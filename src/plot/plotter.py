@@ -3,8 +3,12 @@ This source code is licensed under the MIT license found in the
 LICENSE file in the root directory of this source tree.
 """
 
+import os
+import time
 from typing import List, Callable, Optional
 from plot.plot_controller import PlotController
+from helper.shard_manifest import ShardManifest
+from helper.render_timings import RenderTimings
 import pandas as pd
 import numpy as np
 
@@ -18,8 +22,34 @@ class Plotter:
         """
         self.dataset = dataset
 
+    # columns a plot slice is stratified by when sampled (if not already fixed by plot_over)
+    sample_strata = ['RunName', 'PhysicalTopology', 'CommScale', 'DimensionIndex']
+
+    @staticmethod
+    def stratified_sample(data: pd.DataFrame, strata: List[str], sample_per_stratum: int) -> pd.DataFrame:
+        """
+        Keep at most sample_per_stratum random rows of each stratum (deterministic, original row order).
+
+        :param data: data to sample
+        :param strata: columns that define strata
+        :param sample_per_stratum: maximum number of rows per stratum
+        :return: sampled data
+        """
+        if len(strata) == 0:
+            return data.sample(n=min(sample_per_stratum, len(data)), random_state=0).sort_index()
+
+        # rank rows by a random key inside their stratum
+        random_key = np.random.default_rng(seed=0).random(len(data))
+        order = np.argsort(random_key, kind='stable')
+        rank = np.empty(len(data), dtype=int)
+        rank[order] = data.iloc[order].groupby(strata, sort=False).cumcount().to_numpy()
+
+        return data.loc[rank < sample_per_stratum]
+
     def plot(self, plot_over: List[str], grid_over: Optional[str],
-             plot_fun: Callable, path: str, tight_axis: bool = False):
+             plot_fun: Callable, path: str, tight_axis: bool = False,
+             sample_per_stratum: Optional[int] = None, only_slices: Optional[pd.DataFrame] = None,
+             plot_kwargs: Optional[dict] = None, render_pool=None, thread_pool=None) -> list:
         """
         Plot plot_fun by iterating over plot_over configurations.
         Save the result pdf graphs into the path directory.
@@ -32,6 +62,18 @@ class Plotter:
                           if not, set this to None.
         :param plot_fun: plotting function to use
         :param path: path to save result pdf plots
+        :param sample_per_stratum: if set, only draw (at most) this many random rows
+                                   of each stratum (check sample_strata) of each plot.
+        :param only_slices: if set, only draw the plots whose plot_over values match a row of only_slices.
+        :param plot_kwargs: additional keyword arguments of plot_fun (e.g., precomputed aggregations)
+        :param render_pool: if set (RenderPool the dataset is published into), submit every plot to its workers
+                            as a slice descriptor instead of drawing it here (call render_pool.wait() to finish).
+        :param thread_pool: if set (concurrent.futures.ThreadPoolExecutor), draw every plot in one of its threads
+        :return: futures of the plots drawn in thread_pool (wait for them to finish), empty if not set
+
+        If PlotController.shard_manifest is set, only the plots of its shard are drawn,
+        and every plot is recorded into it.
+        If PlotController.render_timings is set, the drawing time of every plot is recorded into it.
         """
         # set pre-aesthetics
         PlotController.set_pre_aesthetics()
@@ -46,7 +88,40 @@ class Plotter:
         # number of plots to draw
         plots_count = int(np.prod(col_len))
 
+        # plots to draw, if restricted
+        slices_to_draw = None
+        if only_slices is not None:
+            slices_to_draw = set(only_slices[plot_over].itertuples(index=False, name=None))
+
+        # sharded rendering: (non-empty) slices are assigned to shards by their key
+        family = os.path.basename(os.path.normpath(path))
+        job_kind = RenderTimings.job_kind(family=family, grid_over=grid_over)
+        shard_manifest = PlotController.shard_manifest
+        if shard_manifest is not None:
+            existing_slices = set(self.dataset[plot_over].dropna().drop_duplicates()
+                                  .itertuples(index=False, name=None))
+
+        # parallel rendering: slices are located once, and only their rows are sent to the workers
+        if render_pool is not None:
+            frame_key = render_pool.frame_key_of(self.dataset)
+            assert frame_key is not None, "The dataset isn't published into the render pool."
+            slice_rows = render_pool.get_slice_rows(frame_key=frame_key, plot_over=plot_over)
+
+        # draw a plot here, or in a thread of thread_pool
+        def draw_slice(data: pd.DataFrame, slice_key: Optional[str]):
+            if slice_key is not None:
+                shard_manifest.begin(slice_key)
+            start_time = time.perf_counter()
+            plot_fun(dataset=data, plot_over=plot_over, grid_over=grid_over,
+                     path=path, tight_axis=tight_axis, **(plot_kwargs or dict()))
+            if PlotController.render_timings is not None:
+                PlotController.render_timings.add(kind=job_kind, rows=len(data),
+                                                  seconds=time.perf_counter() - start_time)
+            if slice_key is not None:
+                shard_manifest.end()
+
         # iterate over plots
+        futures = list()
         for plot_index in range(plots_count):
             # get col_index
             col_index = []
@@ -58,15 +133,38 @@ class Plotter:
                 col_index.append(numerator // denominator)
                 numerator %= denominator
 
-            # refine dataset
-            data = self.dataset.loc[self.dataset[plot_over[0]] == col_value[0][col_index[0]]]
-            for i in range(1, len(col_index)):
-                data = data.loc[data[plot_over[i]] == col_value[i][col_index[i]]]
-
-            # check data validity
-            if len(data) <= 0:
+            # skip plots not to draw
+            slice_values = tuple(col_value[i][col_index[i]] for i in range(len(col_index)))
+            if slices_to_draw is not None and slice_values not in slices_to_draw:
                 continue
 
+            slice_key = None
+            if shard_manifest is not None:
+                if slice_values not in existing_slices:
+                    continue
+                slice_key = ShardManifest.create_slice_key(family=family, plot_over=plot_over, values=slice_values)
+                if not shard_manifest.owns(slice_key):
+                    continue
+
+            # locate dataset rows
+            if render_pool is not None:
+                rows = slice_rows.get(slice_values)
+                if rows is None:
+                    continue
+            else:
+                data = self.dataset.loc[self.dataset[plot_over[0]] == col_value[0][col_index[0]]]
+                for i in range(1, len(col_index)):
+                    data = data.loc[data[plot_over[i]] == col_value[i][col_index[i]]]
+
+                # check data validity
+                if len(data) <= 0:
+                    continue
+
+            # sample data
+            strata = [col for col in self.sample_strata if col in self.dataset.columns and col not in plot_over]
+            if sample_per_stratum is not None and render_pool is None:
+                data = self.stratified_sample(data=data, strata=strata, sample_per_stratum=sample_per_stratum)
+
             # print log message
             running_configs = list()
             print(f"Plotting [{plot_fun.__name__}] on [", end="")
@@ -75,5 +173,17 @@ class Plotter:
             print(f"{plot_over[-1]}: {col_value[-1][col_index[-1]]}].")
 
             # draw plot
-            plot_fun(dataset=data, plot_over=plot_over, grid_over=grid_over,
-                     path=path, tight_axis=tight_axis)
+            if render_pool is not None:
+                render_pool.submit(frame_key=frame_key, rows=rows, plot_fun=plot_fun,
+                                   plot_args=dict(plot_over=plot_over, grid_over=grid_over, path=path,
+                                                  tight_axis=tight_axis, **(plot_kwargs or dict())),
+                                   slice_key=slice_key, sample_per_stratum=sample_per_stratum, strata=strata,
+                                   job_kind=job_kind)
+                continue
+
+            if thread_pool is not None:
+                futures.append(thread_pool.submit(draw_slice, data, slice_key))
+            else:
+                draw_slice(data=data, slice_key=slice_key)
+
+        return futures
@@ -0,0 +1,252 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from helper.shared_frame import SharedFrame
+from helper.render_timings import RenderTimings
+
+
+# worker process state (set by initialize_worker)
+worker_frames: Dict[str, SharedFrame] = dict()
+worker_objects: Dict[str, object] = dict()
+
+
+class SharedObjectRef:
+    def __init__(self, name: str):
+        """
+        Reference to an object sent once to every worker (check RenderPool shared_objects).
+
+        :param name: name of the object
+        """
+        self.name = name
+
+
+def initialize_worker(descriptors: dict, shared_objects: dict, settings: dict):
+    """
+    Worker process initializer: map the shared datasets and set up PlotController like the parent.
+
+    :param descriptors: frame key -> SharedFrame descriptor
+    :param shared_objects: name -> object passed to plot functions by reference
+    :param settings: PlotController settings (check RenderPool)
+    """
+    from plot.plot_controller import PlotController
+    from sink.directory_sink import DirectorySink
+    from helper.contact_sheet import ContactSheet
+    from helper.shard_manifest import ShardManifest
+
+    for frame_key, descriptor in descriptors.items():
+        worker_frames[frame_key] = SharedFrame.attach(descriptor)
+    worker_objects.update(shared_objects)
+
+    PlotController.set_pre_aesthetics()
+    PlotController.set_output_sink(sink=DirectorySink(top_directory=settings['top_directory']))
+    PlotController.set_output_formats(formats=settings['formats'], dpi=settings['dpi'],
+                                      contact_sheet=ContactSheet() if settings['contact_sheet'] else None)
+    PlotController.set_density_threshold(density_threshold=settings['density_threshold'])
+    PlotController.set_title_prefix(title_prefix=settings['title_prefix'])
+
+    # records the outputs of each plot (returned to the parent)
+    PlotController.set_shard_manifest(shard_manifest=ShardManifest())
+
+
+def render_slice(frame_key: str, rows, plot_fun: Callable, plot_args: dict,
+                 sample_per_stratum: Optional[int], strata: List[str]) -> Tuple[List[str], list, float]:
+    """
+    Draw one plot in a worker process.
+
+    :param frame_key: key of the shared dataset
+    :param rows: rows of the plot slice (range, or positions)
+    :param plot_fun: plotting function
+    :param plot_args: plot_fun arguments (SharedObjectRef values are resolved in the worker)
+    :param sample_per_stratum: if set, sample the slice (check Plotter.stratified_sample)
+    :param strata: columns to sample by
+    :return: (written outputs, contact sheet entries, drawing seconds)
+    """
+    from plot.plot_controller import PlotController
+    from plot.plotter import Plotter
+
+    start_time = time.perf_counter()
+    data = worker_frames[frame_key].take(rows)
+    if sample_per_stratum is not None:
+        data = Plotter.stratified_sample(data=data, strata=strata, sample_per_stratum=sample_per_stratum)
+
+    plot_args = {key: worker_objects[value.name] if isinstance(value, SharedObjectRef) else value
+                 for key, value in plot_args.items()}
+
+    shard_manifest = PlotController.shard_manifest
+    shard_manifest.begin(slice_key='')
+    plot_fun(dataset=data, **plot_args)
+    shard_manifest.end()
+    outputs = shard_manifest.jobs.pop()['outputs']
+
+    # wait for the plot files before reporting them
+    PlotController.sink.flush()
+
+    contact_entries = list()
+    if PlotController.contact_sheet is not None:
+        contact_entries = PlotController.contact_sheet.entries
+        PlotController.contact_sheet.entries = list()
+
+    return outputs, contact_entries, time.perf_counter() - start_time
+
+
+class RenderPool:
+    def __init__(self, datasets: Dict[str, pd.DataFrame], workers: int, top_directory: str,
+                 shared_objects: Optional[dict] = None):
+        """
+        Initialize RenderPool instance.
+        RenderPool draws plots in worker processes. Datasets are published into shared memory once
+        (check SharedFrame), and each plot job only sends a slice descriptor: a row range of the
+        published dataset, or row positions if the slice isn't contiguous.
+        Plots are queued, and dispatched longest (predicted) first when waited for.
+        Every worker writes its plots into top_directory (plain directory output only).
+
+        :param datasets: frame key -> dataset to publish
+        :param workers: number of worker processes
+        :param top_directory: top directory of the graph tree
+        :param shared_objects: name -> object sent once to every worker (e.g., precomputed aggregations)
+        """
+        from plot.plot_controller import PlotController
+
+        self.datasets = datasets
+        self.frames = {frame_key: SharedFrame.publish(dataset) for frame_key, dataset in datasets.items()}
+        self.shared_objects = shared_objects if shared_objects is not None else dict()
+        self.slice_rows = dict()  # (frame key, plot_over) -> {slice values -> rows}
+        self.workers = workers
+        self.pending = list()  # queued plots (check submit)
+
+        settings = {'top_directory': top_directory,
+                    'formats': PlotController.formats,
+                    'dpi': PlotController.dpi,
+                    'contact_sheet': PlotController.contact_sheet is not None,
+                    'density_threshold': PlotController.density_threshold,
+                    'title_prefix': PlotController.title_prefix}
+        descriptors = {frame_key: frame.descriptor for frame_key, frame in self.frames.items()}
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=initialize_worker,
+                                            initargs=(descriptors, self.shared_objects, settings))
+
+    def frame_key_of(self, dataset: pd.DataFrame) -> Optional[str]:
+        """
+        :param dataset: dataset to look up
+        :return: frame key dataset was published as, or None if it wasn't
+        """
+        for frame_key, published in self.datasets.items():
+            if published is dataset:
+                return frame_key
+        return None
+
+    def get_slice_rows(self, frame_key: str, plot_over: List[str]) -> dict:
+        """
+        :param frame_key: key of the published dataset
+        :param plot_over: columns that define slices
+        :return: slice values -> rows of the slice (range if contiguous, positions if not)
+        """
+        cache_key = (frame_key, tuple(plot_over))
+        if cache_key not in self.slice_rows:
+            groups = self.datasets[frame_key].groupby(plot_over, sort=False).indices  # slice values -> positions
+            slice_rows = dict()
+            for slice_values, positions in groups.items():
+                slice_values = slice_values if isinstance(slice_values, tuple) else (slice_values,)
+                start, stop = int(positions[0]), int(positions[-1]) + 1
+                contiguous = stop - start == len(positions)
+                slice_rows[slice_values] = slice(start, stop) if contiguous else positions.astype(np.int64)
+            self.slice_rows[cache_key] = slice_rows
+
+        return self.slice_rows[cache_key]
+
+    def submit(self, frame_key: str, rows, plot_fun: Callable, plot_args: dict, slice_key: Optional[str] = None,
+               sample_per_stratum: Optional[int] = None, strata: Optional[List[str]] = None,
+               job_kind: Optional[str] = None):
+        """
+        Queue a plot to draw in a worker (plots are dispatched by wait()).
+
+        :param frame_key: key of the published dataset
+        :param rows: rows of the slice (check get_slice_rows)
+        :param plot_fun: plotting function (module-level)
+        :param plot_args: plot_fun arguments except dataset (shared objects are sent by reference)
+        :param slice_key: if set, the plot is recorded into PlotController.shard_manifest under this key
+        :param sample_per_stratum: if set, sample the slice in the worker
+        :param strata: columns to sample by
+        :param job_kind: if set, the drawing time is predicted from and recorded into
+                         PlotController.render_timings under this kind (check RenderTimings.job_kind)
+        """
+        shared_names = {id(value): name for name, value in self.shared_objects.items()}
+        plot_args = {key: SharedObjectRef(shared_names[id(value)]) if id(value) in shared_names else value
+                     for key, value in plot_args.items()}
+
+        rows_count = rows.stop - rows.start if isinstance(rows, slice) else len(rows)
+        self.pending.append({'slice_key': slice_key, 'job_kind': job_kind, 'rows_count': rows_count,
+                             'args': (render_slice, frame_key, rows, plot_fun, plot_args,
+                                      sample_per_stratum, strata if strata is not None else list())})
+
+    def schedule(self) -> Tuple[List[int], Optional[float]]:
+        """
+        Order the queued plots longest (predicted) first, so that long plots don't end up alone at the end.
+        Drawing times are predicted by PlotController.render_timings. Plots of job kinds never timed
+        go first (their cost is unknown), by slice size.
+
+        :return: (dispatch order of the queued plots, predicted makespan, None if a plot can't be predicted)
+        """
+        from plot.plot_controller import PlotController
+
+        render_timings = PlotController.render_timings
+        predictions = [render_timings.predict(kind=job['job_kind'], rows=job['rows_count'])
+                       if render_timings is not None and job['job_kind'] is not None else None
+                       for job in self.pending]
+
+        order = sorted(range(len(self.pending)),
+                       key=lambda i: (predictions[i] is None, predictions[i] or 0.0, self.pending[i]['rows_count']),
+                       reverse=True)
+
+        if any(prediction is None for prediction in predictions):
+            return order, None
+        return order, RenderTimings.makespan(costs=[predictions[i] for i in order], workers=self.workers)
+
+    def wait(self):
+        """
+        Dispatch the queued plots (longest first, check schedule), wait for them, and record them into the shard
+        manifest, contact sheet, and render timings of this process (in queued order).
+        Worker errors are raised here.
+        """
+        from plot.plot_controller import PlotController
+
+        if len(self.pending) == 0:
+            return
+
+        order, predicted_makespan = self.schedule()
+        start_time = time.perf_counter()
+        futures = [None] * len(self.pending)
+        for i in order:
+            futures[i] = self.executor.submit(*self.pending[i]['args'])
+
+        for job, future in zip(self.pending, futures):
+            outputs, contact_entries, seconds = future.result()
+            if job['slice_key'] is not None and PlotController.shard_manifest is not None:
+                PlotController.shard_manifest.add_job(slice_key=job['slice_key'], outputs=outputs, seconds=seconds)
+            if PlotController.contact_sheet is not None:
+                PlotController.contact_sheet.entries.extend(contact_entries)
+            if job['job_kind'] is not None and PlotController.render_timings is not None:
+                PlotController.render_timings.add(kind=job['job_kind'], rows=job['rows_count'], seconds=seconds)
+
+        makespan = time.perf_counter() - start_time
+        predicted = f"predicted {predicted_makespan:.2f}s" if predicted_makespan is not None \
+            else "not predicted: no timings of some plots"
+        print(f"Drew {len(self.pending)} plots on {self.workers} workers in {makespan:.2f}s ({predicted}).")
+        self.pending = list()
+
+    def close(self):
+        """
+        Wait for every plot, stop the workers, and free the shared datasets.
+        """
+        try:
+            self.wait()
+        finally:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            for frame in self.frames.values():
+                frame.close()
@@ -0,0 +1,77 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import io
+import os
+import time
+import tarfile
+import zipfile
+from sink.output_sink import OutputSink
+
+
+class ArchiveSink(OutputSink):
+    """
+    Stream plots into a single zip or tar archive.
+    """
+
+    # archive extension -> tarfile streaming mode
+    tar_modes = {
+        '.tar': 'w|',
+        '.tar.gz': 'w|gz',
+        '.tgz': 'w|gz',
+        '.tar.bz2': 'w|bz2',
+        '.tar.xz': 'w|xz',
+    }
+
+    def __init__(self, archive_path: str, top_directory: str = '../../graph',
+                 background: bool = False, max_pending: int = 8):
+        """
+        Initialize ArchiveSink instance.
+
+        :param archive_path: path of the archive to create (.zip, .tar, .tar.gz, .tgz, .tar.bz2 or .tar.xz)
+        :param top_directory: top directory path of the graph tree (archive member names are relative to this)
+        :param background: if True, encode and write figures in a background writer thread.
+        :param max_pending: maximum number of figures waiting for the background writer
+        """
+        super().__init__(top_directory=top_directory, background=background, max_pending=max_pending)
+        self.archive_path = archive_path
+
+        archive_dir = os.path.dirname(archive_path)
+        if archive_dir != '' and not os.path.exists(archive_dir):
+            os.makedirs(name=archive_dir)
+
+        # create archive
+        self.zip_file = None
+        self.tar_file = None
+        if archive_path.endswith('.zip'):
+            # plots are already compressed: store them as-is
+            self.zip_file = zipfile.ZipFile(archive_path, mode='w', compression=zipfile.ZIP_STORED)
+        else:
+            tar_mode = None
+            for extension, mode in self.tar_modes.items():
+                if archive_path.endswith(extension):
+                    tar_mode = mode
+            assert tar_mode is not None, f"Archive type of {archive_path} not supported."
+            self.tar_file = tarfile.open(archive_path, mode=tar_mode)
+
+    def _write(self, relative_path: str, data: bytes):
+        if self.zip_file is not None:
+            self.zip_file.writestr(relative_path, data)
+        else:
+            tar_info = tarfile.TarInfo(name=relative_path)
+            tar_info.size = len(data)
+            tar_info.mtime = int(time.time())
+            self.tar_file.addfile(tar_info, io.BytesIO(data))
+
+    def close(self):
+        super().close()
+
+        with self.lock:
+            if self.zip_file is not None:
+                self.zip_file.close()
+                self.zip_file = None
+            if self.tar_file is not None:
+                self.tar_file.close()
+                self.tar_file = None
@@ -0,0 +1,44 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+from sink.output_sink import OutputSink
+from helper.directory_manager import DirectoryManager
+
+
+class DirectorySink(OutputSink):
+    """
+    Write plots as plain files in the directory tree.
+    """
+
+    def __init__(self, top_directory: str = '../../graph', background: bool = False, max_pending: int = 8):
+        """
+        Initialize DirectorySink instance.
+
+        :param top_directory: top directory path
+        :param background: if True, encode and write figures in a background writer thread.
+        :param max_pending: maximum number of figures waiting for the background writer
+        """
+        super().__init__(top_directory=top_directory, background=background, max_pending=max_pending)
+        self.directory_manager = DirectoryManager(top_directory=top_directory)
+
+    def create_top_directory(self, reset_if_exist: bool = False):
+        self.directory_manager.create_top_directory(reset_if_exist=reset_if_exist)
+
+    def create_subdirectory(self, path: str, reset_if_exist: bool = False):
+        self.directory_manager.create_subdirectory(path=path, reset_if_exist=reset_if_exist)
+
+    def directory_exists(self, path: str) -> bool:
+        return os.path.exists(path)
+
+    def open(self, path: str):
+        # write straight into the file (no need to buffer in memory)
+        return open(path, mode='wb')
+
+    def _write(self, relative_path: str, data: bytes):
+        file_path = os.path.join(self.top_directory, relative_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, mode='wb') as file:
+            file.write(data)
@@ -0,0 +1,40 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+from typing import List
+from sink.output_sink import OutputSink
+
+
+class MemorySink(OutputSink):
+    """
+    Keep plots in memory (e.g., for tests or to serve them without touching the disk).
+    """
+
+    def __init__(self, top_directory: str = '../../graph', background: bool = False, max_pending: int = 8):
+        """
+        Initialize MemorySink instance.
+
+        :param top_directory: top directory path of the graph tree
+        :param background: if True, encode figures in a background writer thread.
+        :param max_pending: maximum number of figures waiting for the background writer
+        """
+        super().__init__(top_directory=top_directory, background=background, max_pending=max_pending)
+        self.files = dict()  # relative path -> bytes
+
+    def paths(self) -> List[str]:
+        """
+        :return: relative paths of the written files
+        """
+        return list(self.files.keys())
+
+    def get(self, relative_path: str) -> bytes:
+        """
+        :param relative_path: path relative to top_directory
+        :return: content of the file
+        """
+        return self.files[relative_path]
+
+    def _write(self, relative_path: str, data: bytes):
+        self.files[relative_path] = data
@@ -0,0 +1,163 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import io
+import os
+import threading
+from typing import Callable, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class OutputSink:
+    """
+    Base class of plot output destinations.
+    Paths given to a sink are paths inside the graph tree (e.g., '../graph/CommsTime_Topology/...'),
+    sinks store them relative to top_directory.
+    """
+
+    def __init__(self, top_directory: str = '../../graph', background: bool = False, max_pending: int = 8):
+        """
+        Initialize OutputSink instance.
+
+        :param top_directory: top directory path of the graph tree
+        :param background: if True, encode and write figures in a background writer thread,
+                           so that encoding overlaps with drawing the next figure.
+        :param max_pending: maximum number of figures waiting for the background writer
+        """
+        self.top_directory = top_directory
+        self.background = background
+        self.lock = threading.Lock()
+
+        self.executor = None
+        self.pending_slots = None
+        self.pending: List[Future] = list()
+        if background:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='output-sink')
+            self.pending_slots = threading.BoundedSemaphore(value=max_pending)
+
+    def relative_path(self, path: str) -> str:
+        """
+        :param path: path inside the graph tree
+        :return: path relative to top_directory (with '/' separators)
+        """
+        return os.path.relpath(path, self.top_directory).replace(os.sep, '/')
+
+    def create_top_directory(self, reset_if_exist: bool = False):
+        """
+        Create top directory. No-op unless the sink is backed by a directory.
+
+        :param reset_if_exist: if True, reset the entire directory if one already exists.
+        """
+        pass
+
+    def create_subdirectory(self, path: str, reset_if_exist: bool = False):
+        """
+        Create subdirectory inside the top directory. No-op unless the sink is backed by a directory.
+
+        :param path: path to the subdirectory
+        :param reset_if_exist: if True, reset the subdirectory if one already exists.
+        """
+        pass
+
+    def directory_exists(self, path: str) -> bool:
+        """
+        :param path: directory path inside the graph tree
+        :return: True if files can be written into the directory
+        """
+        return True
+
+    def submit(self, job: Callable[[], None]):
+        """
+        Run job in the background writer thread (in order), or right away if not background.
+
+        :param job: callable to run
+        """
+        if self.executor is None:
+            job()
+            return
+
+        # bound the number of pending figures (each one holds its figure in memory)
+        self.pending_slots.acquire()
+        future = self.executor.submit(job)
+        future.add_done_callback(lambda _: self.pending_slots.release())
+        self.pending.append(future)
+
+    def save_figure(self, fig, path: str, format: Optional[str] = None, dpi: Optional[float] = None):
+        """
+        Encode and write a figure.
+        The figure must not be modified after this call.
+
+        :param fig: matplotlib figure to save
+        :param path: path inside the graph tree
+        :param format: file format (default: path extension)
+        :param dpi: resolution (default: matplotlib savefig.dpi)
+        """
+        def job():
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=format or os.path.splitext(path)[1][1:], dpi=dpi or 'figure')
+            self.write_bytes(path=path, data=buffer.getvalue())
+
+        self.submit(job)
+
+    def write_bytes(self, path: str, data: bytes):
+        """
+        Write a file.
+
+        :param path: path inside the graph tree
+        :param data: file content
+        """
+        with self.lock:
+            self._write(relative_path=self.relative_path(path), data=data)
+
+    def open(self, path: str):
+        """
+        Open a file for writing. The file is written when closed.
+
+        :param path: path inside the graph tree
+        :return: binary file-like object
+        """
+        return _SinkBuffer(sink=self, path=path)
+
+    def flush(self):
+        """
+        Wait until every pending write finishes. Raises the first error raised in the writer thread.
+        """
+        pending, self.pending = self.pending, list()
+        for future in pending:
+            future.result()
+
+    def close(self):
+        """
+        Flush pending writes and release the sink.
+        """
+        self.flush()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def _write(self, relative_path: str, data: bytes):
+        """
+        Backend-specific write. Called with self.lock held.
+
+        :param relative_path: path relative to top_directory
+        :param data: file content
+        """
+        raise NotImplementedError
+
+
+class _SinkBuffer(io.BytesIO):
+    """
+    In-memory file that is written into its sink on close.
+    """
+
+    def __init__(self, sink: OutputSink, path: str):
+        super().__init__()
+        self.sink = sink
+        self.path = path
+
+    def close(self):
+        if not self.closed:
+            self.sink.write_bytes(path=self.path, data=self.getvalue())
+        super().close()
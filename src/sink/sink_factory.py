@@ -0,0 +1,26 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+from typing import Optional
+from sink.output_sink import OutputSink
+from sink.directory_sink import DirectorySink
+from sink.archive_sink import ArchiveSink
+
+
+def create_output_sink(top_directory: str, archive_path: Optional[str] = None,
+                       background: bool = False) -> OutputSink:
+    """
+    Create an OutputSink.
+
+    :param top_directory: top directory path of the graph tree
+    :param archive_path: if set, write every plot into this archive (.zip or .tar[.gz|.bz2|.xz]).
+                         if not, write plots into the directory tree.
+    :param background: if True, encode and write figures in a background writer thread.
+    :return: created OutputSink
+    """
+    if archive_path is not None:
+        return ArchiveSink(archive_path=archive_path, top_directory=top_directory, background=background)
+
+    return DirectorySink(top_directory=top_directory, background=background)
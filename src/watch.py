@@ -0,0 +1,122 @@
+"""
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+"""
+
+import os
+import argparse
+import draw
+from data.dataset_type import DatasetType
+from helper.argument_helper import create_dataset_filter, get_system_dir, get_topology_dir, create_file_index
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """
+    Add watch.py arguments to parser.
+
+    :param parser: parser to add arguments to
+    """
+    draw.add_arguments(parser)
+    parser.add_argument('--debounce', type=float, default=2.0,
+                        help='seconds without new changes before re-drawing (default: 2)')
+    parser.add_argument('--poll-interval', type=float, default=5.0,
+                        help='polling interval in seconds, if inotify is not available (default: 5)')
+
+
+def watch(args: argparse.Namespace):
+    """
+    Draw every plot, then keep the datasets in memory and re-draw the plots
+    whose slices changed whenever result csv files (or inputs) change.
+
+    :param args: parsed arguments (check add_arguments)
+    """
+    import pandas as pd
+    from data.csv_reader import CsvReader
+    from data.result_source import ResultSource
+    from data.dataset_loader import DatasetLoader
+    from helper.file_watcher import FileWatcher
+
+    assert not args.bundle, "Bundles can't be partially re-drawn: --bundle is not supported in watch mode."
+    assert not args.stream, "Watch mode keeps every dataset in memory: --stream is not supported in watch mode."
+
+    dataset_types = list(DatasetType)
+    watcher = FileWatcher(dirs=[args.result_dir, args.inputs_dir],
+                          debounce=args.debounce, poll_interval=args.poll_interval)
+
+    def create_loader():
+        return DatasetLoader(csv_dir=args.result_dir,
+                             system_dir=get_system_dir(args),
+                             topology_dir=get_topology_dir(args),
+                             dataset_filter=create_dataset_filter(args),
+                             file_index=create_file_index(args),
+                             columns=draw.render_columns(args))
+
+    # resident datasets, kept per csv file: DatasetType -> {path -> rows}
+    dataset_loader = create_loader()
+    partitions = dict()
+    for dataset_type in dataset_types:
+        partitions[dataset_type] = {path: dataset_loader.load_dataset(dataset_type=dataset_type, file_paths=[path])
+                                    for path in dataset_loader.csv_reader.find_files(dataset_type)}
+
+    def merged_datasets():
+        return {dataset_type: pd.concat(list(partitions[dataset_type].values()) or [pd.DataFrame()],
+                                        ignore_index=True)
+                for dataset_type in dataset_types}
+
+    # initial drawing
+    draw.render(args=args, datasets=merged_datasets())
+
+    while True:
+        print("Watching for changes...")
+        changed_paths = watcher.wait()
+
+        # inputs changed: every row may be affected, reload everything
+        inputs_dir = os.path.abspath(args.inputs_dir)
+        if any(os.path.abspath(path).startswith(inputs_dir + os.sep) for path in changed_paths):
+            print("Inputs changed: reloading every dataset.")
+            dataset_loader = create_loader()
+            for dataset_type in dataset_types:
+                partitions[dataset_type] = {
+                    path: dataset_loader.load_dataset(dataset_type=dataset_type, file_paths=[path])
+                    for path in dataset_loader.csv_reader.find_files(dataset_type)}
+            draw.render(args=args, datasets=merged_datasets())
+            continue
+
+        # reload changed csv files only: changed rows are their old and new rows
+        changed_rows = dict()
+        for dataset_type in dataset_types:
+            filename = CsvReader.filename_to_load(dataset_type)
+            rows = list()
+            for path in sorted(changed_paths):
+                if ResultSource.logical_name(os.path.basename(path)) != filename:
+                    continue
+
+                old_rows = partitions[dataset_type].pop(path, None)
+                if old_rows is not None:
+                    rows.append(old_rows)
+                if os.path.exists(path):
+                    partitions[dataset_type][path] = dataset_loader.load_dataset(dataset_type=dataset_type,
+                                                                                 file_paths=[path])
+                    rows.append(partitions[dataset_type][path])
+
+            rows = [row for row in rows if len(row) > 0]
+            if len(rows) > 0:
+                changed_rows[dataset_type] = pd.concat(rows, ignore_index=True)
+
+        if len(changed_rows) == 0:
+            continue
+
+        print(f"{len(changed_paths)} files changed: re-drawing changed plots.")
+        draw.render(args=args, datasets=merged_datasets(), changed_rows=changed_rows)
+
+
+def main():
+    # parse arguments
+    parser = argparse.ArgumentParser(description='Re-draw ASTRA-sim result plots as result files change.')
+    add_arguments(parser)
+
+    watch(args=parser.parse_args())
+
+
+if __name__ == '__main__':
+    main()